@@ -1,6 +1,9 @@
 """CDK environment configuration (AWS-only)."""
 
+import copy
 import os
+from functools import lru_cache
+from pathlib import Path
 
 REQUIRED_KEYS = (
     "AWS_DEFAULT_REGION",
@@ -14,6 +17,16 @@ REQUIRED_KEYS = (
     "DATAUSA_BASE_URL",
 )
 
+# Rarely-changing settings baked into the Lambda asset instead of set as
+# function env vars (see `write_baked_lambda_config`).
+BAKED_LAMBDA_KEYS = {
+    "BLS_SERIES": "bls_series",
+    "DATAUSA_DATASETS": "datausa_datasets",
+    "DATAUSA_BASE_URL": "datausa_base_url",
+}
+
+BAKED_CONFIG_RELPATH = Path("src") / "lambdas" / "_baked_config.py"
+
 
 def _required(name: str) -> str:
     value = os.environ.get(name, "").strip()
@@ -42,11 +55,20 @@ def _required_removal_policy() -> str:
 
 def _get_csv(name: str) -> list[str]:
     raw = os.environ.get(name, "")
-    return [item.strip() for item in raw.split(",") if item.strip()]
+    return [value for item in raw.split(",") if (value := item.strip())]
 
 
 def get_env_config() -> dict:
-    """Get environment-specific configuration."""
+    """Get environment-specific configuration.
+
+    The app and every stack call this during `cdk synth`; the environment is
+    parsed and validated once and each caller gets its own copy.
+    """
+    return copy.deepcopy(_load_env_config())
+
+
+@lru_cache(maxsize=1)
+def _load_env_config() -> dict:
     for key in REQUIRED_KEYS:
         _required(key)
 
@@ -70,3 +92,25 @@ def get_env_config() -> dict:
         "site_aliases": site_aliases,
         "site_cert_arn": os.environ.get("FOMC_SITE_CERT_ARN", "").strip(),
     }
+
+
+def write_baked_lambda_config(config: dict, project_root: str | Path) -> Path:
+    """Write `src/lambdas/_baked_config.py` so it ships inside the Lambda asset.
+
+    Must run before `Code.from_asset` fingerprints the project root. The
+    handlers load it with `src.config.apply_baked_config()`.
+    """
+    baked = {env_key: str(config[config_key]) for env_key, config_key in BAKED_LAMBDA_KEYS.items()}
+    lines = [
+        '"""Generated by `cdk synth` (infra.config.write_baked_lambda_config); do not edit."""',
+        "",
+        "BAKED_ENV = {",
+        *(f"    {key!r}: {value!r}," for key, value in baked.items()),
+        "}",
+        "",
+    ]
+    content = "\n".join(lines)
+    path = Path(project_root) / BAKED_CONFIG_RELPATH
+    if not path.exists() or path.read_text(encoding="utf-8") != content:
+        path.write_text(content, encoding="utf-8")
+    return path
@@ -0,0 +1,47 @@
+"""Packaging settings shared by the Lambda code assets."""
+
+from pathlib import Path
+
+# Repository root (the asset directory); resolved once per synth.
+PROJECT_ROOT = str(Path(__file__).resolve().parents[1])
+
+# Both functions bundle the project root (handlers import `src.*`), but only
+# `src/` is needed at runtime. Everything else just inflates the zip that is
+# fetched on cold start. boto3/botocore come from the Lambda runtime.
+# Both stacks pass identical options, so CDK's asset staging cache hashes and
+# copies the tree only once per synth and both functions share one asset.
+LAMBDA_ASSET_EXCLUDES = (
+    ".venv/*",
+    ".git/*",
+    ".github/*",
+    ".idea/*",
+    ".run/*",
+    ".tmp_home/*",
+    ".pytest_cache/*",
+    ".mypy_cache/*",
+    ".ruff_cache/*",
+    ".env*",
+    "cdk.out/*",
+    "infra/*",
+    "notebooks/*",
+    "tests/*",
+    "docs/*",
+    "site/*",
+    "localstack/*",
+    "tools/*",
+    "volume/*",
+    "boto3/*",
+    "botocore/*",
+    "*.dist-info/*",
+    "__pycache__/*",
+    "**/__pycache__",
+    "*.pyc",
+    "*.md",
+    "*.ipynb",
+    "app.py",
+    "main.py",
+    "cdk.json",
+    "docker-compose.yml",
+    "pyproject.toml",
+    "uv.lock",
+)
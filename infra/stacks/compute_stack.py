@@ -1,7 +1,6 @@
 """Lambda compute stack for FOMC data pipeline."""
 
 import os
-from pathlib import Path
 
 from aws_cdk import Duration, Stack
 from aws_cdk import aws_events as events
@@ -10,7 +9,8 @@ from aws_cdk import aws_lambda as _lambda
 from aws_cdk import triggers
 from constructs import Construct
 
-from infra.config import get_env_config
+from infra.config import get_env_config, write_baked_lambda_config
+from infra.lambda_asset import LAMBDA_ASSET_EXCLUDES, PROJECT_ROOT
 from infra.stacks.storage_stack import FomcStorageStack
 
 
@@ -25,8 +25,9 @@ class FomcComputeStack(Stack):
         super().__init__(scope, construct_id, **kwargs)
 
         config = get_env_config()
-        project_root = str(Path(__file__).resolve().parent.parent.parent)
         deployment_id = os.environ.get("FOMC_DEPLOYMENT_ID", "")
+        # Static settings ship in the asset; env vars are kept to stack outputs.
+        write_baked_lambda_config(config, PROJECT_ROOT)
 
         self.data_fetcher = _lambda.Function(
             self,
@@ -35,36 +36,30 @@ class FomcComputeStack(Stack):
             runtime=_lambda.Runtime.PYTHON_3_12,
             handler="src.lambdas.data_fetcher.handler.handler",
             code=_lambda.Code.from_asset(
-                project_root,
-                exclude=[
-                    ".venv/*",
-                    ".git/*",
-                    ".idea/*",
-                    ".run/*",
-                    "cdk.out/*",
-                    "notebooks/*",
-                    "tests/*",
-                    "docs/*",
-                    "site/*",
-                    "localstack/*",
-                    "tools/*",
-                    "volume/*",
-                    "__pycache__/*",
-                    "*.pyc",
-                ],
+                PROJECT_ROOT,
+                exclude=list(LAMBDA_ASSET_EXCLUDES),
             ),
             timeout=Duration.minutes(5),
             memory_size=256,
+            # Snapshot the initialized runtime (imports, boto3 client) so cold
+            # starts restore from it; only applies to published versions.
+            snap_start=_lambda.SnapStartConf.ON_PUBLISHED_VERSIONS,
             environment={
                 "BLS_BUCKET": storage.bls_raw_bucket.bucket_name,
                 "DATAUSA_BUCKET": storage.datausa_raw_bucket.bucket_name,
-                "BLS_SERIES": config["bls_series"],
-                "DATAUSA_DATASETS": config["datausa_datasets"],
-                "DATAUSA_BASE_URL": config["datausa_base_url"],
                 "FOMC_DEPLOYMENT_ID": deployment_id,
             },
         )
 
+        # Publish a version per deploy and invoke it through an alias so
+        # scheduled runs get the SnapStart snapshot instead of $LATEST.
+        self.data_fetcher_alias = _lambda.Alias(
+            self,
+            "DataFetcherLiveAlias",
+            alias_name="live",
+            version=self.data_fetcher.current_version,
+        )
+
         # Grant S3 read/write permissions
         storage.bls_raw_bucket.grant_read_write(self.data_fetcher)
         storage.datausa_raw_bucket.grant_read_write(self.data_fetcher)
@@ -75,7 +70,20 @@ class FomcComputeStack(Stack):
             "FetchScheduleRule",
             schedule=events.Schedule.rate(Duration.hours(config["fetch_interval_hours"])),
         )
-        rule.add_target(targets.LambdaFunction(self.data_fetcher))
+        rule.add_target(targets.LambdaFunction(self.data_fetcher_alias))
+
+        # Keep the live alias warm between scheduled runs; the handler no-ops.
+        warmer_rule = events.Rule(
+            self,
+            "DataFetcherWarmer",
+            schedule=events.Schedule.rate(Duration.minutes(5)),
+        )
+        warmer_rule.add_target(
+            targets.LambdaFunction(
+                self.data_fetcher_alias,
+                event=events.RuleTargetInput.from_object({"warmer": True}),
+            )
+        )
 
         # Trigger once on each deployment (fire-and-forget).
         triggers.Trigger(
@@ -1,7 +1,6 @@
 """Analytics Lambda stack, consuming from the SQS queue created in the storage stack."""
 
 import os
-from pathlib import Path
 
 from aws_cdk import Duration, Stack
 from aws_cdk import aws_events as events
@@ -11,7 +10,8 @@ from aws_cdk import aws_lambda_event_sources as lambda_events
 from aws_cdk import triggers
 from constructs import Construct
 
-from infra.config import get_env_config
+from infra.config import get_env_config, write_baked_lambda_config
+from infra.lambda_asset import LAMBDA_ASSET_EXCLUDES, PROJECT_ROOT
 from infra.stacks.storage_stack import FomcStorageStack
 
 
@@ -26,8 +26,9 @@ class FomcMessagingStack(Stack):
         super().__init__(scope, construct_id, **kwargs)
 
         config = get_env_config()
-        project_root = str(Path(__file__).resolve().parent.parent.parent)
         deployment_id = os.environ.get("FOMC_DEPLOYMENT_ID", "")
+        # Static settings ship in the asset; env vars are kept to stack outputs.
+        write_baked_lambda_config(config, PROJECT_ROOT)
 
         # Analytics processor Lambda
         self.analytics_processor = _lambda.Function(
@@ -37,26 +38,14 @@ class FomcMessagingStack(Stack):
             runtime=_lambda.Runtime.PYTHON_3_12,
             handler="src.lambdas.analytics_processor.handler.handler",
             code=_lambda.Code.from_asset(
-                project_root,
-                exclude=[
-                    ".venv/*",
-                    ".git/*",
-                    ".idea/*",
-                    ".run/*",
-                    "cdk.out/*",
-                    "notebooks/*",
-                    "tests/*",
-                    "docs/*",
-                    "site/*",
-                    "localstack/*",
-                    "tools/*",
-                    "volume/*",
-                    "__pycache__/*",
-                    "*.pyc",
-                ],
+                PROJECT_ROOT,
+                exclude=list(LAMBDA_ASSET_EXCLUDES),
             ),
             timeout=Duration.minutes(5),
             memory_size=256,
+            # Snapshot the initialized runtime (imports, boto3 client) so cold
+            # starts restore from it; only applies to published versions.
+            snap_start=_lambda.SnapStartConf.ON_PUBLISHED_VERSIONS,
             environment={
                 "BLS_BUCKET": storage.bls_raw_bucket.bucket_name,
                 "DATAUSA_BUCKET": storage.datausa_raw_bucket.bucket_name,
@@ -64,9 +53,23 @@ class FomcMessagingStack(Stack):
             },
         )
 
-        # SQS triggers Lambda
-        self.analytics_processor.add_event_source(
-            lambda_events.SqsEventSource(storage.analytics_queue, batch_size=1)
+        # Publish a version per deploy and invoke it through an alias so
+        # queue and scheduled runs get the SnapStart snapshot instead of $LATEST.
+        self.analytics_processor_alias = _lambda.Alias(
+            self,
+            "AnalyticsProcessorLiveAlias",
+            alias_name="live",
+            version=self.analytics_processor.current_version,
+        )
+
+        # SQS triggers Lambda in batches; failed records are retried individually.
+        self.analytics_processor_alias.add_event_source(
+            lambda_events.SqsEventSource(
+                storage.analytics_queue,
+                batch_size=10,
+                max_batching_window=Duration.seconds(5),
+                report_batch_item_failures=True,
+            )
         )
 
         # Also run analytics on the configured interval.
@@ -75,7 +78,20 @@ class FomcMessagingStack(Stack):
             "AnalyticsScheduleRule",
             schedule=events.Schedule.rate(Duration.hours(config["fetch_interval_hours"])),
         )
-        analytics_rule.add_target(targets.LambdaFunction(self.analytics_processor))
+        analytics_rule.add_target(targets.LambdaFunction(self.analytics_processor_alias))
+
+        # Keep the live alias warm between queue/scheduled runs; the handler no-ops.
+        warmer_rule = events.Rule(
+            self,
+            "AnalyticsWarmer",
+            schedule=events.Schedule.rate(Duration.minutes(5)),
+        )
+        warmer_rule.add_target(
+            targets.LambdaFunction(
+                self.analytics_processor_alias,
+                event=events.RuleTargetInput.from_object({"warmer": True}),
+            )
+        )
 
         # Grant S3 read permissions
         storage.bls_raw_bucket.grant_read(self.analytics_processor)
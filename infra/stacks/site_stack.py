@@ -1,6 +1,11 @@
 """Static site stack for publishing the dashboard via CloudFront + S3."""
 
-from aws_cdk import CfnOutput, Duration, RemovalPolicy, Stack
+import hashlib
+import shutil
+import tempfile
+from pathlib import Path
+
+from aws_cdk import AssetHashType, CfnOutput, Duration, RemovalPolicy, Size, Stack
 from aws_cdk import aws_certificatemanager as acm
 from aws_cdk import aws_cloudfront as cloudfront
 from aws_cdk import aws_cloudfront_origins as origins
@@ -10,6 +15,37 @@ from constructs import Construct
 
 from infra.config import get_env_config
 
+SITE_DIR = "site"
+
+
+def _site_content_hash(site_dir: str = SITE_DIR) -> str:
+    """Return a short digest of every file (path + bytes) under `site_dir`."""
+    root = Path(site_dir)
+    digest = hashlib.sha256()
+    for path in sorted(p for p in root.rglob("*") if p.is_file()):
+        digest.update(path.relative_to(root).as_posix().encode())
+        digest.update(b"\0")
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def _stage_site_version(site_hash: str, site_dir: str = SITE_DIR) -> str:
+    """Copy `site_dir` to `<tmp>/fomc-site-<hash>/<hash>/` and return the outer directory.
+
+    Deploying the outer directory under the bucket's `v/` prefix lands the
+    site at `v/<hash>/`, and gives a pruning deployment of the same source
+    every older `v/<hash>/` to delete.
+    """
+    root = Path(tempfile.gettempdir()) / f"fomc-site-{site_hash}"
+    target = root / site_hash
+    if not target.is_dir():
+        root.mkdir(parents=True, exist_ok=True)
+        # Copy aside and rename so an interrupted synth never leaves a partial tree.
+        partial = Path(tempfile.mkdtemp(dir=root))
+        shutil.copytree(site_dir, partial, dirs_exist_ok=True)
+        partial.rename(target)
+    return str(root)
+
 
 class FomcSiteStack(Stack):
     def __init__(self, scope: Construct, construct_id: str, **kwargs) -> None:
@@ -42,15 +78,46 @@ class FomcSiteStack(Stack):
             enforce_ssl=True,
         )
 
+        # Each build of the site lives under its own content-addressed prefix and
+        # CloudFront's origin path points at it, so a deploy swaps versions by
+        # updating the distribution rather than issuing an invalidation. Objects
+        # already cached at the edge are still served until their TTL expires
+        # (see the cache policy below); old prefixes are pruned after the switch.
+        site_hash = _site_content_hash()
+        site_version_prefix = f"v/{site_hash}"
+
         # Keep the bucket private; allow reads only via CloudFront.
         origin_access_identity = cloudfront.OriginAccessIdentity(self, "SiteOAI")
         bucket.grant_read(origin_access_identity)
 
+        site_origin = origins.S3Origin(
+            bucket,
+            origin_access_identity=origin_access_identity,
+            origin_path=f"/{site_version_prefix}",
+        )
+
+        # CloudFront keeps cached objects when the origin path moves to a new
+        # version, so every file uses a short edge TTL; that TTL bounds how
+        # long a deploy takes to show up. Nothing on the site is fingerprinted
+        # (diagrams/*.svg included), so no path can safely get a long TTL.
+        # Brotli/gzip are part of the cache key so compressed variants are
+        # cached separately.
+        page_cache_policy = cloudfront.CachePolicy(
+            self,
+            "SitePageCachePolicy",
+            default_ttl=Duration.minutes(5),
+            min_ttl=Duration.seconds(0),
+            max_ttl=Duration.days(1),
+            enable_accept_encoding_brotli=True,
+            enable_accept_encoding_gzip=True,
+        )
+
         distribution_args: dict = {
             "default_root_object": "index.html",
             "default_behavior": cloudfront.BehaviorOptions(
-                origin=origins.S3Origin(bucket, origin_access_identity=origin_access_identity),
+                origin=site_origin,
                 viewer_protocol_policy=cloudfront.ViewerProtocolPolicy.REDIRECT_TO_HTTPS,
+                cache_policy=page_cache_policy,
                 compress=True,
             ),
             "error_responses": [
@@ -84,15 +151,34 @@ class FomcSiteStack(Stack):
             **distribution_args,
         )
 
-        s3deploy.BucketDeployment(
-            self,
-            "DeploySite",
-            sources=[s3deploy.Source.asset("site")],
-            destination_bucket=bucket,
-            distribution=distribution,
-            distribution_paths=["/*"],
-            prune=True,
+        # Reuse the digest above as the asset hash so CDK does not fingerprint the
+        # staged copy a second time (it still copies that tree into cdk.out).
+        # The "v/" marks the versioned layout so an older flat asset is never reused.
+        site_source = s3deploy.Source.asset(
+            _stage_site_version(site_hash),
+            asset_hash=f"v/{site_hash}",
+            asset_hash_type=AssetHashType.CUSTOM,
+        )
+        # The deployment Lambda runs `aws s3 sync`; 1769 MB is one full vCPU,
+        # and extra /tmp keeps the unzipped site off the 512 MB default.
+        deployment_args: dict = {
+            "sources": [site_source],
+            "destination_bucket": bucket,
+            "destination_key_prefix": "v",
+            "memory_limit": 1769,
+            "ephemeral_storage_size": Size.mebibytes(2048),
+        }
+
+        # Upload the new version next to the live one...
+        deployment = s3deploy.BucketDeployment(self, "DeploySite", prune=False, **deployment_args)
+        # ...only repoint the origin once it is fully uploaded...
+        distribution.node.add_dependency(deployment)
+        # ...then sync `v/` again with pruning, which deletes every other
+        # version now that CloudFront no longer reads from it.
+        prune_old_versions = s3deploy.BucketDeployment(
+            self, "PruneOldSiteVersions", prune=True, **deployment_args
         )
+        prune_old_versions.node.add_dependency(distribution)
 
         CfnOutput(self, "SiteBucketName", value=bucket.bucket_name)
         CfnOutput(self, "SiteCloudFrontDomain", value=distribution.distribution_domain_name)
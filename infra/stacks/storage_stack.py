@@ -14,6 +14,17 @@ from constructs import Construct
 from infra.config import get_env_config
 
 
+def _make_bucket(scope: Construct, name: str, removal: RemovalPolicy) -> s3.Bucket:
+    """Create a data bucket whose construct id matches its bucket name."""
+    return s3.Bucket(
+        scope,
+        name,
+        bucket_name=name,
+        removal_policy=removal,
+        auto_delete_objects=removal == RemovalPolicy.DESTROY,
+    )
+
+
 class FomcStorageStack(Stack):
     def __init__(self, scope: Construct, construct_id: str, **kwargs) -> None:
         super().__init__(scope, construct_id, **kwargs)
@@ -32,16 +43,7 @@ class FomcStorageStack(Stack):
             f"{prefix}-datausa-processed",
         ]
 
-        self.buckets = {}
-        for name in bucket_names:
-            bucket = s3.Bucket(
-                self,
-                name,
-                bucket_name=name,
-                removal_policy=removal,
-                auto_delete_objects=removal == RemovalPolicy.DESTROY,
-            )
-            self.buckets[name] = bucket
+        self.buckets = {name: _make_bucket(self, name, removal) for name in bucket_names}
 
         self.bls_raw_bucket = self.buckets[f"{prefix}-bls-raw"]
         self.datausa_raw_bucket = self.buckets[f"{prefix}-datausa-raw"]
@@ -8,12 +8,15 @@ static site can render client-side.
 
 from __future__ import annotations
 
-import json
 import os
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
 from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Literal
+from typing import Any, Literal, Sequence
+
+import numpy as np
 
 from src.config import (
     get_analytics_dlq_name,
@@ -22,12 +25,13 @@ from src.config import (
     get_bucket_prefix,
     get_datausa_bucket,
 )
+from src.helpers import json_codec
 from src.helpers.aws_client import get_client
 
 CloudWatchStat = Literal["Average", "Sum", "Minimum", "Maximum", "SampleCount"]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MetricDef:
     namespace: str
     metric_name: str
@@ -36,13 +40,25 @@ class MetricDef:
     label: str
 
 
+_UTC = timezone.utc
+
+# GetMetricData accepts at most 500 queries per request.
+_MAX_METRIC_DATA_QUERIES = 500
+
 DEFAULT_LAMBDA_FUNCTIONS = ["fomc-data-fetcher", "fomc-analytics-processor"]
 
+# Sidecar written next to the observability export for the daily S3 storage series.
+S3_STORAGE_FILENAME = "s3_storage.json"
+
 
 def _default_sqs_queues() -> list[str]:
     return [get_analytics_queue_name(), get_analytics_dlq_name()]
 
 
+def _default_s3_buckets() -> list[str]:
+    return [get_bls_bucket(), get_datausa_bucket(), f"{get_bucket_prefix()}-site"]
+
+
 LAMBDA_METRICS: list[MetricDef] = [
     MetricDef("AWS/Lambda", "Invocations", "Sum", "Count", "Invocations"),
     MetricDef("AWS/Lambda", "Errors", "Sum", "Count", "Errors"),
@@ -72,19 +88,63 @@ def _parse_csv(value: str | None) -> list[str] | None:
     return out or None
 
 
+@dataclass(frozen=True, slots=True)
+class _ObsConfig:
+    """`FOMC_OBS_*` / `FOMC_COST_*` overrides, read once per process."""
+
+    lambda_functions: tuple[str, ...] | None
+    sqs_queues: tuple[str, ...] | None
+    cost_tag_key: str | None
+    cost_tag_values: tuple[str, ...] | None
+    cost_services: tuple[str, ...] | None
+    use_ce_forecast: bool
+    # Built once from the tag/service fields above; sent as the CE `Filter`.
+    cost_filter: dict[str, Any] | None = field(init=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "cost_filter", _build_cost_filter(
+            tag_key=self.cost_tag_key,
+            tag_values=list(self.cost_tag_values) if self.cost_tag_values else None,
+            services=list(self.cost_services) if self.cost_services else None,
+        ))
+
+
+def _csv_tuple(value: str | None) -> tuple[str, ...] | None:
+    parts = _parse_csv(value)
+    return tuple(parts) if parts else None
+
+
+@lru_cache(maxsize=1)
+def _obs_config() -> _ObsConfig:
+    """Memoized like `src.config`; call `_obs_config.cache_clear()` after editing the env."""
+    env = os.environ
+    return _ObsConfig(
+        lambda_functions=_csv_tuple(env.get("FOMC_OBS_LAMBDA_FUNCTIONS")),
+        sqs_queues=_csv_tuple(env.get("FOMC_OBS_SQS_QUEUES")),
+        cost_tag_key=env.get("FOMC_COST_TAG_KEY"),
+        cost_tag_values=_csv_tuple(env.get("FOMC_COST_TAG_VALUES") or env.get("FOMC_COST_TAG_VALUE")),
+        cost_services=_csv_tuple(
+            env.get("FOMC_COST_SERVICES")
+            or "AWS Lambda,Amazon Simple Queue Service,Amazon Simple Storage Service"
+        ),
+        use_ce_forecast=env.get("FOMC_COST_USE_CE_FORECAST", "0").strip().lower() in {"1", "true", "yes"},
+    )
+
+
 def _utc_now(now: datetime | None) -> datetime:
     if now is None:
-        return datetime.now(timezone.utc)
+        return datetime.now(_UTC)
     if now.tzinfo is None:
-        return now.replace(tzinfo=timezone.utc)
-    return now.astimezone(timezone.utc)
+        return now.replace(tzinfo=_UTC)
+    return now.astimezone(_UTC)
 
 
 def _date_keys(*, end: date, days: int) -> list[str]:
     if days <= 0:
         days = 30
-    start = end - timedelta(days=days - 1)
-    return [(start + timedelta(days=i)).isoformat() for i in range(days)]
+    start = np.datetime64(end - timedelta(days=days - 1), "D")
+    # One vectorized range + string cast instead of a timedelta/isoformat per day.
+    return np.arange(start, start + days, dtype="datetime64[D]").astype(str).tolist()
 
 
 def _cw_dimensions(service: Literal["lambda", "sqs"], resource_name: str) -> list[dict[str, str]]:
@@ -95,14 +155,15 @@ def _cw_dimensions(service: Literal["lambda", "sqs"], resource_name: str) -> lis
     raise ValueError(f"Unknown service: {service}")
 
 
-def _align_values(dates: list[str], values_by_date: dict[str, float]) -> list[float | None]:
-    return [values_by_date.get(d) for d in dates]
+def _align_values(dates: Sequence[str], values_by_date: dict[str, float]) -> list[float | None]:
+    get = values_by_date.get
+    return [get(d) for d in dates]
 
 
 def _ensure_utc(dt: datetime) -> datetime:
     if dt.tzinfo is None:
-        return dt.replace(tzinfo=timezone.utc)
-    return dt.astimezone(timezone.utc)
+        return dt.replace(tzinfo=_UTC)
+    return dt.astimezone(_UTC)
 
 
 def fetch_cloudwatch_series(
@@ -126,27 +187,213 @@ def fetch_cloudwatch_series(
     )
 
     values: dict[str, float] = {}
-    for dp in resp.get("Datapoints", []):
-        ts = dp.get("Timestamp")
-        if not isinstance(ts, datetime):
-            continue
-        ts_utc = _ensure_utc(ts)
-        key = ts_utc.date().isoformat()
-        raw = dp.get(metric.stat)
-        if raw is None:
-            continue
+    datapoints = resp.get("Datapoints", [])
+    _add_datapoints(values, [(dp.get("Timestamp"), dp.get(metric.stat)) for dp in datapoints], metric.stat)
+    return values
+
+
+def fetch_cloudwatch_series_batch(
+    cloudwatch_client,
+    queries: list[tuple[MetricDef, list[dict[str, str]]]],
+    *,
+    start_time: datetime,
+    end_time: datetime,
+    period_seconds: int = 86400,
+) -> list[tuple[dict[str, float], str | None]]:
+    """Fetch many daily series with `GetMetricData` (500 queries per request).
+
+    Returns one `(date->value, error)` pair per query, in query order. A failed
+    request marks every query in its chunk as failed; per-query failures come
+    from the result's `StatusCode`.
+    """
+    out: list[tuple[dict[str, float], str | None]] = [({}, None) for _ in queries]
+    for offset in range(0, len(queries), _MAX_METRIC_DATA_QUERIES):
+        chunk = queries[offset:offset + _MAX_METRIC_DATA_QUERIES]
+        metric_queries = [
+            {
+                "Id": f"m{offset + i}",
+                "MetricStat": {
+                    "Metric": {
+                        "Namespace": metric.namespace,
+                        "MetricName": metric.metric_name,
+                        "Dimensions": dimensions,
+                    },
+                    "Period": int(period_seconds),
+                    "Stat": metric.stat,
+                },
+                "ReturnData": True,
+            }
+            for i, (metric, dimensions) in enumerate(chunk)
+        ]
+        index_by_id = {q["Id"]: offset + i for i, q in enumerate(metric_queries)}
+        req: dict[str, Any] = {
+            "MetricDataQueries": metric_queries,
+            "StartTime": _ensure_utc(start_time),
+            "EndTime": _ensure_utc(end_time),
+            "ScanBy": "TimestampAscending",
+        }
         try:
-            value = float(raw)
-        except (TypeError, ValueError):
-            continue
+            while True:
+                resp = cloudwatch_client.get_metric_data(**req)
+                for result in resp.get("MetricDataResults", []):
+                    idx = index_by_id.get(result.get("Id"))
+                    if idx is None:
+                        continue
+                    values, error = out[idx]
+                    stat = queries[idx][0].stat
+                    _add_datapoints(values, list(zip(result.get("Timestamps", []), result.get("Values", []))), stat)
+                    status = result.get("StatusCode")
+                    if status in {"Forbidden", "InternalError"}:
+                        error = f"GetMetricData status: {status}"
+                    out[idx] = (values, error)
+                next_token = resp.get("NextToken")
+                if not next_token:
+                    break
+                req["NextToken"] = next_token
+        except Exception as e:
+            for idx in range(offset, offset + len(chunk)):
+                out[idx] = ({}, str(e))
+    return out
 
-        # If multiple points land on the same date, prefer additive for "Sum".
-        if key in values and metric.stat == "Sum":
-            values[key] += value
-        else:
-            values[key] = value
 
-    return values
+def _add_datapoints(values: dict[str, float], points: list[tuple[Any, Any]], stat: str) -> None:
+    """Merge `(timestamp, value)` pairs into a date->value dict."""
+    if stat != "Sum":
+        # Fast path: later points simply overwrite, and botocore always parses
+        # timestamps as tz-aware datetimes. Anything unexpected falls back to
+        # the checked per-point path below.
+        try:
+            values.update({
+                ts.astimezone(_UTC).date().isoformat(): float(raw)
+                for ts, raw in points
+                if raw is not None
+            })
+            return
+        except (AttributeError, TypeError, ValueError):
+            pass
+    for ts, raw in points:
+        _add_datapoint(values, ts, raw, stat)
+
+
+def _add_datapoint(values: dict[str, float], ts: Any, raw: Any, stat: str) -> None:
+    if not isinstance(ts, datetime) or raw is None:
+        return
+    # botocore parses timestamps as tz-aware, so no naive-datetime branch here.
+    key = ts.astimezone(_UTC).date().isoformat()
+    try:
+        value = float(raw)
+    except (TypeError, ValueError):
+        return
+
+    # If multiple points land on the same date, prefer additive for "Sum".
+    if key in values and stat == "Sum":
+        values[key] += value
+    else:
+        values[key] = value
+
+
+@dataclass(frozen=True, slots=True)
+class _SeriesSpec:
+    service: str
+    resource: str
+    metric: MetricDef
+    dimensions: list[dict[str, str]]
+    id: str
+    group: str
+    label: str
+
+
+# S3 storage metrics are slow-moving (daily) but useful for "other AWS metrics".
+_S3_STORAGE_METRICS: list[tuple[MetricDef, str]] = [
+    (MetricDef("AWS/S3", "NumberOfObjects", "Average", "Count", "Objects (avg)"), "AllStorageTypes"),
+    (MetricDef("AWS/S3", "BucketSizeBytes", "Average", "Bytes", "Bucket size (avg bytes)"), "StandardStorage"),
+]
+
+
+def _series_specs(
+    *,
+    lambda_functions: list[str],
+    sqs_queues: list[str],
+    s3_buckets: list[str],
+) -> list[_SeriesSpec]:
+    """List every CloudWatch series in payload order."""
+    specs: list[_SeriesSpec] = []
+    for fn in lambda_functions:
+        for metric in LAMBDA_METRICS:
+            specs.append(_SeriesSpec(
+                service="lambda",
+                resource=fn,
+                metric=metric,
+                dimensions=_cw_dimensions("lambda", fn),
+                id=f"lambda.{fn}.{metric.metric_name}.{metric.stat}",
+                group=f"Lambda / {fn}",
+                label=metric.label,
+            ))
+    for q in sqs_queues:
+        for metric in SQS_METRICS:
+            specs.append(_SeriesSpec(
+                service="sqs",
+                resource=q,
+                metric=metric,
+                dimensions=_cw_dimensions("sqs", q),
+                id=f"sqs.{q}.{metric.metric_name}.{metric.stat}",
+                group=f"SQS / {q}",
+                label=metric.label,
+            ))
+    for bucket in s3_buckets:
+        for metric, storage_type in _S3_STORAGE_METRICS:
+            specs.append(_SeriesSpec(
+                service="s3",
+                resource=bucket,
+                metric=metric,
+                dimensions=[
+                    {"Name": "BucketName", "Value": bucket},
+                    {"Name": "StorageType", "Value": storage_type},
+                ],
+                id=f"s3.{bucket}.{metric.metric_name}.{metric.stat}.{storage_type}",
+                group=f"S3 / {bucket}",
+                label=f"{metric.label} ({storage_type})",
+            ))
+    return specs
+
+
+def _metric_window(end_date: date, window_days: int) -> tuple[datetime, datetime]:
+    """Return the [start, end) UTC datetimes covering `window_days` ending on `end_date`."""
+    start_time = datetime.combine(end_date - timedelta(days=window_days - 1), datetime.min.time(), tzinfo=_UTC)
+    end_time = datetime.combine(end_date + timedelta(days=1), datetime.min.time(), tzinfo=_UTC)
+    return start_time, end_time
+
+
+def _collect_series(
+    specs: Sequence[_SeriesSpec],
+    fetched: Sequence[tuple[dict[str, float], str | None]],
+    date_axis: Sequence[str],
+    errors: list[dict[str, Any]],
+) -> list[dict[str, Any]]:
+    """Turn batch results into payload series, recording per-series failures in `errors`."""
+    series: list[dict[str, Any]] = []
+    for spec, (values, error) in zip(specs, fetched):
+        if error is not None:
+            errors.append({
+                "source": "cloudwatch",
+                "service": spec.service,
+                "resource": spec.resource,
+                "metric": spec.metric.metric_name,
+                "stat": spec.metric.stat,
+                "error": error,
+            })
+        series.append({
+            "id": spec.id,
+            "group": spec.group,
+            "service": spec.service,
+            "resource": spec.resource,
+            "metric": spec.metric.metric_name,
+            "stat": spec.metric.stat,
+            "unit": spec.metric.unit,
+            "label": spec.label,
+            "values": _align_values(date_axis, values),
+        })
+    return series
 
 
 def _build_cost_filter(
@@ -198,25 +445,29 @@ def fetch_cost_actual(
     if cost_filter is not None:
         req["Filter"] = cost_filter
 
-    resp = ce_client.get_cost_and_usage(**req)
-
     currency = None
     values: dict[str, float] = {}
-    for item in resp.get("ResultsByTime", []):
-        period = item.get("TimePeriod", {})
-        start = period.get("Start")
-        total = item.get("Total", {}).get(metric_name, {})
-        amount = total.get("Amount")
-        unit = total.get("Unit")
-        if currency is None and isinstance(unit, str):
-            currency = unit
-        if not start or amount is None:
-            continue
-        try:
-            values[str(start)] = float(amount)
-        except (TypeError, ValueError):
-            continue
-    return values, currency
+    # botocore has no paginator for GetCostAndUsage; follow NextPageToken by hand.
+    while True:
+        resp = ce_client.get_cost_and_usage(**req)
+        for item in resp.get("ResultsByTime", []):
+            period = item.get("TimePeriod", {})
+            start = period.get("Start")
+            total = item.get("Total", {}).get(metric_name, {})
+            amount = total.get("Amount")
+            unit = total.get("Unit")
+            if currency is None and isinstance(unit, str):
+                currency = unit
+            if not start or amount is None:
+                continue
+            try:
+                values[str(start)] = float(amount)
+            except (TypeError, ValueError):
+                continue
+        next_token = resp.get("NextPageToken")
+        if not next_token:
+            return values, currency
+        req["NextPageToken"] = next_token
 
 
 def fetch_cost_forecast(
@@ -276,6 +527,47 @@ def fetch_cost_forecast(
     return out, currency
 
 
+def forecast_cost_locally(
+    actual_by_date: dict[str, float],
+    *,
+    start_date: date,
+    days: int,
+    alpha: float = 0.3,
+    interval: float = 0.8,
+) -> dict[str, dict[str, float]]:
+    """Forecast daily cost from the actual series with simple exponential smoothing.
+
+    Only complete days before `start_date` are used. The mean is the final
+    smoothed level (flat over the horizon). The bounds are centered on it:
+    the half-width is the `interval` quantile of the absolute one-step-ahead
+    residuals (around their mean), widened for day `h` by the SES factor
+    `sqrt(1 + (h - 1) * alpha**2)`, so `lower <= mean <= upper`. Returns the
+    same shape as `fetch_cost_forecast`, or `{}` with fewer than three
+    residuals (four days of history) to size the interval from.
+    """
+    cutoff = start_date.isoformat()
+    history = [v for d, v in sorted(actual_by_date.items()) if d < cutoff]
+    if days <= 0 or len(history) < 4:
+        return {}
+
+    level = history[0]
+    residuals = []
+    for value in history[1:]:
+        residuals.append(value - level)
+        level = alpha * value + (1 - alpha) * level
+
+    errors = np.asarray(residuals)
+    half_width = float(np.quantile(np.abs(errors - errors.mean()), interval))
+    widths = half_width * np.sqrt(1 + np.arange(days) * alpha**2)
+    start = np.datetime64(start_date, "D")
+    dates = np.arange(start, start + days, dtype="datetime64[D]").astype(str).tolist()
+    mean = round(level, 6)
+    return {
+        d: {"mean": mean, "lower": round(max(0.0, level - w), 6), "upper": round(level + w, 6)}
+        for d, w in zip(dates, widths.tolist())
+    }
+
+
 def build_aws_observability_payload(
     *,
     now: datetime | None = None,
@@ -285,219 +577,142 @@ def build_aws_observability_payload(
     sqs_queues: list[str] | None = None,
     include_s3_storage_metrics: bool = True,
     include_cost: bool = True,
+    include_metrics: bool = True,
 ) -> dict[str, Any]:
     now_utc = _utc_now(now)
+    generated_at = now_utc.isoformat().replace("+00:00", "Z")
     end_date = now_utc.date()
     metric_dates = _date_keys(end=end_date, days=window_days)
 
+    obs_config = _obs_config()
     if lambda_functions is None:
-        lambda_functions = _parse_csv(os.environ.get("FOMC_OBS_LAMBDA_FUNCTIONS")) or DEFAULT_LAMBDA_FUNCTIONS
+        lambda_functions = list(obs_config.lambda_functions or DEFAULT_LAMBDA_FUNCTIONS)
     if sqs_queues is None:
-        sqs_queues = _parse_csv(os.environ.get("FOMC_OBS_SQS_QUEUES")) or _default_sqs_queues()
-
-    bls_bucket = get_bls_bucket()
-    datausa_bucket = get_datausa_bucket()
-    prefix = get_bucket_prefix()
+        sqs_queues = list(obs_config.sqs_queues or _default_sqs_queues())
 
     errors: list[dict[str, Any]] = []
 
     cloudwatch = None
-    try:
-        cloudwatch = get_client("cloudwatch")
-    except Exception as e:
-        errors.append({"source": "cloudwatch", "error": str(e)})
-
-    start_time = datetime.combine(end_date - timedelta(days=window_days - 1), datetime.min.time(), tzinfo=timezone.utc)
-    end_time = datetime.combine(end_date + timedelta(days=1), datetime.min.time(), tzinfo=timezone.utc)
-
-    series: list[dict[str, Any]] = []
-    if cloudwatch is not None:
-        for fn in lambda_functions:
-            for metric in LAMBDA_METRICS:
-                try:
-                    values = fetch_cloudwatch_series(
-                        cloudwatch,
-                        metric=metric,
-                        dimensions=_cw_dimensions("lambda", fn),
-                        start_time=start_time,
-                        end_time=end_time,
-                        period_seconds=86400,
-                    )
-                except Exception as e:
-                    errors.append({
-                        "source": "cloudwatch",
-                        "service": "lambda",
-                        "resource": fn,
-                        "metric": metric.metric_name,
-                        "stat": metric.stat,
-                        "error": str(e),
-                    })
-                    values = {}
-
-                series.append({
-                    "id": f"lambda.{fn}.{metric.metric_name}.{metric.stat}",
-                    "group": f"Lambda / {fn}",
-                    "service": "lambda",
-                    "resource": fn,
-                    "metric": metric.metric_name,
-                    "stat": metric.stat,
-                    "unit": metric.unit,
-                    "label": metric.label,
-                    "values": _align_values(metric_dates, values),
-                })
-
-        for q in sqs_queues:
-            for metric in SQS_METRICS:
-                try:
-                    values = fetch_cloudwatch_series(
-                        cloudwatch,
-                        metric=metric,
-                        dimensions=_cw_dimensions("sqs", q),
-                        start_time=start_time,
-                        end_time=end_time,
-                        period_seconds=86400,
-                    )
-                except Exception as e:
-                    errors.append({
-                        "source": "cloudwatch",
-                        "service": "sqs",
-                        "resource": q,
-                        "metric": metric.metric_name,
-                        "stat": metric.stat,
-                        "error": str(e),
-                    })
-                    values = {}
-
-                series.append({
-                    "id": f"sqs.{q}.{metric.metric_name}.{metric.stat}",
-                    "group": f"SQS / {q}",
-                    "service": "sqs",
-                    "resource": q,
-                    "metric": metric.metric_name,
-                    "stat": metric.stat,
-                    "unit": metric.unit,
-                    "label": metric.label,
-                    "values": _align_values(metric_dates, values),
-                })
-
-        if include_s3_storage_metrics:
-            # S3 storage metrics are slow-moving (daily) but useful for "other AWS metrics".
-            s3_defs = [
-                ("NumberOfObjects", "Average", "Count", "Objects (avg)", "AllStorageTypes"),
-                ("BucketSizeBytes", "Average", "Bytes", "Bucket size (avg bytes)", "StandardStorage"),
-            ]
-            for bucket in [bls_bucket, datausa_bucket, f"{prefix}-site"]:
-                for metric_name, stat, unit, label, storage_type in s3_defs:
-                    metric = MetricDef("AWS/S3", metric_name, stat, unit, label)  # type: ignore[arg-type]
-                    try:
-                        values = fetch_cloudwatch_series(
-                            cloudwatch,
-                            metric=metric,
-                            dimensions=[
-                                {"Name": "BucketName", "Value": bucket},
-                                {"Name": "StorageType", "Value": storage_type},
-                            ],
-                            start_time=start_time,
-                            end_time=end_time,
-                            period_seconds=86400,
-                        )
-                    except Exception as e:
-                        errors.append({
-                            "source": "cloudwatch",
-                            "service": "s3",
-                            "resource": bucket,
-                            "metric": metric_name,
-                            "stat": stat,
-                            "error": str(e),
-                        })
-                        values = {}
-
-                    series.append({
-                        "id": f"s3.{bucket}.{metric_name}.{stat}.{storage_type}",
-                        "group": f"S3 / {bucket}",
-                        "service": "s3",
-                        "resource": bucket,
-                        "metric": metric_name,
-                        "stat": stat,
-                        "unit": unit,
-                        "label": f"{label} ({storage_type})",
-                        "values": _align_values(metric_dates, values),
-                    })
-
-    cost: dict[str, Any] = {"currency": None, "dates": [], "actual": [], "predicted": [], "predicted_lower": [], "predicted_upper": []}
+    if include_metrics:
+        try:
+            cloudwatch = get_client("cloudwatch")
+        except Exception as e:
+            errors.append({"source": "cloudwatch", "error": str(e)})
 
+    ce = None
     if include_cost:
-        ce = None
         try:
             ce = get_client("ce")
         except Exception as e:
             errors.append({"source": "cost-explorer", "error": str(e)})
 
+    start_time, end_time = _metric_window(end_date, window_days)
+
+    specs: list[_SeriesSpec] = []
+    if cloudwatch is not None:
+        specs = _series_specs(
+            lambda_functions=lambda_functions,
+            sqs_queues=sqs_queues,
+            s3_buckets=_default_s3_buckets() if include_s3_storage_metrics else [],
+        )
+
+    if ce is not None:
+        tag_key = obs_config.cost_tag_key
+        tag_values = list(obs_config.cost_tag_values) if obs_config.cost_tag_values else None
+        services = list(obs_config.cost_services) if obs_config.cost_services else None
+        cost_filter = obs_config.cost_filter
+
+    # GetMetricData, GetCostAndUsage and GetCostForecast are independent round
+    # trips, so issue them side by side; results are consumed in a fixed order
+    # below so the payload (and its error list) stays deterministic.
+    with ThreadPoolExecutor(max_workers=3) as ex:
+        metrics_future = None
+        if cloudwatch is not None:
+            # One GetMetricData request covers every series (up to 500 per call).
+            metrics_future = ex.submit(
+                fetch_cloudwatch_series_batch,
+                cloudwatch,
+                [(spec.metric, spec.dimensions) for spec in specs],
+                start_time=start_time,
+                end_time=end_time,
+                period_seconds=86400,
+            )
+        actual_future = forecast_future = None
         if ce is not None:
-            tag_key = os.environ.get("FOMC_COST_TAG_KEY")
-            tag_values = _parse_csv(os.environ.get("FOMC_COST_TAG_VALUES") or os.environ.get("FOMC_COST_TAG_VALUE"))
-            services = _parse_csv(
-                os.environ.get("FOMC_COST_SERVICES")
-                or "AWS Lambda,Amazon Simple Queue Service,Amazon Simple Storage Service"
+            actual_future = ex.submit(
+                fetch_cost_actual,
+                ce,
+                start_date=(end_date - timedelta(days=window_days - 1)).isoformat(),
+                end_date_exclusive=(end_date + timedelta(days=1)).isoformat(),
+                cost_filter=cost_filter,
             )
-            cost_filter = _build_cost_filter(tag_key=tag_key, tag_values=tag_values, services=services)
-
-            actual_start = (end_date - timedelta(days=window_days - 1)).isoformat()
-            actual_end_excl = (end_date + timedelta(days=1)).isoformat()
-            forecast_start = end_date.isoformat()
-            forecast_end_excl = (end_date + timedelta(days=max(0, forecast_days))).isoformat()
-
-            actual_by_date: dict[str, float] = {}
-            forecast_by_date: dict[str, dict[str, float]] = {}
-            currency = None
-            try:
-                actual_by_date, currency = fetch_cost_actual(
+            if forecast_days > 0 and obs_config.use_ce_forecast:
+                forecast_future = ex.submit(
+                    fetch_cost_forecast,
                     ce,
-                    start_date=actual_start,
-                    end_date_exclusive=actual_end_excl,
+                    start_date=end_date.isoformat(),
+                    end_date_exclusive=(end_date + timedelta(days=forecast_days)).isoformat(),
                     cost_filter=cost_filter,
                 )
+
+    series: list[dict[str, Any]] = []
+    if metrics_future is not None:
+        # Every series is aligned to the same date axis.
+        series = _collect_series(specs, metrics_future.result(), tuple(metric_dates), errors)
+
+    cost: dict[str, Any] = {"currency": None, "dates": [], "actual": [], "predicted": [], "predicted_lower": [], "predicted_upper": []}
+
+    if actual_future is not None:
+        actual_by_date: dict[str, float] = {}
+        forecast_by_date: dict[str, dict[str, float]] = {}
+        currency = None
+        try:
+            actual_by_date, currency = actual_future.result()
+        except Exception as e:
+            errors.append({"source": "cost-explorer", "kind": "actual", "error": str(e)})
+
+        forecast_currency = None
+        forecast_method = None
+        if forecast_future is not None:
+            forecast_method = "cost-explorer"
+            try:
+                forecast_by_date, forecast_currency = forecast_future.result()
             except Exception as e:
-                errors.append({"source": "cost-explorer", "kind": "actual", "error": str(e)})
-
-            forecast_currency = None
-            if forecast_days > 0:
-                try:
-                    forecast_by_date, forecast_currency = fetch_cost_forecast(
-                        ce,
-                        start_date=forecast_start,
-                        end_date_exclusive=forecast_end_excl,
-                        cost_filter=cost_filter,
-                    )
-                except Exception as e:
-                    errors.append({"source": "cost-explorer", "kind": "forecast", "error": str(e)})
-
-            if currency is None:
-                currency = forecast_currency
-
-            total_days = window_days + max(0, forecast_days)
-            # Forecast starts on `end_date`, which overlaps with the last day of the actual window.
-            if forecast_days > 0:
-                total_days -= 1
-            end_cost_date = end_date + timedelta(days=max(forecast_days - 1, 0))
-            cost_dates = _date_keys(end=end_cost_date, days=total_days)
-
-            cost = {
-                "currency": currency,
-                "dates": cost_dates,
-                "actual": [actual_by_date.get(d) for d in cost_dates],
-                "predicted": [forecast_by_date.get(d, {}).get("mean") for d in cost_dates],
-                "predicted_lower": [forecast_by_date.get(d, {}).get("lower") for d in cost_dates],
-                "predicted_upper": [forecast_by_date.get(d, {}).get("upper") for d in cost_dates],
-                "filter": {
-                    "tag_key": tag_key,
-                    "tag_values": tag_values,
-                    "services": services,
-                },
-            }
+                errors.append({"source": "cost-explorer", "kind": "forecast", "error": str(e)})
+        elif forecast_days > 0:
+            # The default; saves a billed GetCostForecast request per export
+            # (FOMC_COST_USE_CE_FORECAST=1 opts back into Cost Explorer).
+            forecast_method = "local"
+            forecast_by_date = forecast_cost_locally(actual_by_date, start_date=end_date, days=forecast_days)
+
+        if currency is None:
+            currency = forecast_currency
+
+        total_days = window_days + max(0, forecast_days)
+        # Forecast starts on `end_date`, which overlaps with the last day of the actual window.
+        if forecast_days > 0:
+            total_days -= 1
+        end_cost_date = end_date + timedelta(days=max(forecast_days - 1, 0))
+        cost_dates = _date_keys(end=end_cost_date, days=total_days)
+
+        cost = {
+            "generated_at": generated_at,
+            "currency": currency,
+            "dates": cost_dates,
+            "actual": [actual_by_date.get(d) for d in cost_dates],
+            "predicted": [forecast_by_date.get(d, {}).get("mean") for d in cost_dates],
+            "predicted_lower": [forecast_by_date.get(d, {}).get("lower") for d in cost_dates],
+            "predicted_upper": [forecast_by_date.get(d, {}).get("upper") for d in cost_dates],
+            "forecast_method": forecast_method,
+            "filter": {
+                "tag_key": tag_key,
+                "tag_values": tag_values,
+                "services": services,
+            },
+        }
 
     return {
-        "generated_at": now_utc.isoformat().replace("+00:00", "Z"),
+        "generated_at": generated_at,
         "window_days": int(window_days),
         "forecast_days": int(max(0, forecast_days)),
         "granularity": "DAILY",
@@ -505,27 +720,191 @@ def build_aws_observability_payload(
         "resources": {
             "lambda_functions": lambda_functions,
             "sqs_queues": sqs_queues,
-            "s3_buckets": [bls_bucket, datausa_bucket, f"{prefix}-site"],
+            "s3_buckets": _default_s3_buckets(),
         },
-        "metrics": {"series": series},
+        "metrics": {"generated_at": generated_at if include_metrics else None, "series": series},
         "cost": cost,
         "errors": errors,
     }
 
 
+def build_s3_storage_payload(
+    *,
+    now: datetime | None = None,
+    window_days: int = 30,
+    s3_buckets: list[str] | None = None,
+) -> dict[str, Any]:
+    """Fetch the S3 storage series (BucketSizeBytes / NumberOfObjects) on their own.
+
+    CloudWatch publishes these once a day, so exports keep them in a sidecar
+    that is refreshed daily instead of with every metrics refresh.
+    """
+    now_utc = _utc_now(now)
+    end_date = now_utc.date()
+    metric_dates = _date_keys(end=end_date, days=window_days)
+    if s3_buckets is None:
+        s3_buckets = _default_s3_buckets()
+
+    errors: list[dict[str, Any]] = []
+    series: list[dict[str, Any]] = []
+    try:
+        cloudwatch = get_client("cloudwatch")
+    except Exception as e:
+        errors.append({"source": "cloudwatch", "error": str(e)})
+    else:
+        specs = _series_specs(lambda_functions=[], sqs_queues=[], s3_buckets=s3_buckets)
+        start_time, end_time = _metric_window(end_date, window_days)
+        fetched = fetch_cloudwatch_series_batch(
+            cloudwatch,
+            [(spec.metric, spec.dimensions) for spec in specs],
+            start_time=start_time,
+            end_time=end_time,
+            period_seconds=86400,
+        )
+        series = _collect_series(specs, fetched, tuple(metric_dates), errors)
+
+    return {
+        "generated_at": now_utc.isoformat().replace("+00:00", "Z"),
+        "window_days": int(window_days),
+        "metric_dates": metric_dates,
+        "series": series,
+        "errors": errors,
+    }
+
+
+def _parse_generated_at(value: Any) -> datetime | None:
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        return _ensure_utc(datetime.fromisoformat(value.replace("Z", "+00:00")))
+    except ValueError:
+        return None
+
+
+def _read_previous_payload(path: Path) -> dict[str, Any] | None:
+    try:
+        payload = json_codec.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
+def _reusable_sections(
+    previous: dict[str, Any] | None,
+    *,
+    now_utc: datetime,
+    window_days: int,
+    forecast_days: int,
+    metrics_ttl: timedelta,
+    cost_ttl: timedelta,
+) -> tuple[bool, bool]:
+    """Return whether the previous export's (metrics, cost) halves are still fresh.
+
+    A half is reused when it was generated within its TTL, on the same UTC day
+    (so the daily date axis still lines up) and for the same window.
+    """
+    if not previous or previous.get("window_days") != int(window_days):
+        return False, False
+
+    def _fresh(section: Any, ttl: timedelta) -> bool:
+        if not isinstance(section, dict):
+            return False
+        generated = _parse_generated_at(section.get("generated_at"))
+        if generated is None or generated.date() != now_utc.date():
+            return False
+        return timedelta(0) <= now_utc - generated < ttl
+
+    metrics_ok = _fresh(previous.get("metrics"), metrics_ttl)
+    cost_ok = previous.get("forecast_days") == int(max(0, forecast_days)) and _fresh(previous.get("cost"), cost_ttl)
+    return metrics_ok, cost_ok
+
+
+def _load_or_build_s3_storage(
+    path: Path,
+    *,
+    now_utc: datetime,
+    window_days: int,
+    force: bool,
+) -> dict[str, Any]:
+    """Return the S3 storage sidecar, rebuilding it once per UTC day (or window change)."""
+    previous = None if force else _read_previous_payload(path)
+    if previous and previous.get("window_days") == int(window_days):
+        generated = _parse_generated_at(previous.get("generated_at"))
+        if generated is not None and generated.date() == now_utc.date() and generated <= now_utc:
+            return previous
+
+    storage = build_s3_storage_payload(now=now_utc, window_days=window_days)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(json_codec.dumps(storage) + b"\n")
+    return storage
+
+
 def export_aws_observability(
     *,
     out_path: str | Path = Path("site/data/aws_observability.json"),
     now: datetime | None = None,
     window_days: int = 30,
     forecast_days: int = 30,
+    metrics_ttl: timedelta = timedelta(hours=1),
+    cost_ttl: timedelta = timedelta(hours=6),
+    force: bool = False,
 ) -> Path:
-    payload = build_aws_observability_payload(
-        now=now,
+    """Write the observability payload, refetching only stale halves.
+
+    CloudWatch metrics are reused for `metrics_ttl` and Cost Explorer data
+    (billed per request) for `cost_ttl`. The daily S3 storage series come from
+    an `s3_storage.json` sidecar next to `out_path` that is rebuilt once per
+    UTC day. `force=True` always refetches everything.
+    """
+    path = Path(out_path)
+    now_utc = _utc_now(now)
+
+    previous = None if force else _read_previous_payload(path)
+    reuse_metrics, reuse_cost = _reusable_sections(
+        previous,
+        now_utc=now_utc,
         window_days=window_days,
         forecast_days=forecast_days,
+        metrics_ttl=metrics_ttl,
+        cost_ttl=cost_ttl,
     )
-    path = Path(out_path)
+    if reuse_metrics and reuse_cost:
+        return path.resolve()
+
+    # The S3 storage sidecar (when it needs a refresh) is fetched alongside
+    # the main payload rather than after it.
+    with ThreadPoolExecutor(max_workers=1) as ex:
+        storage_future = None
+        if not reuse_metrics:
+            storage_future = ex.submit(
+                _load_or_build_s3_storage,
+                path.with_name(S3_STORAGE_FILENAME),
+                now_utc=now_utc,
+                window_days=window_days,
+                force=force,
+            )
+        payload = build_aws_observability_payload(
+            now=now_utc,
+            window_days=window_days,
+            forecast_days=forecast_days,
+            include_metrics=not reuse_metrics,
+            include_cost=not reuse_cost,
+            include_s3_storage_metrics=False,
+        )
+    if storage_future is not None:
+        storage = storage_future.result()
+        payload["metrics"]["series"].extend(storage.get("series", []))
+        payload["errors"].extend(storage.get("errors", []))
+    if previous is not None:
+        if reuse_metrics:
+            payload["metrics"] = previous["metrics"]
+        if reuse_cost:
+            payload["cost"] = previous["cost"]
+        kept_sources = {"cloudwatch"} if reuse_metrics else {"cost-explorer"} if reuse_cost else set()
+        kept_errors = [e for e in previous.get("errors", []) if isinstance(e, dict) and e.get("source") in kept_sources]
+        payload["errors"] = kept_errors + payload["errors"]
+
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(payload, indent=2, default=str) + "\n", encoding="utf-8")
+    # Machine-read by the dashboard: compact, and CloudFront gzips it in transit.
+    path.write_bytes(json_codec.dumps(payload) + b"\n")
     return path.resolve()
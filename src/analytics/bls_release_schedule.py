@@ -4,21 +4,33 @@ BLS publishes "Schedule of News Releases" pages (typically ET) that list future
 release dates/times for a program (e.g., CPI, Employment Situation).
 
 This module scrapes those pages into structured "scheduled release" events.
-It is intentionally stdlib-only so it can run in lightweight environments.
+It runs on the stdlib alone; when `lxml` is installed, table extraction uses
+its C parser instead of the pure-Python `HTMLParser` fallback.
 """
 
 from __future__ import annotations
 
+import hashlib
 import json
 import os
 import re
-from dataclasses import dataclass
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone, tzinfo
+from functools import lru_cache
 from html.parser import HTMLParser
-from typing import Any
+from operator import itemgetter
+from pathlib import Path
+from typing import Any, Iterator, NamedTuple
 from zoneinfo import ZoneInfo
 
-from src.helpers.http_client import fetch_text
+from src.helpers import json_codec
+from src.helpers.http_client import fetch_bytes_conditional
+
+try:
+    import lxml.html as lxml_html  # type: ignore
+except ImportError:  # pragma: no cover - exercised when lxml is absent
+    lxml_html = None
 
 BLS_SCHEDULE_BASE_URL = "https://www.bls.gov/schedule/news_release"
 
@@ -31,8 +43,7 @@ USER_AGENT = os.environ.get(
 )
 
 
-@dataclass(frozen=True)
-class ScheduleSource:
+class ScheduleSource(NamedTuple):
     series: str
     release: str
     url: str
@@ -73,6 +84,7 @@ DEFAULT_SCHEDULE_SOURCES: dict[str, ScheduleSource] = {
 }
 
 
+@lru_cache(maxsize=64)
 def _get_tz(name: str | None) -> tzinfo:
     tz_name = (name or "").strip() or DEFAULT_SCHEDULE_TIMEZONE
     try:
@@ -82,67 +94,100 @@ def _get_tz(name: str | None) -> tzinfo:
 
 
 def _to_utc_iso(dt: datetime) -> str:
-    aware = dt if dt.tzinfo is not None else dt.replace(tzinfo=timezone.utc)
-    return aware.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    elif dt.tzinfo is not timezone.utc:
+        dt = dt.astimezone(timezone.utc)
+    # UTC isoformat() always ends in "+00:00"; swap just that suffix for "Z".
+    return dt.isoformat()[:-6] + "Z"
+
+
+# Compiled once: these run per table cell / per row while parsing a page.
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9 ]+")
+_ORDINAL_RE = re.compile(r"\b(\d{1,2})(st|nd|rd|th)\b", flags=re.IGNORECASE)
+_WEEKDAY_PREFIX_RE = re.compile(
+    r"^(monday|tuesday|wednesday|thursday|friday|saturday|sunday),\s+",
+    flags=re.IGNORECASE,
+)
 
 
 def _normalize_header(s: str) -> str:
-    s = re.sub(r"\s+", " ", (s or "").strip()).lower()
-    s = re.sub(r"[\u00a0\t]", " ", s)
-    s = re.sub(r"[^a-z0-9 ]+", " ", s)
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
+    # str.split() already covers tabs and non-breaking spaces.
+    s = _NON_ALNUM_RE.sub(" ", (s or "").lower())
+    return " ".join(s.split())
 
 
 def _strip_ordinal_suffixes(s: str) -> str:
-    return re.sub(r"\b(\d{1,2})(st|nd|rd|th)\b", r"\1", s, flags=re.IGNORECASE)
+    return _ORDINAL_RE.sub(r"\1", s)
+
+
+# "February 10, 2026" / "Feb. 10 2026" / "2/10/2026" / "2026-02-10", matched in
+# one pass instead of trying strptime formats until one stops raising.
+_DATE_RE = re.compile(
+    r"^(?:(?P<mname>[A-Za-z]+)\.?\s+(?P<d1>\d{1,2}),?\s+(?P<y1>\d{4})"
+    r"|(?P<m2>\d{1,2})/(?P<d2>\d{1,2})/(?P<y2>\d{4})"
+    r"|(?P<y3>\d{4})-(?P<m3>\d{1,2})-(?P<d3>\d{1,2}))$"
+)
+_MONTHS: dict[str, int] = {
+    name: i
+    for i, names in enumerate(
+        [
+            ("january", "jan"),
+            ("february", "feb"),
+            ("march", "mar"),
+            ("april", "apr"),
+            ("may",),
+            ("june", "jun"),
+            ("july", "jul"),
+            ("august", "aug"),
+            ("september", "sep", "sept"),
+            ("october", "oct"),
+            ("november", "nov"),
+            ("december", "dec"),
+        ],
+        start=1,
+    )
+    for name in names
+}
 
 
 def _parse_date(s: str) -> datetime | None:
-    raw = re.sub(r"\s+", " ", (s or "").strip())
+    # The patterns below accept any run of whitespace, so no collapse pass.
+    raw = (s or "").strip()
     if not raw:
         return None
     if raw.lower() in {"tbd", "to be determined"}:
         return None
 
-    raw = re.sub(
-        r"^(monday|tuesday|wednesday|thursday|friday|saturday|sunday),\s+",
-        "",
-        raw,
-        flags=re.IGNORECASE,
-    )
+    raw = _WEEKDAY_PREFIX_RE.sub("", raw)
     raw = _strip_ordinal_suffixes(raw)
 
-    # Common month abbreviations with trailing dots (e.g., "Feb. 10, 2026")
-    raw = raw.replace("Sept.", "Sep.")
-
-    candidates = [
-        "%B %d, %Y",
-        "%b %d, %Y",
-        "%B %d %Y",
-        "%b %d %Y",
-        "%m/%d/%Y",
-        "%Y-%m-%d",
-    ]
-    for fmt in candidates:
-        try:
-            return datetime.strptime(raw, fmt)
-        except ValueError:
-            continue
-    return None
+    m = _DATE_RE.match(raw)
+    if not m:
+        return None
+    if m.group("mname"):
+        month = _MONTHS.get(m.group("mname").lower())
+        day, year = m.group("d1"), m.group("y1")
+    elif m.group("m2"):
+        month, day, year = m.group("m2"), m.group("d2"), m.group("y2")
+    else:
+        month, day, year = m.group("m3"), m.group("d3"), m.group("y3")
+    if month is None:
+        return None
+    try:
+        return datetime(int(year), int(month), int(day))
+    except ValueError:  # e.g. "February 30, 2026"
+        return None
 
 
 _TIME_RE = re.compile(
-    r"(?P<h>\d{1,2})(?::(?P<m>\d{2}))?\s*(?P<ampm>a\.?m\.?|p\.?m\.?|am|pm)\b",
+    r"(?P<h>\d{1,2})(?:\s*:\s*(?P<m>\d{2}))?\s*(?P<ampm>a\.?m\.?|p\.?m\.?|am|pm)\b",
     flags=re.IGNORECASE,
 )
 
 
 def _parse_time(s: str) -> tuple[int, int] | None:
-    raw = re.sub(r"\s+", " ", (s or "").strip())
-    if not raw:
-        return None
-    m = _TIME_RE.search(raw)
+    m = _TIME_RE.search(s or "")
     if not m:
         return None
     hour = int(m.group("h"))
@@ -183,7 +228,7 @@ class _HTMLTableExtractor(HTMLParser):
 
     def handle_endtag(self, tag):
         if self._table_depth >= 1 and tag in {"td", "th"} and self._in_cell and self._current_row is not None:
-            text = re.sub(r"\s+", " ", "".join(self._cell_parts)).strip()
+            text = " ".join("".join(self._cell_parts).split())
             self._current_row.append(text)
             self._in_cell = False
             self._cell_parts = []
@@ -205,34 +250,66 @@ class _HTMLTableExtractor(HTMLParser):
             self._cell_parts.append(data)
 
 
+def _extract_tables_lxml(html: str) -> list[list[list[str]]]:
+    try:
+        doc = lxml_html.fromstring(html)
+    except Exception:  # lxml rejects empty/whitespace-only documents
+        return []
+    tables: list[list[list[str]]] = []
+    # Top-level tables only, and only their own rows (not rows of nested tables),
+    # mirroring `_HTMLTableExtractor`.
+    for table in doc.xpath("//table[not(ancestor::table)]"):
+        rows = []
+        for row in table.xpath(".//tr[count(ancestor::table) = 1]"):
+            cells = [" ".join(cell.text_content().split()) for cell in row.xpath("./td|./th")]
+            if any(cells):
+                rows.append(cells)
+        if rows:
+            tables.append(rows)
+    return tables
+
+
 def extract_tables(html: str) -> list[list[list[str]]]:
+    if lxml_html is not None:
+        return _extract_tables_lxml(html or "")
     parser = _HTMLTableExtractor()
     parser.feed(html or "")
     return parser.tables
 
 
+def _find_date_time_columns(headers: list[str]) -> tuple[int | None, int | None]:
+    date_idx = None
+    time_idx = None
+    for i, h in enumerate(headers):
+        if date_idx is None and ("release date" in h or h == "date"):
+            date_idx = i
+        if time_idx is None and ("release time" in h or h == "time"):
+            time_idx = i
+        if date_idx is not None and time_idx is not None:
+            break
+
+    # Some pages omit "Release" and just use "Date" / "Time"
+    if date_idx is not None and time_idx is None:
+        for i, h in enumerate(headers):
+            if h.endswith("time"):
+                time_idx = i
+                break
+    return date_idx, time_idx
+
+
 def _select_schedule_table(tables: list[list[list[str]]]) -> tuple[list[list[str]], int, int] | None:
     """Return (table, date_col_idx, time_col_idx) for the most likely schedule table."""
     for table in tables:
         if not table:
             continue
         header = table[0]
-        norms = [_normalize_header(h) for h in header]
-
-        date_idx = None
-        time_idx = None
-        for i, h in enumerate(norms):
-            if date_idx is None and ("release date" in h or h == "release date" or h == "date"):
-                date_idx = i
-            if time_idx is None and ("release time" in h or h == "release time" or h == "time"):
-                time_idx = i
 
-        # Some pages omit "Release" and just use "Date" / "Time"
-        if date_idx is not None and time_idx is None:
-            for i, h in enumerate(norms):
-                if h.endswith("time") or h == "time":
-                    time_idx = i
-                    break
+        # Extracted cells are already whitespace-collapsed, so lowercasing finds
+        # the usual "Release Date" / "Release Time" headers; only fall back to
+        # the full punctuation-stripping normalization when that misses.
+        date_idx, time_idx = _find_date_time_columns([h.lower() for h in header])
+        if date_idx is None or time_idx is None:
+            date_idx, time_idx = _find_date_time_columns([_normalize_header(h) for h in header])
 
         if date_idx is not None and time_idx is not None:
             return table, date_idx, time_idx
@@ -248,14 +325,35 @@ def parse_schedule_html(
     schedule_tz: str | None = None,
 ) -> list[dict[str, Any]]:
     """Parse one BLS schedule page into scheduled release events."""
+    return [
+        event
+        for _, event in _iter_schedule_events(
+            html,
+            series_id=series_id,
+            release=release,
+            url=url,
+            schedule_tz=schedule_tz,
+        )
+    ]
+
+
+def _iter_schedule_events(
+    html: str,
+    *,
+    series_id: str,
+    release: str,
+    url: str,
+    schedule_tz: str | None,
+) -> Iterator[tuple[datetime, dict[str, Any]]]:
+    """Yield (scheduled UTC datetime, event) pairs so callers can filter without re-parsing."""
     tz = _get_tz(schedule_tz)
+    tz_name = getattr(tz, "key", str(tz))
     tables = extract_tables(html)
     selected = _select_schedule_table(tables)
     if not selected:
-        return []
+        return
     table, date_idx, time_idx = selected
 
-    out: list[dict[str, Any]] = []
     for row in table[1:]:
         if date_idx >= len(row):
             continue
@@ -276,20 +374,76 @@ def parse_schedule_html(
             minute,
             tzinfo=tz,
         )
+        utc_dt = local_dt.astimezone(timezone.utc)
 
-        out.append({
+        yield utc_dt, {
             "series": series_id,
             "release": release,
             "url": url,
-            "scheduled_time": _to_utc_iso(local_dt),
+            "scheduled_time": _to_utc_iso(utc_dt),
             "scheduled_time_local": local_dt.isoformat(),
-            "time_zone": getattr(tz, "key", str(tz)),
-        })
-    return out
+            "time_zone": tz_name,
+        }
+
+
+# Schedule pages change only when BLS publishes a new calendar, so bodies are
+# cached on disk: reused outright within the TTL, then revalidated with a
+# conditional GET (ETag / Last-Modified) so an unchanged page costs a 304.
+SCHEDULE_CACHE_TTL_SECONDS = 6 * 3600
+
+
+def _schedule_cache_path(url: str) -> Path:
+    root = os.environ.get("BLS_SCHEDULE_CACHE_DIR") or Path.home() / ".cache" / "fomc-agent" / "bls-schedule"
+    return Path(root) / f"{hashlib.sha256(url.encode('utf-8')).hexdigest()}.json"
+
+
+def _read_schedule_cache(path: Path) -> dict[str, Any] | None:
+    try:
+        entry = json_codec.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+    return entry if isinstance(entry, dict) and isinstance(entry.get("body"), str) else None
+
+
+def _write_schedule_cache(path: Path, entry: dict[str, Any]) -> None:
+    # Best effort: a read-only home (e.g. Lambda) just means no caching.
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(json_codec.dumps(entry))
+    except OSError:
+        pass
 
 
+# Not memoized in memory: the disk cache's TTL and conditional revalidation
+# decide freshness. `load_scheduled_releases` fetches each page once per run.
 def fetch_schedule_html(url: str) -> str:
-    return fetch_text(url, headers={"User-Agent": USER_AGENT}, timeout=30, retries=3)
+    path = _schedule_cache_path(url)
+    cached = _read_schedule_cache(path)
+    now = time.time()
+    if cached is not None and now - float(cached.get("fetched_at") or 0) < SCHEDULE_CACHE_TTL_SECONDS:
+        return cached["body"]
+
+    body, etag, last_modified = fetch_bytes_conditional(
+        url,
+        etag=cached.get("etag") if cached else None,
+        last_modified=cached.get("last_modified") if cached else None,
+        headers={"User-Agent": USER_AGENT},
+        timeout=30,
+        retries=3,
+    )
+    if body is None and cached is not None:
+        html = cached["body"]
+    else:
+        html = (body or b"").decode("utf-8", errors="replace")
+
+    _write_schedule_cache(path, {
+        "url": url,
+        "body": html,
+        "etag": etag,
+        "last_modified": last_modified,
+        "fetched_at": now,
+    })
+    return html
 
 
 def _parse_schedule_overrides(raw: str | None) -> dict[str, ScheduleSource]:
@@ -369,49 +523,37 @@ def load_scheduled_releases(
 ) -> list[dict[str, Any]]:
     """Load scheduled releases for the window [start, end]."""
     sources = get_schedule_sources(series_list)
-    scheduled: list[dict[str, Any]] = []
 
+    start_utc = start.astimezone(timezone.utc) if start.tzinfo else start.replace(tzinfo=timezone.utc)
+    end_utc = end.astimezone(timezone.utc) if end.tzinfo else end.replace(tzinfo=timezone.utc)
+
+    # Fetch each distinct page once (e.g. `ce` and `ln` share empsit.htm) and
+    # overlap the round trips; parsing stays on this thread in series order.
+    urls = list(dict.fromkeys(src.url for src in sources.values()))
+    pages: dict[str, Future[str]] = {}
+    if urls:
+        with ThreadPoolExecutor(max_workers=min(8, len(urls))) as ex:
+            pages = {url: ex.submit(fetch_schedule_html, url) for url in urls}
+
+    # Filter to the window on the parsed datetimes rather than re-parsing
+    # each event's ISO string.
+    filtered: list[dict[str, Any]] = []
     for series_id, src in sources.items():
         try:
-            html = fetch_schedule_html(src.url)
+            html = pages[src.url].result()
         except Exception:
             continue
-        scheduled.extend(
-            parse_schedule_html(
+        filtered.extend(
+            event
+            for utc_dt, event in _iter_schedule_events(
                 html,
                 series_id=series_id,
                 release=src.release,
                 url=src.url,
                 schedule_tz=schedule_tz,
             )
+            if start_utc <= utc_dt <= end_utc
         )
 
-    # Filter to window.
-    start_utc = start.astimezone(timezone.utc) if start.tzinfo else start.replace(tzinfo=timezone.utc)
-    end_utc = end.astimezone(timezone.utc) if end.tzinfo else end.replace(tzinfo=timezone.utc)
-
-    def _parse(dt_str: str | None) -> datetime | None:
-        if not dt_str:
-            return None
-        raw = dt_str.strip()
-        if raw.endswith("Z"):
-            raw = raw[:-1] + "+00:00"
-        try:
-            dt = datetime.fromisoformat(raw)
-        except ValueError:
-            return None
-        if dt.tzinfo is None:
-            return dt.replace(tzinfo=timezone.utc)
-        return dt.astimezone(timezone.utc)
-
-    filtered: list[dict[str, Any]] = []
-    for e in scheduled:
-        dt = _parse(e.get("scheduled_time"))
-        if dt is None:
-            continue
-        if start_utc <= dt <= end_utc:
-            filtered.append(e)
-
-    filtered.sort(key=lambda r: r.get("scheduled_time", ""))
+    filtered.sort(key=itemgetter("scheduled_time"))
     return filtered
-
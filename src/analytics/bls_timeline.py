@@ -10,14 +10,18 @@ static site (or any UI) to render a change timeline.
 
 from __future__ import annotations
 
-import json
 import os
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache, partial
+from operator import itemgetter
 from pathlib import Path
 from typing import Any
 from zoneinfo import ZoneInfo
 
 from src.config import get_bls_bucket, get_bls_series_list
+from src.helpers import json_codec
 from src.helpers.aws_client import get_client
 from src.analytics.bls_release_schedule import load_scheduled_releases
 
@@ -25,6 +29,7 @@ CHANGE_ACTIONS = {"added", "updated", "deleted"}
 DEFAULT_BLS_SOURCE_TIMEZONE = "America/New_York"
 
 
+@lru_cache(maxsize=64)
 def _get_tz(name: str | None) -> timezone | ZoneInfo:
     tz_name = (name or "").strip() or "UTC"
     try:
@@ -41,10 +46,8 @@ def _parse_iso_datetime(value: str | None, *, default_tz: timezone | ZoneInfo) -
     if not raw:
         return None
 
-    # Python's fromisoformat doesn't accept "Z" (Zulu) suffix.
-    if raw.endswith("Z"):
-        raw = raw[:-1] + "+00:00"
-
+    # fromisoformat accepts the "Z" suffix on 3.11+ and returns the
+    # timezone.utc singleton for it, so UTC stamps skip the conversion.
     try:
         dt = datetime.fromisoformat(raw)
     except ValueError:
@@ -52,49 +55,64 @@ def _parse_iso_datetime(value: str | None, *, default_tz: timezone | ZoneInfo) -
 
     if dt.tzinfo is None:
         return dt.replace(tzinfo=default_tz)
+    if dt.tzinfo is timezone.utc:
+        return dt
     return dt.astimezone(timezone.utc)
 
 
 def _to_utc_iso(dt: datetime) -> str:
-    aware = dt if dt.tzinfo is not None else dt.replace(tzinfo=timezone.utc)
-    return aware.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    elif dt.tzinfo is not timezone.utc:
+        dt = dt.astimezone(timezone.utc)
+    # UTC isoformat() always ends in "+00:00"; swap just that suffix for "Z".
+    return dt.isoformat()[:-6] + "Z"
 
 
 def load_bls_change_events_from_s3(s3_client, bucket: str, series_id: str) -> list[dict[str, Any]]:
     """Read `_sync_state/<series>/sync_log.jsonl` and return change-only events."""
     key = f"_sync_state/{series_id}/sync_log.jsonl"
     try:
-        response = s3_client.get_object(Bucket=bucket, Key=key)
-        text = response["Body"].read().decode("utf-8", errors="replace")
+        body = s3_client.get_object(Bucket=bucket, Key=key)["Body"]
     except Exception:
         return []
 
     out: list[dict[str, Any]] = []
-    for line in text.splitlines():
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            rec = json.loads(line)
-        except Exception:
-            continue
-
-        action = rec.get("action")
-        if action not in CHANGE_ACTIONS:
-            continue
-
-        filename = rec.get("file")
-        if not filename:
-            continue
-
-        out.append({
-            "series": series_id,
-            "file": str(filename),
-            "action": str(action),
-            "source_modified": rec.get("source_modified"),
-            "observed_at": rec.get("timestamp"),
-            "bytes": rec.get("bytes"),
-        })
+    try:
+        # Stream the log and hand each line's bytes straight to the JSON parser
+        # instead of decoding and splitting the whole object up front.
+        for line in body.iter_lines():
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                rec = json_codec.loads(line)
+            except json_codec.JSONDecodeError:
+                continue
+            if not isinstance(rec, dict):
+                continue
+
+            action = rec.get("action")
+            if action not in CHANGE_ACTIONS:
+                continue
+
+            filename = rec.get("file")
+            if not filename:
+                continue
+
+            out.append({
+                "series": series_id,
+                "file": str(filename),
+                "action": str(action),
+                "source_modified": rec.get("source_modified"),
+                "observed_at": rec.get("timestamp"),
+                "bytes": rec.get("bytes"),
+            })
+    except Exception:
+        # The read failed part-way; treat it like an unreadable log.
+        return []
+    finally:
+        body.close()
     return out
 
 
@@ -123,7 +141,7 @@ def build_bls_change_timeline(
 
     bls_source_tz = _get_tz(os.environ.get("BLS_SOURCE_TIMEZONE", DEFAULT_BLS_SOURCE_TIMEZONE))
 
-    normalized: list[dict[str, Any]] = []
+    keyed: list[tuple[tuple[float, str, str, str], dict[str, Any]]] = []
     for e in events:
         # Source timestamps are derived from BLS directory listings and are shown in ET on bls.gov.
         source_dt = _parse_iso_datetime(e.get("source_modified"), default_tz=bls_source_tz)
@@ -140,23 +158,23 @@ def build_bls_change_timeline(
         except (TypeError, ValueError):
             bytes_int = None
 
-        normalized.append({
-            "series": str(e.get("series") or ""),
-            "file": str(e.get("file") or ""),
-            "action": str(e.get("action") or ""),
+        series = str(e.get("series") or "")
+        filename = str(e.get("file") or "")
+        action = str(e.get("action") or "")
+        # Newest first, then series/file/action for ties; keyed on the
+        # datetime already in hand rather than re-parsing `event_time`.
+        keyed.append(((-event_dt.timestamp(), series, filename, action), {
+            "series": series,
+            "file": filename,
+            "action": action,
             "event_time": _to_utc_iso(event_dt),
             "source_modified": _to_utc_iso(source_dt) if source_dt else None,
             "observed_at": _to_utc_iso(observed_dt) if observed_dt else None,
             "bytes": bytes_int,
-        })
+        }))
 
-    # Stable ordering: newest first, then series/file for ties.
-    normalized.sort(key=lambda r: (r.get("series", ""), r.get("file", ""), r.get("action", "")))
-    normalized.sort(
-        key=lambda r: _parse_iso_datetime(r.get("event_time"), default_tz=timezone.utc)
-        or datetime.min.replace(tzinfo=timezone.utc),
-        reverse=True,
-    )
+    keyed.sort(key=itemgetter(0))
+    normalized = [row for _, row in keyed]
 
     return {
         "generated_at": _to_utc_iso(now_utc),
@@ -166,9 +184,17 @@ def build_bls_change_timeline(
     }
 
 
-def _group_actual_series_times(events: list[dict[str, Any]]) -> dict[str, dict[str, dict[str, Any]]]:
-    """Group actual file change events by series + event_time (UTC ISO)."""
-    out: dict[str, dict[str, dict[str, Any]]] = {}
+# Per series: (parsed time, event_time ISO string, aggregate), sorted by time.
+_SeriesTimes = list[tuple[datetime, str, dict[str, Any]]]
+
+
+def _group_actual_series_times(events: list[dict[str, Any]]) -> dict[str, _SeriesTimes]:
+    """Group actual file change events by series + event_time (UTC ISO).
+
+    Each series' groups are returned sorted by time so `_match_release` can
+    bisect to its matching window instead of scanning every update.
+    """
+    grouped: dict[str, dict[str, dict[str, Any]]] = {}
     for e in events:
         action = e.get("action")
         if action not in {"added", "updated"}:
@@ -179,12 +205,22 @@ def _group_actual_series_times(events: list[dict[str, Any]]) -> dict[str, dict[s
         event_time = str(e.get("event_time") or "")
         if not event_time:
             continue
-        bucket = out.setdefault(series, {})
+        bucket = grouped.setdefault(series, {})
         agg = bucket.setdefault(event_time, {"files_changed": 0, "bytes_changed": 0})
         agg["files_changed"] += 1
         b = e.get("bytes")
         if isinstance(b, int) and b >= 0:
             agg["bytes_changed"] += b
+
+    out: dict[str, _SeriesTimes] = {}
+    for series, bucket in grouped.items():
+        times: _SeriesTimes = []
+        for event_time, agg in bucket.items():
+            dt = _parse_iso_datetime(event_time, default_tz=timezone.utc)
+            if dt is not None:
+                times.append((dt, event_time, agg))
+        times.sort(key=itemgetter(0))
+        out[series] = times
     return out
 
 
@@ -192,7 +228,7 @@ def _match_release(
     *,
     scheduled_time: str,
     series_id: str,
-    actual_by_series_time: dict[str, dict[str, dict[str, Any]]],
+    actual_by_series_time: dict[str, _SeriesTimes],
     early_minutes: int = 15,
     late_hours: int = 24,
 ) -> dict[str, Any] | None:
@@ -200,43 +236,31 @@ def _match_release(
     if scheduled_dt is None:
         return None
 
-    series_times = actual_by_series_time.get(series_id, {})
+    no_match = {
+        "actual_time": None,
+        "delay_minutes": None,
+        "actual_files_changed": 0,
+        "actual_bytes_changed": 0,
+    }
+    series_times = actual_by_series_time.get(series_id)
     if not series_times:
-        return {
-            "actual_time": None,
-            "delay_minutes": None,
-            "actual_files_changed": 0,
-            "actual_bytes_changed": 0,
-        }
+        return no_match
 
     early_margin = timedelta(minutes=max(0, early_minutes))
     late_margin = timedelta(hours=max(1, late_hours))
 
-    candidates: list[tuple[float, bool, str, dict[str, Any]]] = []
-    for actual_time, agg in series_times.items():
-        actual_dt = _parse_iso_datetime(actual_time, default_tz=timezone.utc)
-        if actual_dt is None:
-            continue
-        delta = actual_dt - scheduled_dt
-        if delta < -early_margin or delta > late_margin:
-            continue
-        seconds = delta.total_seconds()
-        candidates.append((abs(seconds), seconds < 0, actual_time, agg))
-
-    if not candidates:
-        return {
-            "actual_time": None,
-            "delay_minutes": None,
-            "actual_files_changed": 0,
-            "actual_bytes_changed": 0,
-        }
-
-    candidates.sort(key=lambda t: (t[0], t[1]))
-    best_abs, best_is_early, best_time, best_agg = candidates[0]
-
-    best_dt = _parse_iso_datetime(best_time, default_tz=timezone.utc)
-    if best_dt is None:
-        return None
+    # Only updates inside [scheduled - early, scheduled + late] can match.
+    lo = bisect_left(series_times, scheduled_dt - early_margin, key=itemgetter(0))
+    hi = bisect_right(series_times, scheduled_dt + late_margin, key=itemgetter(0))
+    if lo >= hi:
+        return no_match
+
+    # Closest update wins; on equal distance prefer the late one.
+    best_dt, best_time, best_agg = min(
+        series_times[lo:hi],
+        key=lambda t: (abs((t[0] - scheduled_dt).total_seconds()), t[0] < scheduled_dt),
+    )
+
     delay_minutes = round((best_dt - scheduled_dt).total_seconds() / 60.0, 1)
     return {
         "actual_time": best_time,
@@ -260,8 +284,9 @@ def build_release_timeline(
         scheduled_time = s.get("scheduled_time")
         if not series or not scheduled_time:
             continue
+        scheduled_time = str(scheduled_time)
         match = _match_release(
-            scheduled_time=str(scheduled_time),
+            scheduled_time=scheduled_time,
             series_id=series,
             actual_by_series_time=actual_by_series_time,
         )
@@ -271,13 +296,13 @@ def build_release_timeline(
             "series": series,
             "release": s.get("release"),
             "url": s.get("url"),
-            "scheduled_time": s.get("scheduled_time"),
+            "scheduled_time": scheduled_time,
             "scheduled_time_local": s.get("scheduled_time_local"),
             "time_zone": s.get("time_zone"),
             **match,
         })
 
-    out.sort(key=lambda r: r.get("scheduled_time", ""))
+    out.sort(key=itemgetter("scheduled_time"))
     return out
 
 
@@ -299,8 +324,12 @@ def export_bls_change_timeline(
 
     s3 = get_client("s3")
     all_events: list[dict[str, Any]] = []
-    for series_id in series_list:
-        all_events.extend(load_bls_change_events_from_s3(s3, bucket, series_id))
+    if series_list:
+        # One GetObject per series; the shared client is thread-safe, and
+        # map() keeps the per-series event order stable.
+        with ThreadPoolExecutor(max_workers=min(16, len(series_list))) as ex:
+            for events in ex.map(partial(load_bls_change_events_from_s3, s3, bucket), series_list):
+                all_events.extend(events)
 
     payload = build_bls_change_timeline(
         all_events,
@@ -336,7 +365,7 @@ def export_bls_change_timeline(
 
     path = Path(out_path)
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(payload, indent=2, default=str) + "\n", encoding="utf-8")
+    path.write_bytes(json_codec.dumps(payload, indent=True) + b"\n")
     return path.resolve()
 
 
@@ -7,39 +7,72 @@ heavy native dependencies like pandas.
 
 from __future__ import annotations
 
-import json
-from io import StringIO
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
+import numpy as np
 import pandas as pd
 
 from src.config import bls_data_key, get_bls_bucket, get_bls_key, get_datausa_bucket, get_datausa_key
+from src.helpers import json_codec
 from src.helpers.aws_client import get_client
 
+try:
+    import pyarrow as pa  # type: ignore
+    import pyarrow.compute as pa_compute  # type: ignore
+    from pyarrow import csv as pa_csv  # type: ignore
+except ImportError:  # pragma: no cover - exercised when pyarrow is absent
+    pa = pa_compute = pa_csv = None
 
-def _none_if_nan(value: Any):
-    if value is None:
-        return None
+
+def _json_records(df: pd.DataFrame, columns: list[str], *, round1: tuple[str, ...] = ()) -> list[dict[str, Any]]:
+    """Convert `columns` of `df` to JSON-ready records in one vectorized pass.
+
+    `year` becomes int, `round1` columns are rounded to one decimal, and
+    NaN/NA become None.
+    """
+    df = df[columns]
+    if round1:
+        df = df.assign(**{c: pd.to_numeric(df[c], errors="coerce").round(1) for c in round1})
+    out = df.astype(object).where(df.notna(), None)
+    out["year"] = df["year"].astype("int64")
+    return out.to_dict("records")
+
+
+def _get_s3_json(s3_client, bucket: str, key: str) -> Any:
+    """Fetch and decode a JSON object, closing the body once it is read."""
+    body = s3_client.get_object(Bucket=bucket, Key=key)["Body"]
     try:
-        # pandas uses numpy.nan for missing values
-        if pd.isna(value):
-            return None
-    except Exception:
-        pass
-    return value
+        return json_codec.loads(body.read())
+    finally:
+        body.close()
+
+
+# Years covered by report 1.
+POPULATION_STATS_YEARS = (2013, 2018)
+
 
+def load_population_from_s3(
+    bucket: str | None = None,
+    key: str | None = None,
+    *,
+    year_range: tuple[int, int] | None = None,
+) -> pd.DataFrame:
+    """Load DataUSA population JSON from S3 into a DataFrame.
 
-def load_population_from_s3(bucket: str | None = None, key: str | None = None) -> pd.DataFrame:
-    """Load DataUSA population JSON from S3 into a DataFrame."""
+    With `year_range` (inclusive), rows outside it are dropped right after the
+    year is parsed, before the remaining columns are converted.
+    """
     if bucket is None:
         bucket = get_datausa_bucket()
     if key is None:
         key = get_datausa_key()
 
-    s3 = get_client("s3")
-    response = s3.get_object(Bucket=bucket, Key=key)
-    payload = json.loads(response["Body"].read())
+    payload = _get_s3_json(get_client("s3"), bucket, key)
 
     df = pd.DataFrame(payload.get("data", []))
     if df.empty:
@@ -48,6 +81,8 @@ def load_population_from_s3(bucket: str | None = None, key: str | None = None) -
     keep = [c for c in ["Year", "Nation", "Population"] if c in df.columns]
     df = df[keep].copy()
     df["Year"] = pd.to_numeric(df.get("Year"), errors="coerce").astype("Int64")
+    if year_range is not None:
+        df = df[df["Year"].between(*year_range)].copy()
     df["Population"] = pd.to_numeric(df.get("Population"), errors="coerce").astype("Int64")
     if "Nation" in df.columns:
         df["Nation"] = df["Nation"].astype(str).str.strip()
@@ -55,22 +90,80 @@ def load_population_from_s3(bucket: str | None = None, key: str | None = None) -
     return df.dropna(subset=["Year", "Population"]).reset_index(drop=True)
 
 
+# Nation filter columns survive projection even though two of them are IDs.
+_NATION_FILTER_COLUMNS = frozenset({"Nation ID", "ID Nation", "Nation"})
+
+
+def _is_datausa_measure_candidate(column: str) -> bool:
+    """Keep nation filters and non-ID columns; drop `* ID`, `ID *` and `Slug *` columns."""
+    if column in _NATION_FILTER_COLUMNS:
+        return True
+    lowered = column.lower()
+    return not (lowered.endswith(" id") or lowered.startswith(("id ", "slug ")))
+
+
 def load_datausa_jsonrecords_from_s3(
     *,
     bucket: str,
     key: str,
+    usecols: Callable[[str], bool] | None = None,
 ) -> pd.DataFrame:
-    """Load a DataUSA JSONRecords payload (tesseract/data.jsonrecords) into a DataFrame."""
-    s3 = get_client("s3")
-    response = s3.get_object(Bucket=bucket, Key=key)
-    payload = json.loads(response["Body"].read())
+    """Load a DataUSA JSONRecords payload (tesseract/data.jsonrecords) into a DataFrame.
+
+    `usecols` is called with each (stripped) column name; only columns it
+    accepts are built, so wide cubes never materialize unused columns.
+    """
+    payload = _get_s3_json(get_client("s3"), bucket, key)
     rows = payload.get("data", []) if isinstance(payload, dict) else []
-    df = pd.DataFrame(rows)
+    columns = None
+    if usecols is not None and rows and isinstance(rows[0], dict):
+        # JSONRecords rows share one key set, so the first row names them all.
+        columns = [c for c in rows[0] if usecols(str(c).strip())]
+    df = pd.DataFrame(rows, columns=columns)
     if df.empty:
         return df
     df.columns = df.columns.astype(str).str.strip()
     return df
 
+
+def _read_bls_tsv_arrow(body) -> pd.DataFrame:
+    """Parse a BLS tab-delimited stream with pyarrow, block by block as it is read.
+
+    Arrow tokenizes in C++ and infers numeric columns; only string columns
+    need trimming. Raises `pa.ArrowInvalid` on rows that omit trailing fields
+    (e.g. an empty footnote_codes without its tab).
+    """
+    table = pa_csv.read_csv(
+        pa.PythonFile(body, mode="r"),
+        parse_options=pa_csv.ParseOptions(delimiter="\t"),
+        convert_options=pa_csv.ConvertOptions(strings_can_be_null=True),
+    )
+    columns = [
+        pa_compute.utf8_trim_whitespace(col) if pa.types.is_string(col.type) else col
+        for col in table.columns
+    ]
+    return pa.table(columns, names=[name.strip() for name in table.column_names]).to_pandas()
+
+
+def _read_bls_tsv(body) -> pd.DataFrame:
+    """Parse a BLS tab-delimited stream with pandas, trimming the padded headers and cells."""
+    df = pd.read_csv(body, sep="\t", dtype=str, encoding="utf-8")
+    df.columns = df.columns.str.strip()
+    # `year` / `value` are cast by the caller, and to_numeric ignores padding.
+    for col in df.columns.difference(["year", "value"], sort=False):
+        df[col] = df[col].str.strip()
+    return df
+
+
+def _read_s3_body(s3_client, bucket: str, key: str, reader: Callable[[Any], pd.DataFrame]) -> pd.DataFrame:
+    """Stream an object's body through `reader`, closing it afterwards."""
+    body = s3_client.get_object(Bucket=bucket, Key=key)["Body"]
+    try:
+        return reader(body)
+    finally:
+        body.close()
+
+
 def load_bls_from_s3(bucket: str | None = None, key: str | None = None) -> pd.DataFrame:
     """Load BLS tab-delimited file from S3 into a DataFrame."""
     if bucket is None:
@@ -79,13 +172,22 @@ def load_bls_from_s3(bucket: str | None = None, key: str | None = None) -> pd.Da
         key = get_bls_key()
 
     s3 = get_client("s3")
-    response = s3.get_object(Bucket=bucket, Key=key)
-    content = response["Body"].read().decode("utf-8")
-
-    df = pd.read_csv(StringIO(content), sep="\t", dtype=str)
-    df.columns = df.columns.str.strip()
-    for col in df.columns:
-        df[col] = df[col].astype(str).str.strip()
+    df = None
+    if pa_csv is not None:
+        try:
+            df = _read_s3_body(s3, bucket, key, _read_bls_tsv_arrow)
+        except pa.ArrowInvalid:
+            # The stream is spent; re-read the object with pandas, which pads
+            # short rows with NaN.
+            df = None
+    if df is None:
+        df = _read_s3_body(s3, bucket, key, _read_bls_tsv)
+
+    # BLS files repeat a few hundred series/period labels across every row;
+    # as categoricals, filters and groupbys compare integer codes.
+    for col in ("series_id", "period"):
+        if col in df.columns:
+            df[col] = df[col].astype("category")
 
     # Cast numeric columns
     if "year" in df.columns:
@@ -96,20 +198,102 @@ def load_bls_from_s3(bucket: str | None = None, key: str | None = None) -> pd.Da
     return df
 
 
-def _annualize_bls_monthly_series(bls_df: pd.DataFrame, *, series_id: str) -> pd.DataFrame:
+_BLS_INDEX = ["series_id", "period"]
+
+
+def _strip_labels(labels: pd.Series) -> pd.Series:
+    """Strip label strings; categorical columns are stripped per category, not per row."""
+    if isinstance(labels.dtype, pd.CategoricalDtype):
+        categories = labels.cat.categories.astype(str).str.strip()
+        if categories.is_unique:
+            return labels.cat.rename_categories(categories)
+    return labels.astype(str).str.strip()
+
+
+def _per_label(labels: pd.Series, fn: Callable[[pd.Index], Any], missing: Any) -> np.ndarray:
+    """Evaluate `fn` once per distinct label and broadcast the result to every row.
+
+    BLS periods and DataUSA statuses repeat a handful of labels, so string
+    work runs on the category table instead of each row. Rows with a missing
+    label get `missing`.
+    """
+    labels = labels.astype("category")
+    per_category = np.asarray(fn(labels.cat.categories.astype(str)))
+    # Code -1 (missing label) picks the trailing `missing` slot.
+    return np.append(per_category, missing)[labels.cat.codes.to_numpy()]
+
+
+# DataUSA nation filters in order of preference: (column, national label).
+_NATION_FILTERS = (("Nation ID", "01000US"), ("ID Nation", "01000US"), ("Nation", "United States"))
+
+
+def _national_rows(df: pd.DataFrame) -> pd.DataFrame:
+    """Restrict a DataUSA frame to its national rows, if it has a nation column.
+
+    Cubes can carry every state for every year, so the label is stripped once
+    per distinct value and the frame is sliced before any other row work.
+    """
+    for column, national in _NATION_FILTERS:
+        if column in df.columns:
+            keep = _per_label(df[column], lambda labels: labels.str.strip() == national, False)
+            return df[keep.astype(bool)].copy()
+    return df
+
+
+def _index_bls_by_series(bls_df: pd.DataFrame) -> pd.DataFrame:
+    """Index a BLS frame by stripped (series_id, period) for repeated lookups.
+
+    The series helpers accept either form; indexing once up front turns each
+    lookup into an index probe instead of a scan. Indexed frames (and frames
+    without those columns) pass through.
+    """
+    if list(bls_df.index.names) == _BLS_INDEX or not set(_BLS_INDEX).issubset(bls_df.columns):
+        return bls_df
+    return (
+        bls_df.assign(
+            series_id=_strip_labels(bls_df["series_id"]),
+            period=_strip_labels(bls_df["period"]),
+        )
+        .set_index(_BLS_INDEX)
+        .sort_index()
+    )
+
+
+def _select_bls_rows(bls_df: pd.DataFrame, series_id: str, period: str | None = None) -> pd.DataFrame | None:
+    """Return a copy of one series' rows (optionally one period) with `period` as a column.
+
+    Returns None when `bls_df` is missing the BLS columns.
+    """
+    series_id = series_id.strip()
+    period = period.strip() if period is not None else None
+    if list(bls_df.index.names) == _BLS_INDEX:
+        if bls_df.empty or not {"year", "value"}.issubset(set(bls_df.columns)):
+            return None
+        key = series_id if period is None else [(series_id, period)]
+        try:
+            return bls_df.loc[key].reset_index()
+        except KeyError:
+            return bls_df.iloc[0:0].reset_index()
+
     required = {"series_id", "year", "period", "value"}
     if bls_df.empty or not required.issubset(set(bls_df.columns)):
-        return pd.DataFrame(columns=["year", "value"])
+        return None
+    # A one-off lookup on a raw frame: scan once and copy only the matches.
+    mask = _strip_labels(bls_df["series_id"]) == series_id
+    df = bls_df.loc[mask, ["year", "period", "value"]].copy()
+    df["period"] = _strip_labels(df["period"])
+    if period is not None:
+        df = df[df["period"] == period]
+    return df
 
-    df = bls_df.copy()
-    df["series_id"] = df["series_id"].astype(str).str.strip()
-    df = df[df["series_id"] == series_id.strip()]
-    if df.empty:
+
+def _annualize_bls_monthly_series(bls_df: pd.DataFrame, *, series_id: str) -> pd.DataFrame:
+    df = _select_bls_rows(bls_df, series_id)
+    if df is None or df.empty:
         return pd.DataFrame(columns=["year", "value"])
 
     df["year"] = pd.to_numeric(df["year"], errors="coerce")
     df["value"] = pd.to_numeric(df["value"], errors="coerce")
-    df["period"] = df["period"].astype(str).str.strip()
     df = df.dropna(subset=["year", "value"])
     if df.empty:
         return pd.DataFrame(columns=["year", "value"])
@@ -122,7 +306,7 @@ def _annualize_bls_monthly_series(bls_df: pd.DataFrame, *, series_id: str) -> pd
         return out.sort_values("year").reset_index(drop=True)
 
     # Otherwise: average M01..M12.
-    df["month"] = pd.to_numeric(df["period"].str[1:], errors="coerce")
+    df["month"] = _per_label(df["period"], lambda p: pd.to_numeric(p.str[1:], errors="coerce"), np.nan)
     df = df[df["month"].between(1, 12, inclusive="both")]
     if df.empty:
         return pd.DataFrame(columns=["year", "value"])
@@ -137,12 +321,20 @@ def _infer_numeric_measure_column(df: pd.DataFrame, *, exclude: set[str]) -> str
         return None
     candidates = [c for c in df.columns if c not in exclude]
     for c in candidates:
-        try:
-            s = pd.to_numeric(df[c], errors="coerce")
-        except Exception:
+        col = df[c]
+        # JSON numbers already arrive as a numeric dtype: no conversion needed.
+        if pd.api.types.is_numeric_dtype(col):
+            if col.notna().any():
+                return c
             continue
-        if s.notna().any():
-            return c
+        # Otherwise probe a few values before coercing the whole column.
+        values = col.dropna()
+        for chunk in (values.head(16), values.iloc[16:]):
+            try:
+                if pd.to_numeric(chunk, errors="coerce").notna().any():
+                    return c
+            except Exception:
+                break
     return None
 
 
@@ -151,15 +343,20 @@ def build_unemployment_vs_commute_time(
     bls_bucket: str,
     datausa_bucket: str,
     ln_key: str | None = None,
+    ln_df: pd.DataFrame | None = None,
     commute_key: str = "commute_time.json",
     unemployment_series_id: str = "LNS14000000",
 ) -> dict[str, Any]:
-    """Curated dataset: annual unemployment rate vs mean commute time (nation)."""
+    """Curated dataset: annual unemployment rate vs mean commute time (nation).
+
+    Pass `ln_df` to reuse an LN frame already loaded for another builder.
+    """
     if ln_key is None:
         ln_key = bls_data_key("ln", "ln.data.0.Current")
 
     try:
-        ln_df = load_bls_from_s3(bucket=bls_bucket, key=ln_key)
+        if ln_df is None:
+            ln_df = load_bls_from_s3(bucket=bls_bucket, key=ln_key)
         unemp = _annualize_bls_monthly_series(ln_df, series_id=unemployment_series_id).rename(
             columns={"value": "unemployment_rate"}
         )
@@ -173,16 +370,15 @@ def build_unemployment_vs_commute_time(
         }
 
     try:
-        commute_df = load_datausa_jsonrecords_from_s3(bucket=datausa_bucket, key=commute_key)
+        commute_df = load_datausa_jsonrecords_from_s3(
+            bucket=datausa_bucket,
+            key=commute_key,
+            usecols=_is_datausa_measure_candidate,
+        )
         if commute_df.empty:
             raise ValueError("empty commute dataset")
         # DataUSA cubes often include many geographies; restrict to national where possible.
-        if "Nation ID" in commute_df.columns:
-            commute_df = commute_df[commute_df["Nation ID"].astype(str).str.strip() == "01000US"].copy()
-        elif "ID Nation" in commute_df.columns:
-            commute_df = commute_df[commute_df["ID Nation"].astype(str).str.strip() == "01000US"].copy()
-        elif "Nation" in commute_df.columns:
-            commute_df = commute_df[commute_df["Nation"].astype(str).str.strip() == "United States"].copy()
+        commute_df = _national_rows(commute_df)
         if commute_df.empty:
             raise ValueError("no national rows in commute dataset")
         commute_df["Year"] = pd.to_numeric(commute_df.get("Year"), errors="coerce").astype("Int64")
@@ -207,13 +403,7 @@ def build_unemployment_vs_commute_time(
         }
 
     joined = unemp.merge(commute, on="year", how="inner").sort_values("year").reset_index(drop=True)
-    points = []
-    for r in joined.to_dict("records"):
-        points.append({
-            "year": int(r["year"]),
-            "unemployment_rate": _none_if_nan(r.get("unemployment_rate")),
-            "mean_commute_minutes": _none_if_nan(r.get("mean_commute_minutes")),
-        })
+    points = _json_records(joined, ["year", "unemployment_rate", "mean_commute_minutes"])
 
     return {
         "title": "Unemployment vs Commute Time (Nation)",
@@ -232,15 +422,20 @@ def build_participation_vs_noncitizen_share(
     bls_bucket: str,
     datausa_bucket: str,
     ln_key: str | None = None,
+    ln_df: pd.DataFrame | None = None,
     citizenship_key: str = "citizenship.json",
     participation_series_id: str = "LNS11300000",
 ) -> dict[str, Any]:
-    """Curated dataset: labor force participation vs non-citizen share (nation)."""
+    """Curated dataset: labor force participation vs non-citizen share (nation).
+
+    Pass `ln_df` to reuse an LN frame already loaded for another builder.
+    """
     if ln_key is None:
         ln_key = bls_data_key("ln", "ln.data.0.Current")
 
     try:
-        ln_df = load_bls_from_s3(bucket=bls_bucket, key=ln_key)
+        if ln_df is None:
+            ln_df = load_bls_from_s3(bucket=bls_bucket, key=ln_key)
         part = _annualize_bls_monthly_series(ln_df, series_id=participation_series_id).rename(
             columns={"value": "participation_rate"}
         )
@@ -254,18 +449,17 @@ def build_participation_vs_noncitizen_share(
         }
 
     try:
-        cit_df = load_datausa_jsonrecords_from_s3(bucket=datausa_bucket, key=citizenship_key)
+        cit_df = load_datausa_jsonrecords_from_s3(
+            bucket=datausa_bucket,
+            key=citizenship_key,
+            usecols=lambda c: _is_datausa_measure_candidate(c) or "citizenship" in c.lower(),
+        )
         if cit_df.empty:
             raise ValueError("empty citizenship dataset")
 
         cit_df.columns = cit_df.columns.astype(str).str.strip()
         # Restrict to national where possible (some cubes include multiple geographies).
-        if "Nation ID" in cit_df.columns:
-            cit_df = cit_df[cit_df["Nation ID"].astype(str).str.strip() == "01000US"].copy()
-        elif "ID Nation" in cit_df.columns:
-            cit_df = cit_df[cit_df["ID Nation"].astype(str).str.strip() == "01000US"].copy()
-        elif "Nation" in cit_df.columns:
-            cit_df = cit_df[cit_df["Nation"].astype(str).str.strip() == "United States"].copy()
+        cit_df = _national_rows(cit_df)
         if cit_df.empty:
             raise ValueError("no national rows in citizenship dataset")
         year_col = "Year" if "Year" in cit_df.columns else None
@@ -297,25 +491,22 @@ def build_participation_vs_noncitizen_share(
         cit_df[year_col] = pd.to_numeric(cit_df[year_col], errors="coerce").astype("Int64")
         cit_df[pop_col] = pd.to_numeric(cit_df[pop_col], errors="coerce")
 
-        total = cit_df.dropna(subset=[year_col, pop_col]).groupby(year_col, as_index=False)[pop_col].sum()
-        total = total.rename(columns={year_col: "year", pop_col: "total_population"})
-
-        status = cit_df[status_col].astype(str)
-        mask = status.str.contains("not", case=False, na=False) | status.str.contains("non", case=False, na=False)
-        noncit = (
-            cit_df[mask]
-            .dropna(subset=[year_col, pop_col])
-            .groupby(year_col, as_index=False)[pop_col]
+        rows = cit_df.dropna(subset=[year_col, pop_col])
+        is_noncit = pd.Series(
+            _per_label(rows[status_col], lambda s: s.str.contains("no[nt]", case=False, regex=True), False),
+            index=rows.index,
+        )
+        # One groupby pass: population per year, split by non-citizen status.
+        by_status = (
+            rows.groupby([rows[year_col], is_noncit])[pop_col]
             .sum()
-            .rename(columns={year_col: "year", pop_col: "noncitizen_population"})
+            .unstack(fill_value=0)
+            .reindex(columns=[False, True], fill_value=0)
         )
-
-        merged = total.merge(noncit, on="year", how="left")
-        merged["noncitizen_population"] = merged["noncitizen_population"].fillna(0)
-        merged["noncitizen_share"] = (merged["noncitizen_population"] / merged["total_population"]) * 100.0
-        merged = merged.dropna(subset=["year"]).copy()
-        merged["year"] = merged["year"].astype(int)
-        noncit_share = merged[["year", "noncitizen_share"]].copy()
+        noncit_share = pd.DataFrame({
+            "year": by_status.index.astype(int),
+            "noncitizen_share": (by_status[True] / by_status.sum(axis=1) * 100.0).to_numpy(),
+        })
     except Exception as exc:
         return {
             "title": "Participation vs Non-Citizen Share",
@@ -326,13 +517,7 @@ def build_participation_vs_noncitizen_share(
         }
 
     joined = part.merge(noncit_share, on="year", how="inner").sort_values("year").reset_index(drop=True)
-    points = []
-    for r in joined.to_dict("records"):
-        points.append({
-            "year": int(r["year"]),
-            "participation_rate": _none_if_nan(r.get("participation_rate")),
-            "noncitizen_share": _none_if_nan(r.get("noncitizen_share")),
-        })
+    points = _json_records(joined, ["year", "participation_rate", "noncitizen_share"])
 
     return {
         "title": "Labor Force Participation vs Non-Citizen Share (Nation)",
@@ -346,53 +531,49 @@ def build_participation_vs_noncitizen_share(
     }
 
 
+def _empty_year_series() -> pd.DataFrame:
+    return pd.DataFrame({"value": pd.Series(dtype=float)}, index=pd.Index([], dtype="int64", name="year"))
+
+
 def _pr_index_series(
     bls_df: pd.DataFrame,
     *,
     series_id: str,
     period: str = "Q05",
 ) -> pd.DataFrame:
-    """Extract a single PR series as a year/value DataFrame.
+    """Extract a single PR series as a `value` DataFrame indexed by sorted `year`.
 
-    PR uses periods Q01..Q04 (quarters) and Q05 (annual average).
+    PR uses periods Q01..Q04 (quarters) and Q05 (annual average). The year
+    index lets the chart builders join two series without a merge.
     """
-    required = {"series_id", "year", "period", "value"}
-    if bls_df.empty or not required.issubset(set(bls_df.columns)):
-        return pd.DataFrame(columns=["year", "value"])
-
-    df = bls_df.copy()
-    df["series_id"] = df["series_id"].astype(str).str.strip()
-    df["period"] = df["period"].astype(str).str.strip()
-    df = df[(df["series_id"] == series_id.strip()) & (df["period"] == period.strip())]
+    df = _select_bls_rows(bls_df, series_id, period)
+    if df is None or df.empty:
+        return _empty_year_series()
+
+    df = pd.DataFrame({
+        "year": pd.to_numeric(df["year"], errors="coerce"),
+        "value": pd.to_numeric(df["value"], errors="coerce"),
+    }).dropna()
     if df.empty:
-        return pd.DataFrame(columns=["year", "value"])
+        return _empty_year_series()
 
-    df["year"] = pd.to_numeric(df["year"], errors="coerce")
-    df["value"] = pd.to_numeric(df["value"], errors="coerce")
-    df = df.dropna(subset=["year", "value"])
-    if df.empty:
-        return pd.DataFrame(columns=["year", "value"])
-
-    out = df[["year", "value"]].copy()
-    out["year"] = out["year"].astype(int)
-    return out.sort_values("year").reset_index(drop=True)
+    df["year"] = df["year"].astype(int)
+    return df.set_index("year").sort_index()
 
 
 def _rebase_index(df: pd.DataFrame, *, base_year: int) -> pd.DataFrame:
-    """Rebase an index-like series to `base_year` = 100."""
-    if df.empty or "year" not in df.columns or "value" not in df.columns:
-        return pd.DataFrame(columns=["year", "value"])
+    """Rebase a year-indexed series to `base_year` = 100."""
+    if df.empty or "value" not in df.columns:
+        return _empty_year_series()
 
-    base_rows = df[df["year"] == int(base_year)]
+    base_rows = df.loc[df.index == int(base_year), "value"]
     if base_rows.empty:
         raise ValueError(f"Base year {base_year} not present for rebase")
-    base_value = float(base_rows["value"].iloc[0])
+    base_value = float(base_rows.iloc[0])
     if base_value == 0:
         raise ValueError(f"Base year {base_year} value is 0; cannot rebase")
 
-    out = df.copy()
-    out["value"] = (out["value"] / base_value) * 100.0
-    return out
+    return df.assign(value=(df["value"] / base_value) * 100.0)
 
 
 def build_productivity_vs_compensation(
@@ -404,22 +585,14 @@ def build_productivity_vs_compensation(
     real_hourly_compensation_series_id: str = "PRS85006153",
 ) -> dict[str, Any]:
     """Curated dataset: nonfarm productivity vs real hourly compensation (rebased index)."""
+    bls_df = _index_bls_by_series(bls_df)
     prod = _pr_index_series(bls_df, series_id=output_per_hour_series_id, period=period)
     comp = _pr_index_series(bls_df, series_id=real_hourly_compensation_series_id, period=period)
     prod = _rebase_index(prod, base_year=base_year).rename(columns={"value": "output_per_hour"})
     comp = _rebase_index(comp, base_year=base_year).rename(columns={"value": "real_compensation"})
 
-    joined = prod.merge(comp, on="year", how="inner").sort_values("year").reset_index(drop=True)
-    points = []
-    def _r(value: Any) -> float | None:
-        v = _none_if_nan(value)
-        return None if v is None else round(float(v), 1)
-    for r in joined.to_dict("records"):
-        points.append({
-            "year": int(r["year"]),
-            "output_per_hour": _r(r.get("output_per_hour")),
-            "real_compensation": _r(r.get("real_compensation")),
-        })
+    joined = prod.join(comp, how="inner").reset_index()
+    points = _json_records(joined, ["year", "output_per_hour", "real_compensation"], round1=("output_per_hour", "real_compensation"))
 
     return {
         "title": "Productivity vs Real Hourly Compensation (Nonfarm Business)",
@@ -452,22 +625,14 @@ def build_productivity_vs_unit_labor_costs(
     unit_labor_costs_series_id: str = "PRS85006113",
 ) -> dict[str, Any]:
     """Curated dataset: nonfarm productivity vs unit labor costs (rebased index)."""
+    bls_df = _index_bls_by_series(bls_df)
     prod = _pr_index_series(bls_df, series_id=output_per_hour_series_id, period=period)
     ulc = _pr_index_series(bls_df, series_id=unit_labor_costs_series_id, period=period)
     prod = _rebase_index(prod, base_year=base_year).rename(columns={"value": "output_per_hour"})
     ulc = _rebase_index(ulc, base_year=base_year).rename(columns={"value": "unit_labor_costs"})
 
-    joined = prod.merge(ulc, on="year", how="inner").sort_values("year").reset_index(drop=True)
-    points = []
-    def _r(value: Any) -> float | None:
-        v = _none_if_nan(value)
-        return None if v is None else round(float(v), 1)
-    for r in joined.to_dict("records"):
-        points.append({
-            "year": int(r["year"]),
-            "output_per_hour": _r(r.get("output_per_hour")),
-            "unit_labor_costs": _r(r.get("unit_labor_costs")),
-        })
+    joined = prod.join(ulc, how="inner").reset_index()
+    points = _json_records(joined, ["year", "output_per_hour", "unit_labor_costs"], round1=("output_per_hour", "unit_labor_costs"))
 
     return {
         "title": "Productivity vs Unit Labor Costs (Nonfarm Business)",
@@ -500,22 +665,14 @@ def build_manufacturing_vs_nonfarm_productivity(
     manufacturing_output_per_hour_series_id: str = "PRS30006093",
 ) -> dict[str, Any]:
     """Curated dataset: manufacturing vs nonfarm productivity (rebased index)."""
+    bls_df = _index_bls_by_series(bls_df)
     nonfarm = _pr_index_series(bls_df, series_id=nonfarm_output_per_hour_series_id, period=period)
     mfg = _pr_index_series(bls_df, series_id=manufacturing_output_per_hour_series_id, period=period)
     nonfarm = _rebase_index(nonfarm, base_year=base_year).rename(columns={"value": "nonfarm"})
     mfg = _rebase_index(mfg, base_year=base_year).rename(columns={"value": "manufacturing"})
 
-    joined = nonfarm.merge(mfg, on="year", how="inner").sort_values("year").reset_index(drop=True)
-    points = []
-    def _r(value: Any) -> float | None:
-        v = _none_if_nan(value)
-        return None if v is None else round(float(v), 1)
-    for r in joined.to_dict("records"):
-        points.append({
-            "year": int(r["year"]),
-            "nonfarm": _r(r.get("nonfarm")),
-            "manufacturing": _r(r.get("manufacturing")),
-        })
+    joined = nonfarm.join(mfg, how="inner").reset_index()
+    points = _json_records(joined, ["year", "nonfarm", "manufacturing"], round1=("nonfarm", "manufacturing"))
 
     return {
         "title": "Manufacturing vs Nonfarm Business Productivity",
@@ -539,23 +696,41 @@ def build_manufacturing_vs_nonfarm_productivity(
     }
 
 
-def export_site_payload(payload: dict[str, Any], out_path: str | Path) -> Path:
+def _write_json(out_path: str | Path, payload: Any) -> Path:
+    """Serialize `payload` and atomically replace `out_path` with it.
+
+    The JSON is encoded straight into a sibling temp file through a 1 MiB
+    buffer, then replaces the target, so the static site never serves a
+    half-written file.
+    """
     path = Path(out_path)
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(payload, indent=2, default=str) + "\n", encoding="utf-8")
+    tmp = path.with_name(f".{path.name}.tmp")
+    try:
+        with open(tmp, "wb", buffering=1 << 20) as fp:
+            json_codec.dump(payload, fp, indent=True)
+            fp.write(b"\n")
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
     return path.resolve()
 
+
+def export_site_payload(payload: dict[str, Any], out_path: str | Path) -> Path:
+    return _write_json(out_path, payload)
+
 def report_population_stats(pop_df: pd.DataFrame) -> dict:
     """Report 1: Mean and std dev of US population for 2013-2018."""
     if pop_df.empty:
         return {"report": "Population Statistics (2013-2018)", "mean": None, "stddev": None}
 
-    df = pop_df.copy()
-    df = df[(df["Year"] >= 2013) & (df["Year"] <= 2018)]
+    df = pop_df[pop_df["Year"].between(*POPULATION_STATS_YEARS)]
     if df.empty:
         return {"report": "Population Statistics (2013-2018)", "mean": None, "stddev": None}
 
-    population = df["Population"].astype(float)
+    population = df["Population"].to_numpy(dtype=np.float64, na_value=np.nan)
+    population = population[~np.isnan(population)]
     return {
         "report": "Population Statistics (2013-2018)",
         "mean": float(population.mean()),
@@ -570,9 +745,9 @@ def report_best_year_by_series(bls_df: pd.DataFrame) -> list[dict]:
         return []
 
     df = bls_df.copy()
-    df["series_id"] = df["series_id"].astype(str).str.strip()
-    df["period"] = df["period"].astype(str).str.strip()
-    df = df[df["period"].str.startswith("Q", na=False)]
+    df["series_id"] = _strip_labels(df["series_id"])
+    df["period"] = _strip_labels(df["period"])
+    df = df[_per_label(df["period"], lambda p: p.str.startswith("Q"), False)]
     df = df.dropna(subset=["series_id", "year", "value"])
     if df.empty:
         return []
@@ -583,19 +758,11 @@ def report_best_year_by_series(bls_df: pd.DataFrame) -> list[dict]:
     if df.empty:
         return []
 
-    yearly = df.groupby(["series_id", "year"], as_index=False)["value"].sum()
-    best = yearly.sort_values(["series_id", "value"], ascending=[True, False]).drop_duplicates("series_id")
-    best = best.sort_values("series_id").reset_index(drop=True)
-    best["value"] = best["value"].round(1)
-
-    rows: list[dict] = []
-    for r in best.to_dict("records"):
-        rows.append({
-            "series_id": str(r["series_id"]),
-            "year": int(r["year"]),
-            "value": float(r["value"]),
-        })
-    return rows
+    yearly = df.groupby(["series_id", "year"], as_index=False, observed=True)["value"].sum()
+    # Group argmax instead of sorting every (series, year) row; groups come
+    # back in series_id order and ties keep the earliest year.
+    best = yearly.loc[yearly.groupby("series_id", observed=True)["value"].idxmax()].reset_index(drop=True)
+    return _json_records(best, ["series_id", "year", "value"], round1=("value",))
 
 
 def report_series_population_join(
@@ -614,8 +781,8 @@ def report_series_population_join(
         return []
 
     bls = bls_df.copy()
-    bls["series_id"] = bls["series_id"].astype(str).str.strip()
-    bls["period"] = bls["period"].astype(str).str.strip()
+    bls["series_id"] = _strip_labels(bls["series_id"])
+    bls["period"] = _strip_labels(bls["period"])
     bls["year"] = pd.to_numeric(bls["year"], errors="coerce").astype("Int64")
     bls["value"] = pd.to_numeric(bls["value"], errors="coerce")
     bls = bls.dropna(subset=["year"])
@@ -637,16 +804,7 @@ def report_series_population_join(
     )
     joined = joined.sort_values("year").reset_index(drop=True)
 
-    out = []
-    for r in joined[["series_id", "year", "period", "value", "Population"]].to_dict("records"):
-        out.append({
-            "series_id": str(r["series_id"]),
-            "year": int(r["year"]),
-            "period": str(r["period"]),
-            "value": _none_if_nan(r["value"]),
-            "Population": _none_if_nan(r["Population"]),
-        })
-    return out
+    return _json_records(joined, ["series_id", "year", "period", "value", "Population"])
 
 
 def build_timeseries_payload(series_rows: list[dict]) -> dict:
@@ -668,6 +826,27 @@ def build_timeseries_payload(series_rows: list[dict]) -> dict:
     return {"title": title, "points": points}
 
 
+def _dict_at(obj: Any, key: str) -> dict[str, Any]:
+    """Return `obj[key]` if `obj` and that value are both dicts, else `{}`.
+
+    Sync results and sync state are untrusted JSON, so any level may be
+    missing or the wrong type.
+    """
+    value = obj.get(key) if isinstance(obj, dict) else None
+    return value if isinstance(value, dict) else {}
+
+
+def _sync_file_row(filename: str, action: str, meta_by_file: dict[str, Any]) -> dict[str, Any]:
+    """Build one pipeline-status file row from the series' latest sync state."""
+    meta = _dict_at(meta_by_file, filename)
+    return {
+        "name": filename,
+        "action": action,
+        "source_modified": meta.get("source_modified"),
+        "bytes": meta.get("bytes"),
+    }
+
+
 def build_pipeline_status(sync_results: dict, duration_seconds: float = 0.0) -> dict:
     """Build a `site/data/pipeline_status.json` payload for the static site.
 
@@ -679,9 +858,6 @@ def build_pipeline_status(sync_results: dict, duration_seconds: float = 0.0) ->
     from datetime import datetime, timezone
     import os
 
-    s3 = get_client("s3")
-    bls_bucket = get_bls_bucket()
-
     series_names = {
         "pr": "Major Sector Productivity and Costs",
         "cu": "Consumer Price Index — All Urban Consumers",
@@ -691,12 +867,14 @@ def build_pipeline_status(sync_results: dict, duration_seconds: float = 0.0) ->
         "ci": "Employment Cost Index",
     }
 
+    # The S3 client and buckets are only resolved once there is state to
+    # read, so an empty or malformed `sync_results` costs no AWS setup.
     def _load_json(bucket: str, key: str) -> dict[str, Any]:
         try:
-            response = s3.get_object(Bucket=bucket, Key=key)
-            return json.loads(response["Body"].read())
+            state = _get_s3_json(get_client("s3"), bucket, key)
         except Exception:
             return {}
+        return state if isinstance(state, dict) else {}
 
     series_list: list[dict[str, Any]] = []
     total_checked = 0
@@ -704,13 +882,16 @@ def build_pipeline_status(sync_results: dict, duration_seconds: float = 0.0) ->
     total_unchanged = 0
     total_deleted = 0
 
-    bls = sync_results.get("bls") if isinstance(sync_results, dict) else {}
-    if not isinstance(bls, dict):
-        bls = {}
+    bls = _dict_at(sync_results, "bls")
+    bls = {series_id: result for series_id, result in sorted(bls.items()) if isinstance(result, dict)}
+    # One S3 round trip per series; fetch the sync states concurrently.
+    state_keys = [f"_sync_state/{series_id}/latest_state.json" for series_id in bls]
+    states: list[dict[str, Any]] = []
+    if state_keys:
+        with ThreadPoolExecutor(max_workers=min(8, len(state_keys))) as ex:
+            states = list(ex.map(partial(_load_json, get_bls_bucket()), state_keys))
 
-    for series_id, result in sorted(bls.items()):
-        if not isinstance(result, dict):
-            continue
+    for (series_id, result), state in zip(bls.items(), states):
 
         added = result.get("added") or []
         updated = result.get("updated") or []
@@ -722,32 +903,15 @@ def build_pipeline_status(sync_results: dict, duration_seconds: float = 0.0) ->
         unchanged = [f for f in unchanged if isinstance(f, str) and f]
         deleted = [f for f in deleted if isinstance(f, str) and f]
 
-        state = _load_json(bls_bucket, f"_sync_state/{series_id}/latest_state.json")
-        meta_by_file = state.get("files") if isinstance(state, dict) else {}
-        if not isinstance(meta_by_file, dict):
-            meta_by_file = {}
-
-        def _file_row(filename: str, action: str) -> dict[str, Any]:
-            meta = meta_by_file.get(filename) if isinstance(meta_by_file, dict) else None
-            if not isinstance(meta, dict):
-                meta = {}
-            return {
-                "name": filename,
-                "action": action,
-                "source_modified": meta.get("source_modified"),
-                "bytes": meta.get("bytes"),
-            }
-
-        files: list[dict[str, Any]] = []
-        for f in added:
-            files.append(_file_row(f, "added"))
-        for f in updated:
-            files.append(_file_row(f, "updated"))
-        for f in unchanged:
-            files.append(_file_row(f, "unchanged"))
-        for f in deleted:
-            # Deleted objects won't exist in latest state.
-            files.append({"name": f, "action": "deleted", "source_modified": None, "bytes": None})
+        meta_by_file = _dict_at(state, "files")
+
+        files: list[dict[str, Any]] = [
+            _sync_file_row(f, action, meta_by_file)
+            for action, names in (("added", added), ("updated", updated), ("unchanged", unchanged))
+            for f in names
+        ]
+        # Deleted objects won't exist in latest state.
+        files += [{"name": f, "action": "deleted", "source_modified": None, "bytes": None} for f in deleted]
 
         n_updated = len(added) + len(updated)
         n_unchanged = len(unchanged)
@@ -759,15 +923,14 @@ def build_pipeline_status(sync_results: dict, duration_seconds: float = 0.0) ->
         total_unchanged += n_unchanged
         total_deleted += n_deleted
 
-        latest_source_modified = None
-        for meta in meta_by_file.values():
-            if not isinstance(meta, dict):
-                continue
-            ts = meta.get("source_modified")
-            if not isinstance(ts, str) or not ts:
-                continue
-            if latest_source_modified is None or ts > latest_source_modified:
-                latest_source_modified = ts
+        latest_source_modified = max(
+            (
+                ts
+                for meta in meta_by_file.values()
+                if isinstance(meta, dict) and isinstance(ts := meta.get("source_modified"), str) and ts
+            ),
+            default=None,
+        )
 
         series_list.append({
             "id": series_id,
@@ -782,23 +945,27 @@ def build_pipeline_status(sync_results: dict, duration_seconds: float = 0.0) ->
         })
 
     # DataUSA: summarize the population dataset (Quest Part 2).
-    datausa = sync_results.get("datausa") if isinstance(sync_results, dict) else {}
-    datasets = (datausa or {}).get("datasets") if isinstance(datausa, dict) else {}
-    if not isinstance(datasets, dict):
-        datasets = {}
+    datasets = _dict_at(_dict_at(sync_results, "datausa"), "datasets")
 
-    dataset_id = None
     pop = datasets.get("population")
     if isinstance(pop, dict):
         dataset_id = "population"
     else:
-        dataset_id, pop = next(((k, v) for k, v in datasets.items() if isinstance(v, dict)), (None, {}))
+        # Fall back to the first dataset that has a result.
+        dataset_id, pop = None, {}
+        for k, v in datasets.items():
+            if isinstance(v, dict):
+                dataset_id, pop = k, v
+                break
 
     state = {}
     if dataset_id:
         state = _load_json(get_datausa_bucket(), f"_sync_state/datausa/{dataset_id}/latest_state.jsonl")
 
-    year_range = pop.get("year_range") or state.get("year_range")
+    # This run's result wins over the stored sync state unless its value is empty.
+    latest = {**state, **{k: v for k, v in pop.items() if v}}
+
+    year_range = latest.get("year_range")
     years = "N/A"
     if isinstance(year_range, list) and len(year_range) == 2:
         try:
@@ -807,15 +974,15 @@ def build_pipeline_status(sync_results: dict, duration_seconds: float = 0.0) ->
             years = "N/A"
 
     base_url = os.environ.get("DATAUSA_BASE_URL", "https://api.datausa.io/tesseract").rstrip("/")
-    endpoint = state.get("api_url") if isinstance(state, dict) else None
+    endpoint = state.get("api_url")
     if not isinstance(endpoint, str) or not endpoint.strip():
         endpoint = f"{base_url}/data.jsonrecords"
 
     datausa_summary = {
         "endpoint": endpoint,
         "action": str(pop.get("action", "unknown")),
-        "content_hash": str(pop.get("content_hash") or state.get("content_hash") or ""),
-        "record_count": int(pop.get("record_count") or state.get("record_count") or 0),
+        "content_hash": str(latest.get("content_hash") or ""),
+        "record_count": int(latest.get("record_count") or 0),
         "years": years,
     }
 
@@ -853,20 +1020,12 @@ def export_pipeline_status(
     duration_seconds: float = 0.0,
 ) -> Path:
     """Write pipeline_status.json for the static site."""
-    path = Path(out_path)
-    path.parent.mkdir(parents=True, exist_ok=True)
-    payload = build_pipeline_status(sync_results, duration_seconds)
-    path.write_text(json.dumps(payload, indent=2, default=str) + "\n", encoding="utf-8")
-    return path.resolve()
+    return _write_json(out_path, build_pipeline_status(sync_results, duration_seconds))
 
 
 def export_site_timeseries(series_rows: list[dict], out_path: str | Path) -> Path:
     """Write the static site `timeseries.json` file and return the resolved path."""
-    path = Path(out_path)
-    path.parent.mkdir(parents=True, exist_ok=True)
-    payload = build_timeseries_payload(series_rows)
-    path.write_text(json.dumps(payload, indent=2, default=str) + "\n", encoding="utf-8")
-    return path.resolve()
+    return _write_json(out_path, build_timeseries_payload(series_rows))
 
 
 def run_all_reports(
@@ -876,19 +1035,21 @@ def run_all_reports(
     pop_key: str | None = None,
     *,
     site_json_out: str | Path | None = None,
+    bls_df: pd.DataFrame | None = None,
 ) -> dict:
-    """Run all reports and return results."""
+    """Run all reports and return results.
+
+    Pass `bls_df` (as returned by `load_bls_from_s3`) to reuse a BLS frame the
+    caller already loaded instead of fetching `bls_key` again.
+    """
     if pop_bucket is None:
         pop_bucket = get_datausa_bucket()
     if pop_key is None:
         pop_key = get_datausa_key()
-    if bls_bucket is None:
-        bls_bucket = get_bls_bucket()
-    if bls_key is None:
-        bls_key = get_bls_key()
 
     pop_df = load_population_from_s3(pop_bucket, pop_key)
-    bls_df = load_bls_from_s3(bls_bucket, bls_key)
+    if bls_df is None:
+        bls_df = load_bls_from_s3(bls_bucket or get_bls_bucket(), bls_key or get_bls_key())
 
     report_1 = report_population_stats(pop_df)
     report_2 = report_best_year_by_series(bls_df)
@@ -909,57 +1070,60 @@ def run_all_reports(
 if __name__ == "__main__":
     # Local convenience: generate a few demo curated payloads for the static site.
     site_dir = Path("site/data")
-    results = run_all_reports(site_json_out=site_dir / "timeseries.json")
 
-    # Additional Fed-style charts (requires DATAUSA_DATASETS + BLS_SERIES to include inputs).
+    # PR feeds the three index charts below and is usually the analytics
+    # series too, so fetch it once. A failed load is reported per chart.
+    pr_key = bls_data_key("pr", "pr.data.0.Current")
     try:
-        unemployment_payload = build_unemployment_vs_commute_time(
-            bls_bucket=get_bls_bucket(),
-            datausa_bucket=get_datausa_bucket(),
-        )
-        results["exported_unemployment_vs_commute_time"] = str(
-            export_site_payload(unemployment_payload, site_dir / "unemployment_vs_commute_time.json")
-        )
-    except Exception as exc:
-        results["exported_unemployment_vs_commute_time_error"] = str(exc)
-
-    try:
-        participation_payload = build_participation_vs_noncitizen_share(
-            bls_bucket=get_bls_bucket(),
-            datausa_bucket=get_datausa_bucket(),
-        )
-        results["exported_participation_vs_noncitizen_share"] = str(
-            export_site_payload(participation_payload, site_dir / "participation_vs_noncitizen_share.json")
-        )
+        pr_raw, pr_error = load_bls_from_s3(bucket=get_bls_bucket(), key=pr_key), None
     except Exception as exc:
-        results["exported_participation_vs_noncitizen_share_error"] = str(exc)
+        pr_raw, pr_error = None, exc
 
-    # PR index charts (derived from BLS PR `pr.data.0.Current`).
-    try:
-        pr_df = load_bls_from_s3(bucket=get_bls_bucket(), key=bls_data_key("pr", "pr.data.0.Current"))
-        payload = build_productivity_vs_compensation(pr_df)
-        results["exported_productivity_vs_compensation"] = str(
-            export_site_payload(payload, site_dir / "productivity_vs_compensation.json")
-        )
-    except Exception as exc:
-        results["exported_productivity_vs_compensation_error"] = str(exc)
+    results = run_all_reports(
+        site_json_out=site_dir / "timeseries.json",
+        bls_df=pr_raw if get_bls_key() == pr_key else None,
+    )
 
+    # Additional Fed-style charts (requires DATAUSA_DATASETS + BLS_SERIES to include inputs).
+    # LN is loaded once for both builders; if that fails they retry the load
+    # themselves and report the error in their payload.
     try:
-        pr_df = load_bls_from_s3(bucket=get_bls_bucket(), key=bls_data_key("pr", "pr.data.0.Current"))
-        payload = build_productivity_vs_unit_labor_costs(pr_df)
-        results["exported_productivity_vs_costs"] = str(
-            export_site_payload(payload, site_dir / "productivity_vs_costs.json")
+        ln_df = _index_bls_by_series(
+            load_bls_from_s3(bucket=get_bls_bucket(), key=bls_data_key("ln", "ln.data.0.Current"))
         )
-    except Exception as exc:
-        results["exported_productivity_vs_costs_error"] = str(exc)
+    except Exception:
+        ln_df = None
 
-    try:
-        pr_df = load_bls_from_s3(bucket=get_bls_bucket(), key=bls_data_key("pr", "pr.data.0.Current"))
-        payload = build_manufacturing_vs_nonfarm_productivity(pr_df)
-        results["exported_manufacturing_vs_nonfarm"] = str(
-            export_site_payload(payload, site_dir / "manufacturing_vs_nonfarm.json")
-        )
-    except Exception as exc:
-        results["exported_manufacturing_vs_nonfarm_error"] = str(exc)
+    def _export_chart(name: str, build: Callable[[], dict[str, Any]]) -> tuple[str, str]:
+        try:
+            return f"exported_{name}", str(export_site_payload(build(), site_dir / f"{name}.json"))
+        except Exception as exc:
+            return f"exported_{name}_error", str(exc)
+
+    charts: dict[str, Callable[[], dict[str, Any]]] = {
+        name: partial(build, bls_bucket=get_bls_bucket(), datausa_bucket=get_datausa_bucket(), ln_df=ln_df)
+        for name, build in {
+            "unemployment_vs_commute_time": build_unemployment_vs_commute_time,
+            "participation_vs_noncitizen_share": build_participation_vs_noncitizen_share,
+        }.items()
+    }
 
-    print(json.dumps(results, indent=2, default=str))
+    # PR index charts (derived from BLS PR `pr.data.0.Current`).
+    pr_charts = {
+        "productivity_vs_compensation": build_productivity_vs_compensation,
+        "productivity_vs_costs": build_productivity_vs_unit_labor_costs,
+        "manufacturing_vs_nonfarm": build_manufacturing_vs_nonfarm_productivity,
+    }
+    if pr_raw is not None:
+        pr_df = _index_bls_by_series(pr_raw)
+        charts.update({name: partial(build, pr_df) for name, build in pr_charts.items()})
+
+    # The LN builders wait on DataUSA S3 reads and every chart writes a file,
+    # so export them concurrently; map() keeps the results in chart order.
+    with ThreadPoolExecutor(max_workers=min(8, len(charts))) as ex:
+        results.update(ex.map(_export_chart, charts, charts.values()))
+    if pr_raw is None:
+        for name in pr_charts:
+            results[f"exported_{name}_error"] = str(pr_error)
+
+    sys.stdout.buffer.write(json_codec.dumps(results, indent=True) + b"\n")
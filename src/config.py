@@ -1,8 +1,15 @@
-"""Runtime configuration helpers shared across scripts and Lambdas."""
+"""Runtime configuration helpers shared across scripts and Lambdas.
+
+Getters are memoized: the environment is fixed for the life of a Lambda
+container, so each value is read and validated once (at cold start) rather
+than on every invocation. Call `clear_config_cache()` after changing
+`os.environ` in-process (tests do this between cases).
+"""
 
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 
 
 def _required_env(name: str) -> str:
@@ -12,11 +19,13 @@ def _required_env(name: str) -> str:
     return value
 
 
+@lru_cache(maxsize=1)
 def get_bucket_prefix() -> str:
     """Get the shared bucket prefix used across this project."""
     return _required_env("FOMC_BUCKET_PREFIX")
 
 
+@lru_cache(maxsize=1)
 def get_bls_bucket() -> str:
     """Get the S3 bucket used for BLS raw files."""
     explicit = os.environ.get("BLS_BUCKET", "").strip()
@@ -25,6 +34,7 @@ def get_bls_bucket() -> str:
     return f"{get_bucket_prefix()}-bls-raw"
 
 
+@lru_cache(maxsize=1)
 def get_datausa_bucket() -> str:
     """Get the S3 bucket used for DataUSA raw files."""
     explicit = os.environ.get("DATAUSA_BUCKET", "").strip()
@@ -33,16 +43,19 @@ def get_datausa_bucket() -> str:
     return f"{get_bucket_prefix()}-datausa-raw"
 
 
+@lru_cache(maxsize=1)
 def get_datausa_key() -> str:
     """Get the S3 key used for the DataUSA population JSON."""
     return os.environ.get("DATAUSA_KEY", "population.json")
 
 
+@lru_cache(maxsize=1)
 def get_analytics_queue_name() -> str:
     """Get the analytics SQS queue name."""
     return _required_env("FOMC_ANALYTICS_QUEUE_NAME")
 
 
+@lru_cache(maxsize=1)
 def get_analytics_dlq_name() -> str:
     """Get the analytics dead-letter queue name."""
     return _required_env("FOMC_ANALYTICS_DLQ_NAME")
@@ -50,15 +63,21 @@ def get_analytics_dlq_name() -> str:
 
 def get_datausa_datasets(default: str | None = None) -> list[str]:
     """Get the DataUSA dataset ids to ingest (comma-separated)."""
+    return list(_get_datausa_datasets(default))
+
+
+@lru_cache(maxsize=8)
+def _get_datausa_datasets(default: str | None) -> tuple[str, ...]:
     raw = os.environ.get("DATAUSA_DATASETS", "").strip()
     if not raw:
         if default is None:
             raise RuntimeError("Missing required environment variable: DATAUSA_DATASETS")
         raw = default
     parts = [p.strip() for p in raw.split(",")]
-    return [p for p in parts if p]
+    return tuple(p for p in parts if p)
 
 
+@lru_cache(maxsize=1)
 def get_bls_processed_bucket() -> str:
     """Get the S3 bucket used for BLS parsed/cleaned (processed) data."""
     explicit = os.environ.get("BLS_PROCESSED_BUCKET", "").strip()
@@ -67,6 +86,7 @@ def get_bls_processed_bucket() -> str:
     return f"{get_bucket_prefix()}-bls-processed"
 
 
+@lru_cache(maxsize=1)
 def get_datausa_processed_bucket() -> str:
     """Get the S3 bucket used for DataUSA parsed/cleaned (processed) data."""
     explicit = os.environ.get("DATAUSA_PROCESSED_BUCKET", "").strip()
@@ -77,15 +97,21 @@ def get_datausa_processed_bucket() -> str:
 
 def get_bls_series_list(default: str | None = None) -> list[str]:
     """Get the BLS series list (comma-separated) for ingestion."""
+    return list(_get_bls_series_list(default))
+
+
+@lru_cache(maxsize=8)
+def _get_bls_series_list(default: str | None) -> tuple[str, ...]:
     raw = os.environ.get("BLS_SERIES", "").strip()
     if not raw:
         if default is None:
             raise RuntimeError("Missing required environment variable: BLS_SERIES")
         raw = default
     parts = [p.strip() for p in raw.split(",")]
-    return [p for p in parts if p]
+    return tuple(p for p in parts if p)
 
 
+@lru_cache(maxsize=128)
 def bls_data_key(series_id: str, filename: str | None = None) -> str:
     """Build the default S3 key for a BLS file in a given series."""
     if filename is None:
@@ -93,6 +119,7 @@ def bls_data_key(series_id: str, filename: str | None = None) -> str:
     return f"{series_id}/{filename}"
 
 
+@lru_cache(maxsize=8)
 def get_bls_key(default_series: str | None = None) -> str:
     """Get the S3 key used for analytics reads of BLS data."""
     explicit = os.environ.get("BLS_KEY")
@@ -106,3 +133,40 @@ def get_bls_key(default_series: str | None = None) -> str:
             raise RuntimeError("BLS_SERIES must contain at least one series id")
         series = series_list[0]
     return bls_data_key(series_id=series)
+
+
+_CACHED_GETTERS = (
+    get_bucket_prefix,
+    get_bls_bucket,
+    get_datausa_bucket,
+    get_datausa_key,
+    get_analytics_queue_name,
+    get_analytics_dlq_name,
+    _get_datausa_datasets,
+    get_bls_processed_bucket,
+    get_datausa_processed_bucket,
+    _get_bls_series_list,
+    get_bls_key,
+)
+
+
+def apply_baked_config() -> None:
+    """Fill unset env vars from `src/lambdas/_baked_config.py`, if it was bundled.
+
+    `cdk synth` writes that module with rarely-changing settings (series lists,
+    base URLs) so the Lambda functions only carry stack-specific env vars.
+    Explicit environment variables still win.
+    """
+    try:
+        from src.lambdas._baked_config import BAKED_ENV  # type: ignore
+    except ImportError:
+        return
+    for key, value in BAKED_ENV.items():
+        os.environ.setdefault(key, value)
+    clear_config_cache()
+
+
+def clear_config_cache() -> None:
+    """Forget memoized values so the next call re-reads the environment."""
+    for getter in _CACHED_GETTERS:
+        getter.cache_clear()
@@ -10,7 +10,7 @@ from datetime import datetime, timezone
 
 from src.config import get_bls_bucket, get_bls_series_list
 from src.helpers.aws_client import get_client
-from src.helpers.http_client import fetch_bytes, fetch_text, post_json
+from src.helpers.http_client import fetch_bytes, fetch_text, post_json, stream_to_s3
 
 BLS_BASE_URL = "https://download.bls.gov/pub/time.series"
 BLS_API_BASE_URL = "https://api.bls.gov/publicAPI/v2/timeseries/data/"
@@ -18,6 +18,10 @@ USER_AGENT = "fomc-agent/1.0 (data-pipeline; contact: ryan.hammang@outlook.com)"
 
 _DEFAULT_LN_SERIES_IDS = ("LNS14000000", "LNS11300000")
 
+# Files at least this large (per the directory listing) are streamed into S3
+# rather than buffered in memory. Override with BLS_STREAM_MIN_BYTES.
+_DEFAULT_STREAM_MIN_BYTES = 8 * 1024 * 1024
+
 
 def _parse_file_patterns(patterns: str | None, series_id: str) -> list[str] | None:
     """Parse comma-separated glob patterns (supports `{series}` placeholder)."""
@@ -101,6 +105,22 @@ def download_file(series_id: str, filename: str) -> bytes:
     return fetch_bytes(url, headers={"User-Agent": user_agent}, timeout=60)
 
 
+def stream_file_to_s3(s3_client, series_id: str, filename: str, bucket: str, key: str, metadata: dict) -> int:
+    """Stream a single BLS file into S3 without buffering it; returns the byte count."""
+    base_url = os.environ.get("BLS_BASE_URL", BLS_BASE_URL)
+    user_agent = os.environ.get("BLS_USER_AGENT", USER_AGENT)
+    url = f"{base_url}/{series_id}/{filename}"
+    return stream_to_s3(
+        url,
+        s3_client,
+        bucket,
+        key,
+        headers={"User-Agent": user_agent},
+        timeout=60,
+        extra_args={"Metadata": metadata},
+    )
+
+
 def upload_to_s3(s3_client, bucket: str, key: str, data: bytes, metadata: dict):
     """Upload data to S3 with metadata."""
     s3_client.put_object(
@@ -411,6 +431,7 @@ def sync_series(series_id: str, bucket: str | None = None) -> dict:
     if raw_patterns is None:
         raw_patterns = "{series}.data.0.Current"
     file_patterns = _parse_file_patterns(raw_patterns, series_id=series_id)
+    stream_min_bytes = _parse_env_int("BLS_STREAM_MIN_BYTES", _DEFAULT_STREAM_MIN_BYTES)
 
     s3 = get_client("s3")
     now = datetime.now(timezone.utc)
@@ -439,10 +460,13 @@ def sync_series(series_id: str, bucket: str | None = None) -> dict:
                 "source_modified": source_time.isoformat(),
             }
         else:
-            data = download_file(series_id, filename)
-            upload_to_s3(s3, bucket, s3_key, data, {
-                "source_modified": source_time.isoformat(),
-            })
+            object_metadata = {"source_modified": source_time.isoformat()}
+            if stream_min_bytes > 0 and file_info["size"] >= stream_min_bytes:
+                size = stream_file_to_s3(s3, series_id, filename, bucket, s3_key, object_metadata)
+            else:
+                data = download_file(series_id, filename)
+                upload_to_s3(s3, bucket, s3_key, data, object_metadata)
+                size = len(data)
 
             action = "added" if filename not in known_files else "updated"
             summary[action].append(filename)
@@ -451,11 +475,11 @@ def sync_series(series_id: str, bucket: str | None = None) -> dict:
                 "file": filename,
                 "action": action,
                 "source_modified": source_time.isoformat(),
-                "bytes": len(data),
+                "bytes": size,
             }
             state.setdefault("files", {})[filename] = {
                 "source_modified": source_time.isoformat(),
-                "bytes": len(data),
+                "bytes": size,
             }
 
         append_sync_log(s3, bucket, series_id, log_entry)
@@ -488,6 +512,8 @@ def sync_all(series_list: list[str] | None = None, bucket: str | None = None) ->
 
     Set BLS_SERIES_DELAY_SECONDS to pause between series (default: 2).
     Set BLS_FILE_PATTERNS to limit which files are downloaded per series.
+    Set BLS_STREAM_MIN_BYTES to change the size above which files are streamed
+    into S3 instead of buffered (default: 8 MiB; 0 disables streaming).
     """
     if series_list is None:
         series_list = get_bls_series_list()
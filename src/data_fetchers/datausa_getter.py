@@ -32,7 +32,7 @@ _VALIDATED_CANDIDATES: dict[str, "DataUsaDataset"] = {}
 _VALIDATION_ATTEMPTED: set[str] = set()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DataUsaDataset:
     """A small, repeatable DataUSA pull."""
 
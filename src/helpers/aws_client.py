@@ -3,11 +3,20 @@
 from __future__ import annotations
 
 import os
+import threading
+from functools import lru_cache
 from urllib.parse import urlparse
 
 import boto3
 from botocore.config import Config
 
+# Shared by every call through a cached client (e.g. thread-pooled status checks).
+MAX_POOL_CONNECTIONS = 32
+
+# boto3 sessions are not thread-safe while building clients; serialize creation
+# so worker threads asking for the same client share one instance.
+_CACHE_LOCK = threading.Lock()
+
 
 def _required_env(name: str) -> str:
     value = os.environ.get(name, "").strip()
@@ -50,39 +59,82 @@ def _local_auth_kwargs(endpoint: str | None) -> dict[str, str]:
     return kwargs
 
 
-def _service_config(service: str, endpoint: str | None) -> Config | None:
+def _s3_addressing_style(service: str) -> str | None:
     if service != "s3":
         return None
-
     addressing = os.environ.get("AWS_S3_ADDRESSING_STYLE", "").strip().lower()
     if addressing in {"path", "virtual", "auto"}:
-        return Config(s3={"addressing_style": addressing})
+        return addressing
     return None
 
 
-def get_client(service: str):
-    """Create a boto3 client for the given service."""
+def _service_config(addressing_style: str | None) -> Config:
+    # Adaptive mode adds client-side rate limiting on throttles, which the
+    # concurrent CloudWatch/SQS/S3 fan-outs can trigger.
+    config = Config(
+        max_pool_connections=MAX_POOL_CONNECTIONS,
+        retries={"mode": "adaptive", "max_attempts": 5},
+    )
+    if addressing_style is not None:
+        config = config.merge(Config(s3={"addressing_style": addressing_style}))
+    return config
+
+
+def _cache_key(service: str) -> tuple:
+    """Everything from the environment that affects how a client is built."""
     endpoint = _service_endpoint(service)
-    kwargs = {
-        "region_name": _region(),
-        "endpoint_url": endpoint,
-        **_local_auth_kwargs(endpoint),
-    }
-    config = _service_config(service, endpoint)
-    if config is not None:
-        kwargs["config"] = config
-    return boto3.client(service, **kwargs)
+    return (
+        service,
+        _region(),
+        endpoint,
+        tuple(sorted(_local_auth_kwargs(endpoint).items())),
+        _s3_addressing_style(service),
+    )
+
+
+# `boto3.client`/`boto3.resource` build on boto3's module-level default session,
+# so every cached client shares one session and credential provider chain.
+@lru_cache(maxsize=32)
+def _cached_client(service: str, region: str, endpoint: str | None, auth: tuple, addressing_style: str | None):
+    return boto3.client(
+        service,
+        region_name=region,
+        endpoint_url=endpoint,
+        config=_service_config(addressing_style),
+        **dict(auth),
+    )
+
+
+@lru_cache(maxsize=32)
+def _cached_resource(service: str, region: str, endpoint: str | None, auth: tuple, addressing_style: str | None):
+    return boto3.resource(
+        service,
+        region_name=region,
+        endpoint_url=endpoint,
+        config=_service_config(addressing_style),
+        **dict(auth),
+    )
+
+
+def get_client(service: str):
+    """Return a boto3 client for the given service.
+
+    Clients are cached per service + environment settings so warm Lambda
+    invocations and repeated calls reuse the same client and connection pool.
+    """
+    key = _cache_key(service)
+    with _CACHE_LOCK:
+        return _cached_client(*key)
 
 
 def get_resource(service: str):
-    """Create a boto3 resource for the given service."""
-    endpoint = _service_endpoint(service)
-    kwargs = {
-        "region_name": _region(),
-        "endpoint_url": endpoint,
-        **_local_auth_kwargs(endpoint),
-    }
-    config = _service_config(service, endpoint)
-    if config is not None:
-        kwargs["config"] = config
-    return boto3.resource(service, **kwargs)
+    """Return a boto3 resource for the given service (cached like `get_client`)."""
+    key = _cache_key(service)
+    with _CACHE_LOCK:
+        return _cached_resource(*key)
+
+
+def clear_client_cache() -> None:
+    """Drop cached clients/resources (e.g. after credentials or endpoints change)."""
+    _cached_client.cache_clear()
+    _cached_resource.cache_clear()
@@ -1,24 +1,79 @@
 """AWS resource status checks for S3, SQS, and Lambda."""
 
-import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 
-from src.helpers.aws_client import get_client
+from src.helpers import json_codec
+from src.helpers.aws_client import MAX_POOL_CONNECTIONS, get_client
+
+# Stay within the shared client's connection pool so concurrent calls reuse
+# pooled connections instead of opening (and discarding) new ones.
+_MAX_WORKERS = min(16, MAX_POOL_CONNECTIONS)
+
+# S3 publishes storage metrics once a day, typically with a lag of a day or so.
+_S3_METRIC_LOOKBACK = timedelta(days=3)
+
+
+def _cloudwatch_object_count(cloudwatch, bucket: str) -> int | None:
+    """Return the latest daily `NumberOfObjects` metric for a bucket, if published."""
+    end_time = datetime.now(timezone.utc)
+    resp = cloudwatch.get_metric_statistics(
+        Namespace="AWS/S3",
+        MetricName="NumberOfObjects",
+        Dimensions=[
+            {"Name": "BucketName", "Value": bucket},
+            {"Name": "StorageType", "Value": "AllStorageTypes"},
+        ],
+        StartTime=end_time - _S3_METRIC_LOOKBACK,
+        EndTime=end_time,
+        Period=86400,
+        Statistics=["Average"],
+    )
+    datapoints = [dp for dp in resp.get("Datapoints", []) if dp.get("Average") is not None]
+    if not datapoints:
+        return None
+    latest = max(datapoints, key=lambda dp: dp["Timestamp"])
+    return int(latest["Average"])
 
 
 def check_s3_status() -> dict:
-    """List S3 buckets and object counts."""
+    """List S3 buckets and object counts.
+
+    Counts come from the CloudWatch `NumberOfObjects` storage metric (one call
+    per bucket). Buckets without a published metric yet (e.g. created today, or
+    LocalStack) fall back to a paginated listing.
+    """
     s3 = get_client("s3")
     result = {}
     try:
         buckets = s3.list_buckets().get("Buckets", [])
-        for bucket in buckets:
-            name = bucket["Name"]
+        paginator = s3.get_paginator("list_objects_v2")
+        try:
+            cloudwatch = get_client("cloudwatch")
+        except Exception:
+            cloudwatch = None
+
+        def _count(name: str) -> int:
+            if cloudwatch is not None:
+                try:
+                    count = _cloudwatch_object_count(cloudwatch, name)
+                except Exception:
+                    count = None
+                if count is not None:
+                    return count
             try:
-                objects = s3.list_objects_v2(Bucket=name)
-                count = objects.get("KeyCount", 0)
+                # Each page holds at most 1000 keys; sum across pages for a complete count.
+                return sum(
+                    page.get("KeyCount", 0)
+                    for page in paginator.paginate(Bucket=name, PaginationConfig={"PageSize": 1000})
+                )
             except Exception:
-                count = -1
-            result[name] = {"object_count": count}
+                return -1
+
+        names = [bucket["Name"] for bucket in buckets]
+        with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as ex:
+            for name, count in zip(names, ex.map(_count, names)):
+                result[name] = {"object_count": count}
     except Exception as e:
         result["_error"] = str(e)
     return result
@@ -29,18 +84,22 @@ def check_sqs_status() -> dict:
     sqs = get_client("sqs")
     result = {}
     try:
-        queues = sqs.list_queues()
-        queue_urls = queues.get("QueueUrls", [])
-        for url in queue_urls:
-            attrs = sqs.get_queue_attributes(
+        paginator = sqs.get_paginator("list_queues")
+        queue_urls = [url for page in paginator.paginate() for url in page.get("QueueUrls", [])]
+
+        def _attributes(url: str) -> dict:
+            return sqs.get_queue_attributes(
                 QueueUrl=url,
                 AttributeNames=["ApproximateNumberOfMessages"],
             )
-            name = url.split("/")[-1]
-            msg_count = int(
-                attrs.get("Attributes", {}).get("ApproximateNumberOfMessages", 0)
-            )
-            result[name] = {"queue_url": url, "message_count": msg_count}
+
+        with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as ex:
+            for url, attrs in zip(queue_urls, ex.map(_attributes, queue_urls)):
+                name = url.rsplit("/", 1)[-1]
+                msg_count = int(
+                    attrs.get("Attributes", {}).get("ApproximateNumberOfMessages", 0)
+                )
+                result[name] = {"queue_url": url, "message_count": msg_count}
     except Exception as e:
         result["_error"] = str(e)
     return result
@@ -51,15 +110,16 @@ def check_lambda_status() -> dict:
     lam = get_client("lambda")
     result = {}
     try:
-        functions = lam.list_functions().get("Functions", [])
-        for fn in functions:
-            name = fn["FunctionName"]
-            result[name] = {
-                "runtime": fn.get("Runtime", "N/A"),
-                "memory": fn.get("MemorySize", 0),
-                "timeout": fn.get("Timeout", 0),
-                "last_modified": fn.get("LastModified", "N/A"),
-            }
+        paginator = lam.get_paginator("list_functions")
+        for page in paginator.paginate():
+            for fn in page.get("Functions", []):
+                name = fn["FunctionName"]
+                result[name] = {
+                    "runtime": fn.get("Runtime", "N/A"),
+                    "memory": fn.get("MemorySize", 0),
+                    "timeout": fn.get("Timeout", 0),
+                    "last_modified": fn.get("LastModified", "N/A"),
+                }
     except Exception as e:
         result["_error"] = str(e)
     return result
@@ -75,4 +135,4 @@ def check_all_status() -> dict:
 
 
 if __name__ == "__main__":
-    print(json.dumps(check_all_status(), indent=2, default=str))
+    print(json_codec.dumps(check_all_status(), indent=True).decode("utf-8"))
@@ -1,7 +1,10 @@
-"""Tiny stdlib HTTP helpers (Lambda-friendly).
+"""Tiny HTTP helpers (Lambda-friendly).
 
 We keep HTTP logic here so Lambdas and local scripts can share behavior without
-pulling in third-party dependencies like `requests`.
+pulling in third-party dependencies like `requests`. Requests go through a
+shared `urllib3.PoolManager` (urllib3 ships with botocore, so it is already in
+the Lambda runtime) so keep-alive connections are reused across calls. Errors
+are surfaced as `urllib.error` exceptions, which callers match on.
 """
 
 from __future__ import annotations
@@ -11,10 +14,14 @@ import random
 import ssl
 import time
 import urllib.error
-import urllib.request
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+import urllib3
+
+from src.helpers import json_codec
+
 _DEFAULT_RETRYABLE_HTTP_STATUS: set[int] = {429, 500, 502, 503, 504}
 
 
@@ -84,6 +91,122 @@ def _ssl_context() -> ssl.SSLContext:
         return ssl.create_default_context()
 
 
+@lru_cache(maxsize=1)
+def _pool_manager() -> urllib3.PoolManager:
+    return urllib3.PoolManager(num_pools=4, maxsize=16, ssl_context=_ssl_context())
+
+
+# Follow redirects (like urllib did) but leave every other retry to the callers'
+# backoff loops, which honor Retry-After and add jitter.
+_NO_RETRIES = urllib3.Retry(total=None, connect=0, read=0, status=0, other=0, redirect=5)
+
+
+def _map_urllib3_error(e: urllib3.exceptions.HTTPError) -> Exception:
+    reason = getattr(e, "reason", None) or e
+    # NewConnectionError subclasses ConnectTimeoutError, but a refused
+    # connection is not a timeout.
+    if isinstance(reason, urllib3.exceptions.TimeoutError) and not isinstance(
+        reason, urllib3.exceptions.NewConnectionError
+    ):
+        return TimeoutError(str(reason))
+    return urllib.error.URLError(reason)
+
+
+def _open(
+    method: str,
+    url: str,
+    *,
+    headers: dict[str, str] | None,
+    timeout: int,
+    body: bytes | None = None,
+    preload_content: bool = True,
+):
+    """Issue one request on the shared pool and return the (checked) response."""
+    try:
+        resp = _pool_manager().request(
+            method,
+            url,
+            body=body,
+            headers=headers or {},
+            timeout=urllib3.Timeout(total=timeout),
+            retries=_NO_RETRIES,
+            preload_content=preload_content,
+        )
+    except urllib3.exceptions.HTTPError as e:
+        raise _map_urllib3_error(e) from e
+    if resp.status >= 400:
+        if not preload_content:
+            resp.release_conn()
+        raise urllib.error.HTTPError(url, resp.status, resp.reason or "", resp.headers, None)
+    return resp
+
+
+def _request(
+    method: str,
+    url: str,
+    *,
+    headers: dict[str, str] | None,
+    timeout: int,
+    body: bytes | None = None,
+) -> bytes:
+    """Issue one request on the shared pool and return the response body."""
+    return _open(method, url, headers=headers, timeout=timeout, body=body).data
+
+
+class _CountingReader:
+    """File-like view of a streamed response that counts the bytes read."""
+
+    def __init__(self, resp):
+        self._resp = resp
+        self.bytes_read = 0
+
+    def read(self, amt: int | None = None) -> bytes:
+        try:
+            chunk = self._resp.read(amt)
+        except urllib3.exceptions.HTTPError as e:
+            raise _map_urllib3_error(e) from e
+        self.bytes_read += len(chunk)
+        return chunk
+
+
+def _get_with_retries(
+    url: str,
+    *,
+    headers: dict[str, str] | None,
+    timeout: int,
+    retries: int,
+    backoff_seconds: float,
+    retryable_statuses: set[int] | None,
+    max_backoff_seconds: float,
+):
+    """GET with basic retries and return the (checked, preloaded) response."""
+    if retries < 1:
+        retries = 1
+    retryable = retryable_statuses or _DEFAULT_RETRYABLE_HTTP_STATUS
+
+    last_error: Exception | None = None
+    for attempt in range(retries):
+        try:
+            return _open("GET", url, headers=headers, timeout=timeout)  # nosec - url is controlled by caller
+        except (urllib.error.HTTPError, urllib.error.URLError, TimeoutError) as e:
+            last_error = e
+            if attempt < retries - 1:
+                retry_after = None
+                if isinstance(e, urllib.error.HTTPError):
+                    status = int(getattr(e, "code", 0) or 0)
+                    if status and status not in retryable:
+                        break
+                    retry_after = _parse_retry_after_seconds(e.headers.get("Retry-After"))
+                _sleep_seconds(
+                    attempt=attempt,
+                    backoff_seconds=backoff_seconds,
+                    retry_after_seconds=retry_after,
+                    max_backoff_seconds=max_backoff_seconds,
+                )
+    assert last_error is not None
+    raise last_error
+
+
 def fetch_bytes(
     url: str,
     *,
@@ -95,17 +218,92 @@ def fetch_bytes(
     max_backoff_seconds: float = 60.0,
 ) -> bytes:
     """Fetch bytes from a URL with basic retries."""
+    return _get_with_retries(
+        url,
+        headers=headers,
+        timeout=timeout,
+        retries=retries,
+        backoff_seconds=backoff_seconds,
+        retryable_statuses=retryable_statuses,
+        max_backoff_seconds=max_backoff_seconds,
+    ).data
+
+
+def fetch_bytes_conditional(
+    url: str,
+    *,
+    etag: str | None = None,
+    last_modified: str | None = None,
+    headers: dict[str, str] | None = None,
+    timeout: int = 30,
+    retries: int = 3,
+    backoff_seconds: float = 1.0,
+    retryable_statuses: set[int] | None = None,
+    max_backoff_seconds: float = 60.0,
+) -> tuple[bytes | None, str | None, str | None]:
+    """Conditional GET using a previous response's validators.
+
+    Sends `If-None-Match` / `If-Modified-Since` when given and returns
+    `(body, etag, last_modified)`. `body` is None when the server answers
+    304 Not Modified, i.e. the caller's cached copy is still current.
+    """
+    req_headers = dict(headers or {})
+    if etag:
+        req_headers["If-None-Match"] = etag
+    if last_modified:
+        req_headers["If-Modified-Since"] = last_modified
+
+    resp = _get_with_retries(
+        url,
+        headers=req_headers,
+        timeout=timeout,
+        retries=retries,
+        backoff_seconds=backoff_seconds,
+        retryable_statuses=retryable_statuses,
+        max_backoff_seconds=max_backoff_seconds,
+    )
+    new_etag = resp.headers.get("ETag") or etag
+    new_last_modified = resp.headers.get("Last-Modified") or last_modified
+    if resp.status == 304:
+        return None, new_etag, new_last_modified
+    return resp.data, new_etag, new_last_modified
+
+
+def stream_to_s3(
+    url: str,
+    s3_client,
+    bucket: str,
+    key: str,
+    *,
+    headers: dict[str, str] | None = None,
+    timeout: int = 60,
+    retries: int = 3,
+    backoff_seconds: float = 1.0,
+    retryable_statuses: set[int] | None = None,
+    max_backoff_seconds: float = 60.0,
+    extra_args: dict[str, Any] | None = None,
+) -> int:
+    """Stream a URL straight into S3 and return the number of bytes uploaded.
+
+    The response is piped into `upload_fileobj` (multipart for large bodies), so
+    memory stays bounded by the transfer chunk size instead of the payload size.
+    """
     if retries < 1:
         retries = 1
     retryable = retryable_statuses or _DEFAULT_RETRYABLE_HTTP_STATUS
 
     last_error: Exception | None = None
-    ctx = _ssl_context()
     for attempt in range(retries):
         try:
-            req = urllib.request.Request(url, headers=headers or {})
-            with urllib.request.urlopen(req, timeout=timeout, context=ctx) as resp:  # nosec - url is controlled by caller
-                return resp.read()
+            resp = _open(  # nosec - url is controlled by caller
+                "GET", url, headers=headers, timeout=timeout, preload_content=False
+            )
+            try:
+                reader = _CountingReader(resp)
+                s3_client.upload_fileobj(reader, bucket, key, ExtraArgs=extra_args or None)
+                return reader.bytes_read
+            finally:
+                resp.release_conn()
         except (urllib.error.HTTPError, urllib.error.URLError, TimeoutError) as e:
             last_error = e
             if attempt < retries - 1:
@@ -165,13 +363,14 @@ def fetch_json(
     last_error: Exception | None = None
     for attempt in range(retries):
         try:
-            body = fetch_text(
+            # Parse the raw bytes: both parsers accept them, so no str copy is made.
+            body = fetch_bytes(
                 url,
                 headers=headers,
                 timeout=timeout,
                 retries=1,
             )
-            return json.loads(body)
+            return json_codec.loads(body)
         except (urllib.error.HTTPError, urllib.error.URLError, TimeoutError, json.JSONDecodeError) as e:
             last_error = e
             if attempt < retries - 1:
@@ -212,13 +411,12 @@ def post_json(
     req_headers = {"Content-Type": "application/json", **(headers or {})}
 
     last_error: Exception | None = None
-    ctx = _ssl_context()
     for attempt in range(retries):
         try:
-            req = urllib.request.Request(url, data=body, headers=req_headers, method="POST")
-            with urllib.request.urlopen(req, timeout=timeout, context=ctx) as resp:  # nosec - url is controlled by caller
-                text = resp.read().decode("utf-8", errors="replace")
-            return json.loads(text)
+            data = _request(  # nosec - url is controlled by caller
+                "POST", url, headers=req_headers, timeout=timeout, body=body
+            )
+            return json_codec.loads(data)
         except (urllib.error.HTTPError, urllib.error.URLError, TimeoutError, json.JSONDecodeError) as e:
             last_error = e
             if attempt < retries - 1:
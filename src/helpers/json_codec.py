@@ -0,0 +1,98 @@
+"""JSON encode/decode helpers that use `orjson` when it is installed.
+
+orjson is optional: Lambdas run on the stdlib fallback, while local tooling
+that has it installed gets the faster C parser/serializer. Both paths accept
+bytes or str, return bytes from `dumps`, and stringify unknown types (like
+`json.dumps(..., default=str)`). The stdlib path also follows orjson for
+NaN/Infinity (`null`) and numeric numpy values (plain numbers/lists), so
+`dumps` gives the same bytes whichever backend is installed.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import math
+from typing import Any, BinaryIO
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can catch this.
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data: bytes | bytearray | memoryview | str) -> Any:
+    """Parse a JSON document from bytes (preferred, avoids a str copy) or str.
+
+    Invalid UTF-8 raises `JSONDecodeError` on both paths.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, (bytearray, memoryview)):
+        data = bytes(data)
+    try:
+        return json.loads(data)
+    except UnicodeDecodeError as e:
+        raise JSONDecodeError(f"Invalid UTF-8: {e.reason}", "", e.start) from e
+
+
+# numpy dtype kinds orjson writes as plain JSON numbers/booleans (OPT_SERIALIZE_NUMPY).
+_NUMPY_NUMERIC_KINDS = frozenset("biuf")
+
+
+def _stdlib_compatible(obj: Any) -> Any:
+    """Rewrite the values the stdlib would encode differently from orjson.
+
+    Non-finite floats become None (the stdlib writes invalid `NaN`), and
+    numeric numpy scalars/arrays become Python numbers/lists (the stdlib
+    would stringify them through `default=str`). numpy is never imported.
+    """
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {k: _stdlib_compatible(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_stdlib_compatible(v) for v in obj]
+    if type(obj).__module__ == "numpy" and getattr(getattr(obj, "dtype", None), "kind", None) in _NUMPY_NUMERIC_KINDS:
+        return _stdlib_compatible(obj.tolist())
+    return obj
+
+
+def dumps(obj: Any, *, indent: bool = False) -> bytes:
+    """Serialize `obj` to UTF-8 JSON bytes (two-space indent when `indent`)."""
+    if orjson is not None:
+        # Pass datetimes through to `default=str` so both paths render them alike,
+        # and accept int/float/bool/None dict keys the way the stdlib does.
+        option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=str, option=option)
+    obj = _stdlib_compatible(obj)
+    if indent:
+        text = json.dumps(obj, indent=2, default=str, ensure_ascii=False)
+    else:
+        text = json.dumps(obj, separators=(",", ":"), default=str, ensure_ascii=False)
+    return text.encode("utf-8")
+
+
+def dump(obj: Any, fp: BinaryIO, *, indent: bool = False) -> None:
+    """Serialize `obj` as UTF-8 JSON into the binary file `fp` (same bytes as `dumps`).
+
+    The stdlib path encodes chunk by chunk through a text wrapper instead of
+    building the whole document as one string first; `fp` is left open.
+    """
+    if orjson is not None:
+        fp.write(dumps(obj, indent=indent))
+        return
+    obj = _stdlib_compatible(obj)
+    text = io.TextIOWrapper(fp, encoding="utf-8")
+    try:
+        if indent:
+            json.dump(obj, text, indent=2, default=str, ensure_ascii=False)
+        else:
+            json.dump(obj, text, separators=(",", ":"), default=str, ensure_ascii=False)
+    finally:
+        text.detach()
@@ -12,15 +12,25 @@ import sys
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", ".."))
 
-from src.config import get_bls_bucket, get_bls_key, get_datausa_bucket, get_datausa_key
+from src.config import apply_baked_config, get_bls_bucket, get_bls_key, get_datausa_bucket, get_datausa_key
 from src.helpers.aws_client import get_client
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+apply_baked_config()
+
+# Build the S3 client during Lambda init so warm invocations reuse the cached one.
+if os.environ.get("AWS_LAMBDA_FUNCTION_NAME"):
+    get_client("s3")
+
 
 def handler(event, context):
     """Process SQS messages triggered by S3 uploads."""
+    if isinstance(event, dict) and event.get("warmer"):
+        # Keep-warm ping from the scheduled warmer rule; do no work.
+        return {"statusCode": 200, "body": json.dumps({"warmer": True})}
+
     bls_bucket = get_bls_bucket()
     datausa_bucket = get_datausa_bucket()
     bls_key = get_bls_key()
@@ -30,6 +40,7 @@ def handler(event, context):
 
     results = []
     errors = []
+    batch_item_failures = []
 
     records = event.get("Records", []) if isinstance(event, dict) else []
     if not records:
@@ -49,7 +60,14 @@ def handler(event, context):
             logger.error(f"Error processing direct invocation: {e}")
             errors.append(str(e))
     else:
+        # Every record asks for the same reports, so validate the batch first
+        # and build them once. Failures are reported back per message so SQS
+        # only redelivers those (ReportBatchItemFailures); a record without a
+        # messageId gets an empty identifier, which fails the whole batch
+        # rather than silently dropping it.
+        pending = []
         for record in records:
+            message_id = record.get("messageId") or ""
             try:
                 body = json.loads(record.get("body", "{}"))
                 # S3 notification format
@@ -58,7 +76,15 @@ def handler(event, context):
                     bucket_name = s3_record.get("s3", {}).get("bucket", {}).get("name", "")
                     key = s3_record.get("s3", {}).get("object", {}).get("key", "")
                     logger.info(f"Processing S3 event: {bucket_name}/{key}")
+            except Exception as e:
+                logger.error(f"Error processing record: {e}")
+                errors.append(str(e))
+                batch_item_failures.append({"itemIdentifier": message_id})
+            else:
+                pending.append(message_id)
 
+        if pending:
+            try:
                 report = run_reports(
                     bls_bucket,
                     datausa_bucket,
@@ -70,14 +96,19 @@ def handler(event, context):
                 results.append(report)
                 logger.info(f"Report results: {json.dumps(report, default=str)}")
             except Exception as e:
-                logger.error(f"Error processing record: {e}")
+                # No record got its report; hand every one back for redelivery.
+                logger.error(f"Error processing batch: {e}")
                 errors.append(str(e))
+                batch_item_failures.extend({"itemIdentifier": message_id} for message_id in pending)
 
     status = 200 if not errors else 207
-    return {
+    response = {
         "statusCode": status,
         "body": json.dumps({"results": results, "errors": errors}, default=str),
     }
+    if records:
+        response["batchItemFailures"] = batch_item_failures
+    return response
 
 
 def run_reports(
@@ -3,32 +3,50 @@
 import json
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 # Add project root to path for Lambda deployment
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", ".."))
 
 from src.data_fetchers.bls_getter import sync_all as sync_bls
 from src.data_fetchers.datausa_getter import sync_all as sync_datausa
-from src.config import get_bls_bucket, get_datausa_bucket, get_bls_series_list
+from src.config import apply_baked_config, get_bls_bucket, get_datausa_bucket, get_bls_series_list
+from src.helpers.aws_client import get_client
+
+apply_baked_config()
+
+# Build the S3 client during Lambda init so warm invocations reuse the cached one.
+if os.environ.get("AWS_LAMBDA_FUNCTION_NAME"):
+    get_client("s3")
 
 
 def handler(event, context):
     """Lambda entry point: fetch BLS and DataUSA data."""
+    if isinstance(event, dict) and event.get("warmer"):
+        # Keep-warm ping from the scheduled warmer rule; do no work.
+        return {"statusCode": 200, "body": json.dumps({"warmer": True})}
+
     bls_bucket = get_bls_bucket()
     datausa_bucket = get_datausa_bucket()
     bls_series = get_bls_series_list()
 
     results = {"bls": None, "datausa": None, "errors": []}
 
+    # BLS and DataUSA are independent hosts, so run the two syncs side by side;
+    # each keeps its own inter-request pacing.
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        bls_future = ex.submit(sync_bls, series_list=bls_series, bucket=bls_bucket)
+        datausa_future = ex.submit(sync_datausa, bucket=datausa_bucket)
+
     # Fetch BLS data
     try:
-        results["bls"] = sync_bls(series_list=bls_series, bucket=bls_bucket)
+        results["bls"] = bls_future.result()
     except Exception as e:
         results["errors"].append({"source": "bls", "error": str(e)})
 
     # Fetch DataUSA data
     try:
-        results["datausa"] = sync_datausa(bucket=datausa_bucket)
+        results["datausa"] = datausa_future.result()
         for err in results["datausa"].get("errors", []):
             results["errors"].append({"source": "datausa", **err})
     except Exception as e:
@@ -7,6 +7,9 @@ import boto3
 import pytest
 from moto import mock_aws
 
+from src.config import clear_config_cache
+from src.helpers.aws_client import clear_client_cache
+
 
 @pytest.fixture(autouse=True)
 def default_project_env(monkeypatch):
@@ -37,6 +40,13 @@ def default_project_env(monkeypatch):
     for key, value in defaults.items():
         monkeypatch.setenv(key, value)
 
+    # Cached clients/config would otherwise leak endpoints/mocks/env between tests.
+    clear_config_cache()
+    clear_client_cache()
+    yield
+    clear_config_cache()
+    clear_client_cache()
+
 
 @pytest.fixture
 def aws_credentials():
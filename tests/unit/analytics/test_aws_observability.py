@@ -2,11 +2,22 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
+import json
+import threading
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
 
 from src.analytics import aws_observability
 
 
+@pytest.fixture(autouse=True)
+def _fresh_obs_config():
+    aws_observability._obs_config.cache_clear()
+    yield
+    aws_observability._obs_config.cache_clear()
+
+
 class StubCloudWatch:
     def __init__(self, *, datapoints_by_key: dict[tuple, list[dict]]):
         self._data = datapoints_by_key
@@ -27,6 +38,26 @@ class StubCloudWatch:
         key = (Namespace, MetricName, dims, stat)
         return {"Datapoints": self._data.get(key, [])}
 
+    def get_metric_data(self, *, MetricDataQueries, StartTime, EndTime, ScanBy, NextToken=None):
+        self.metric_data_calls = getattr(self, "metric_data_calls", 0) + 1
+        results = []
+        for query in MetricDataQueries:
+            stat = query["MetricStat"]
+            metric = stat["Metric"]
+            dims = tuple((d.get("Name"), d.get("Value")) for d in metric["Dimensions"])
+            key = (metric["Namespace"], metric["MetricName"], dims, stat["Stat"])
+            points = self._data.get(key, [])
+            results.append({
+                "Id": query["Id"],
+                "Timestamps": [p["Timestamp"] for p in points],
+                "Values": [p[stat["Stat"]] for p in points],
+                "StatusCode": self.status_for(metric["MetricName"]),
+            })
+        return {"MetricDataResults": results}
+
+    def status_for(self, metric_name: str) -> str:
+        return "Complete"
+
 
 class StubCostExplorer:
     def __init__(self, *, actual_by_date: dict[str, str], forecast_by_date: dict[str, dict[str, str]]):
@@ -98,6 +129,7 @@ def test_build_payload_includes_metrics_and_cost(monkeypatch):
         raise ValueError(service)
 
     monkeypatch.setattr(aws_observability, "get_client", fake_get_client)
+    monkeypatch.setenv("FOMC_COST_USE_CE_FORECAST", "1")
 
     payload = aws_observability.build_aws_observability_payload(
         now=now,
@@ -111,6 +143,7 @@ def test_build_payload_includes_metrics_and_cost(monkeypatch):
 
     assert payload["metric_dates"] == ["2026-02-02", "2026-02-03", "2026-02-04"]
     assert payload["errors"] == []
+    assert cw.metric_data_calls == 1
 
     series = payload["metrics"]["series"]
     assert len(series) == len(aws_observability.LAMBDA_METRICS) + len(aws_observability.SQS_METRICS)
@@ -128,4 +161,256 @@ def test_build_payload_includes_metrics_and_cost(monkeypatch):
     assert cost["predicted"] == [None, None, 0.16, 0.17]
     assert cost["predicted_lower"] == [None, None, 0.12, 0.13]
     assert cost["predicted_upper"] == [None, None, 0.20, 0.21]
+    assert cost["forecast_method"] == "cost-explorer"
+
+
+def test_build_payload_forecasts_locally_by_default(monkeypatch):
+    class NoForecastCostExplorer(StubCostExplorer):
+        def get_cost_forecast(self, **kwargs):
+            raise AssertionError("GetCostForecast should not be called")
+
+    ce = NoForecastCostExplorer(
+        actual_by_date={
+            "2026-01-31": "1.00",
+            "2026-02-01": "1.00",
+            "2026-02-02": "2.00",
+            "2026-02-03": "1.00",
+            "2026-02-04": "0.50",
+        },
+        forecast_by_date={},
+    )
+    monkeypatch.setattr(aws_observability, "get_client", lambda service: ce)
+
+    payload = aws_observability.build_aws_observability_payload(
+        now=datetime(2026, 2, 4, 12, 0, tzinfo=timezone.utc),
+        window_days=5,
+        forecast_days=2,
+        include_metrics=False,
+    )
+
+    cost = payload["cost"]
+    assert payload["errors"] == []
+    assert cost["forecast_method"] == "local"
+    assert cost["dates"][-2:] == ["2026-02-04", "2026-02-05"]
+    # Smoothed over the four complete days (today's partial 0.50 is ignored).
+    assert cost["predicted"][-2:] == [1.21, 1.21]
+    assert cost["predicted"][:4] == [None, None, None, None]
+    lower, upper = cost["predicted_lower"][-1], cost["predicted_upper"][-1]
+    assert 0.0 <= lower <= 1.21 <= upper
+
+
+def test_obs_config_forecasts_locally_unless_ce_enabled(monkeypatch):
+    assert aws_observability._obs_config().use_ce_forecast is False
+
+    monkeypatch.setenv("FOMC_COST_USE_CE_FORECAST", "true")
+    aws_observability._obs_config.cache_clear()
+    assert aws_observability._obs_config().use_ce_forecast is True
+
+
+def test_forecast_cost_locally_centers_widening_bounds_on_a_trend():
+    start = date(2026, 2, 4)
+    history = {(start - timedelta(days=30 - i)).isoformat(): 1.0 + 0.1 * i for i in range(30)}
+
+    forecast = aws_observability.forecast_cost_locally(history, start_date=start, days=30)
+
+    rows = list(forecast.values())
+    assert len(rows) == 30
+    assert all(row["lower"] <= row["mean"] <= row["upper"] for row in rows)
+    assert rows[0]["lower"] < rows[0]["mean"] < rows[0]["upper"]
+    widths = [row["upper"] - row["lower"] for row in rows]
+    assert widths == sorted(widths) and widths[-1] > widths[0]
+
+
+def test_forecast_cost_locally_needs_three_residuals():
+    start = date(2026, 2, 4)
+    three_days = {"2026-02-01": 1.0, "2026-02-02": 2.0, "2026-02-03": 1.0}
+    assert aws_observability.forecast_cost_locally(three_days, start_date=start, days=3) == {}
+    assert aws_observability.forecast_cost_locally({**three_days, "2026-01-31": 1.0}, start_date=start, days=0) == {}
+    assert len(aws_observability.forecast_cost_locally({**three_days, "2026-01-31": 1.0}, start_date=start, days=3)) == 3
+
+
+def test_build_payload_keeps_series_order_and_reports_failures(monkeypatch):
+    class FlakyCloudWatch(StubCloudWatch):
+        def status_for(self, metric_name: str) -> str:
+            return "Forbidden" if metric_name == "Errors" else "Complete"
+
+    cw = FlakyCloudWatch(datapoints_by_key={})
+    monkeypatch.setattr(aws_observability, "get_client", lambda service: cw)
+
+    payload = aws_observability.build_aws_observability_payload(
+        now=datetime(2026, 2, 4, 12, 0, tzinfo=timezone.utc),
+        window_days=2,
+        lambda_functions=["fn-a", "fn-b"],
+        sqs_queues=["queue-a"],
+        include_s3_storage_metrics=True,
+        include_cost=False,
+    )
+
+    ids = [s["id"] for s in payload["metrics"]["series"]]
+    assert ids[0] == "lambda.fn-a.Invocations.Sum"
+    assert ids[len(aws_observability.LAMBDA_METRICS)] == "lambda.fn-b.Invocations.Sum"
+    assert ids[-1] == "s3.fomc-site.BucketSizeBytes.Average.StandardStorage"
+    assert [(e["resource"], e["metric"]) for e in payload["errors"]] == [
+        ("fn-a", "Errors"),
+        ("fn-b", "Errors"),
+    ]
+
+
+def test_fetch_cloudwatch_series_batch_follows_next_token():
+    day1 = datetime(2026, 2, 3, 0, 0, tzinfo=timezone.utc)
+    day2 = datetime(2026, 2, 4, 0, 0, tzinfo=timezone.utc)
+
+    class PagedCloudWatch:
+        def __init__(self):
+            self.tokens = []
+
+        def get_metric_data(self, *, MetricDataQueries, StartTime, EndTime, ScanBy, NextToken=None):
+            self.tokens.append(NextToken)
+            ids = [q["Id"] for q in MetricDataQueries]
+            if NextToken is None:
+                return {
+                    "MetricDataResults": [
+                        {"Id": ids[0], "Timestamps": [day1], "Values": [1.0], "StatusCode": "PartialData"},
+                        {"Id": ids[1], "Timestamps": [], "Values": [], "StatusCode": "Complete"},
+                    ],
+                    "NextToken": "page-2",
+                }
+            return {
+                "MetricDataResults": [
+                    {"Id": ids[0], "Timestamps": [day2], "Values": [3.0], "StatusCode": "Complete"},
+                ],
+            }
+
+    cw = PagedCloudWatch()
+    lambda_dims = [{"Name": "FunctionName", "Value": "fn"}]
+    results = aws_observability.fetch_cloudwatch_series_batch(
+        cw,
+        [
+            (aws_observability.LAMBDA_METRICS[0], lambda_dims),
+            (aws_observability.LAMBDA_METRICS[1], lambda_dims),
+        ],
+        start_time=day1,
+        end_time=day2,
+    )
+
+    assert cw.tokens == [None, "page-2"]
+    assert results == [
+        ({"2026-02-03": 1.0, "2026-02-04": 3.0}, None),
+        ({}, None),
+    ]
+
+
+def test_export_reuses_fresh_sections(monkeypatch, tmp_path):
+    class CountingCostExplorer(StubCostExplorer):
+        calls = 0
+
+        def get_cost_and_usage(self, **kwargs):
+            CountingCostExplorer.calls += 1
+            return super().get_cost_and_usage(**kwargs)
+
+    cw = StubCloudWatch(datapoints_by_key={})
+    ce = CountingCostExplorer(actual_by_date={"2026-02-04": "0.15"}, forecast_by_date={})
+    monkeypatch.setattr(aws_observability, "get_client", lambda service: cw if service == "cloudwatch" else ce)
+    out = tmp_path / "aws_observability.json"
+    first = datetime(2026, 2, 4, 12, 0, tzinfo=timezone.utc)
+
+    def export(now):
+        return aws_observability.export_aws_observability(out_path=out, now=now, window_days=3, forecast_days=2)
+
+    # Metrics, then the S3 storage sidecar, then cost.
+    export(first)
+    assert (cw.metric_data_calls, CountingCostExplorer.calls) == (2, 1)
+    assert (tmp_path / aws_observability.S3_STORAGE_FILENAME).exists()
+
+    # Both halves still fresh: nothing is refetched.
+    export(first + timedelta(minutes=30))
+    assert (cw.metric_data_calls, CountingCostExplorer.calls) == (2, 1)
+
+    # Metrics TTL (1h) expired, cost TTL (6h) not; the daily sidecar is reused.
+    export(first + timedelta(hours=2))
+    assert (cw.metric_data_calls, CountingCostExplorer.calls) == (3, 1)
+
+    payload = json.loads(out.read_text())
+    assert payload["metrics"]["series"][-1]["id"] == "s3.fomc-site.BucketSizeBytes.Average.StandardStorage"
+    assert payload["metrics"]["generated_at"] == "2026-02-04T14:00:00Z"
+    assert payload["cost"]["generated_at"] == "2026-02-04T12:00:00Z"
+    assert payload["cost"]["actual"][2] == 0.15
+
+
+def test_build_payload_fetches_metrics_and_cost_concurrently(monkeypatch):
+    # Each call blocks until all three are in flight, so a sequential build would time out.
+    barrier = threading.Barrier(3, timeout=5)
+
+    class BarrierCloudWatch(StubCloudWatch):
+        def get_metric_data(self, **kwargs):
+            barrier.wait()
+            return super().get_metric_data(**kwargs)
+
+    class BarrierCostExplorer(StubCostExplorer):
+        def get_cost_and_usage(self, **kwargs):
+            barrier.wait()
+            return super().get_cost_and_usage(**kwargs)
+
+        def get_cost_forecast(self, **kwargs):
+            barrier.wait()
+            return super().get_cost_forecast(**kwargs)
+
+    cw = BarrierCloudWatch(datapoints_by_key={})
+    ce = BarrierCostExplorer(actual_by_date={"2026-02-04": "0.15"}, forecast_by_date={})
+    monkeypatch.setattr(aws_observability, "get_client", lambda service: cw if service == "cloudwatch" else ce)
+    monkeypatch.setenv("FOMC_COST_USE_CE_FORECAST", "1")
+
+    payload = aws_observability.build_aws_observability_payload(
+        now=datetime(2026, 2, 4, 12, 0, tzinfo=timezone.utc),
+        window_days=3,
+        forecast_days=2,
+        lambda_functions=["fn"],
+        sqs_queues=[],
+        include_s3_storage_metrics=False,
+    )
+
+    assert payload["errors"] == []
+    assert payload["cost"]["actual"][2] == 0.15
+
+
+def test_obs_config_builds_cost_filter_once(monkeypatch):
+    monkeypatch.setenv("FOMC_COST_TAG_KEY", "Project")
+    monkeypatch.setenv("FOMC_COST_TAG_VALUES", "fomc-agent")
+    monkeypatch.setenv("FOMC_COST_SERVICES", "AWS Lambda")
+
+    config = aws_observability._obs_config()
+
+    assert aws_observability._obs_config() is config
+    assert config.cost_filter == {"And": [
+        {"Tags": {"Key": "Project", "Values": ["fomc-agent"], "MatchOptions": ["EQUALS"]}},
+        {"Dimensions": {"Key": "SERVICE", "Values": ["AWS Lambda"]}},
+    ]}
+
+
+def test_fetch_cost_actual_follows_next_page_token():
+    class PagedCostExplorer:
+        def __init__(self):
+            self.tokens = []
+
+        def get_cost_and_usage(self, *, TimePeriod, Granularity, Metrics, NextPageToken=None):
+            self.tokens.append(NextPageToken)
+            start = "2026-02-03" if NextPageToken is None else "2026-02-04"
+            resp = {"ResultsByTime": [{
+                "TimePeriod": {"Start": start},
+                "Total": {"UnblendedCost": {"Amount": "0.25", "Unit": "USD"}},
+            }]}
+            if NextPageToken is None:
+                resp["NextPageToken"] = "page-2"
+            return resp
+
+    ce = PagedCostExplorer()
+    values, currency = aws_observability.fetch_cost_actual(
+        ce,
+        start_date="2026-02-03",
+        end_date_exclusive="2026-02-05",
+        cost_filter=None,
+    )
 
+    assert ce.tokens == [None, "page-2"]
+    assert values == {"2026-02-03": 0.25, "2026-02-04": 0.25}
+    assert currency == "USD"
@@ -1,9 +1,23 @@
 """Tests for parsing BLS release schedule pages."""
 
-from src.analytics.bls_release_schedule import extract_tables, parse_schedule_html
+from datetime import datetime, timezone
 
+import pytest
 
-def test_extract_tables_finds_table_cells():
+from src.analytics import bls_release_schedule
+from src.analytics.bls_release_schedule import _parse_date, _parse_time, extract_tables, parse_schedule_html
+
+
+@pytest.fixture(params=["lxml", "stdlib"])
+def table_parser(request, monkeypatch):
+    if request.param == "stdlib":
+        monkeypatch.setattr(bls_release_schedule, "lxml_html", None)
+    elif bls_release_schedule.lxml_html is None:
+        pytest.skip("lxml not installed")
+    return request.param
+
+
+def test_extract_tables_finds_table_cells(table_parser):
     html = """
     <html><body>
       <table>
@@ -43,3 +57,128 @@ def test_parse_schedule_html_parses_release_dates_and_times_to_utc():
     assert events[0]["release"] == "Consumer Price Index"
     assert events[0]["scheduled_time"] == "2026-02-10T13:30:00Z"  # 8:30 ET in winter
     assert events[1]["scheduled_time"] == "2026-03-12T12:30:00Z"  # 8:30 ET in DST (EDT)
+
+
+def test_extract_tables_skips_blank_rows_and_collapses_whitespace(table_parser):
+    html = """
+    <table>
+      <tr><th>Release\n   Date</th><th>Release&nbsp;Time</th></tr>
+      <tr><td> </td><td></td></tr>
+      <tr><td><b>March 12,</b> 2026</td><td>8:30 a.m.</td></tr>
+    </table>
+    <table></table>
+    """
+    assert extract_tables(html) == [[
+        ["Release Date", "Release Time"],
+        ["March 12, 2026", "8:30 a.m."],
+    ]]
+    assert extract_tables("") == []
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        "February 10, 2026",
+        "Tuesday, Feb 10th, 2026",
+        "Feb. 10 2026",
+        "feb 10, 2026",
+        "2/10/2026",
+        "2026-02-10",
+    ],
+)
+def test_parse_date_accepts_schedule_formats(raw):
+    assert _parse_date(raw) == datetime(2026, 2, 10)
+
+
+@pytest.mark.parametrize("raw", ["", "TBD", "Febuary 10, 2026", "February 30, 2026", "10 February 2026"])
+def test_parse_date_rejects_unparseable_values(raw):
+    assert _parse_date(raw) is None
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        ("8:30 a.m. (ET)", (8, 30)),
+        ("  8 : 30\n  AM ", (8, 30)),
+        ("10:00 p.m.", (22, 0)),
+        ("12 pm", (12, 0)),
+        ("12:15 a.m.", (0, 15)),
+        ("", None),
+        ("TBD", None),
+    ],
+)
+def test_parse_time_tolerates_internal_whitespace(raw, expected):
+    assert _parse_time(raw) == expected
+
+
+def test_load_scheduled_releases_filters_to_window_and_sorts(monkeypatch):
+    pages = {
+        "https://example.test/cpi.htm": """
+            <table>
+              <tr><th>Release Date</th><th>Release Time</th></tr>
+              <tr><td>March 12, 2026</td><td>8:30 a.m.</td></tr>
+              <tr><td>February 10, 2026</td><td>8:30 a.m.</td></tr>
+              <tr><td>April 10, 2026</td><td>8:30 a.m.</td></tr>
+            </table>
+        """,
+    }
+    fetched = []
+
+    def fake_fetch(url):
+        fetched.append(url)
+        return pages[url]
+
+    monkeypatch.setenv(
+        "BLS_RELEASE_SCHEDULE_SOURCES",
+        "cu=https://example.test/cpi.htm,ce=https://example.test/down.htm,ln=https://example.test/down.htm",
+    )
+    monkeypatch.setattr(bls_release_schedule, "fetch_schedule_html", fake_fetch)
+
+    events = bls_release_schedule.load_scheduled_releases(
+        series_list=["cu", "ce", "ln"],
+        start=datetime(2026, 2, 10, 13, 30, tzinfo=timezone.utc),
+        end=datetime(2026, 3, 31),
+    )
+
+    assert [e["scheduled_time"] for e in events] == ["2026-02-10T13:30:00Z", "2026-03-12T12:30:00Z"]
+    # Shared pages are fetched once; a failing page is skipped.
+    assert sorted(fetched) == ["https://example.test/cpi.htm", "https://example.test/down.htm"]
+
+
+def test_fetch_schedule_html_caches_and_revalidates(monkeypatch, tmp_path):
+    monkeypatch.setenv("BLS_SCHEDULE_CACHE_DIR", str(tmp_path))
+    calls = []
+
+    def fake_conditional(url, *, etag=None, last_modified=None, **_kwargs):
+        calls.append((etag, last_modified))
+        if etag == '"v1"':
+            return None, '"v1"', last_modified  # 304 Not Modified
+        return b"<table>v1</table>", '"v1"', "Tue, 10 Feb 2026 13:30:00 GMT"
+
+    clock = [1_000_000.0]
+    monkeypatch.setattr(bls_release_schedule, "fetch_bytes_conditional", fake_conditional)
+    monkeypatch.setattr(bls_release_schedule.time, "time", lambda: clock[0])
+    url = "https://example.test/cpi.htm"
+
+    assert bls_release_schedule.fetch_schedule_html(url) == "<table>v1</table>"
+
+    # Within the TTL the disk copy is returned without a request.
+    clock[0] += 60
+    assert bls_release_schedule.fetch_schedule_html(url) == "<table>v1</table>"
+    assert calls == [(None, None)]
+
+    # After the TTL the page is revalidated, even in the same process; a 304
+    # reuses the cached body.
+    clock[0] += bls_release_schedule.SCHEDULE_CACHE_TTL_SECONDS
+    assert bls_release_schedule.fetch_schedule_html(url) == "<table>v1</table>"
+    assert calls == [(None, None), ('"v1"', "Tue, 10 Feb 2026 13:30:00 GMT")]
+
+
+def test_select_schedule_table_matches_plain_and_punctuated_headers():
+    plain = [["Reference Month", "Release Date", "Release Time"], ["January 2026", "February 10, 2026", "8:30 a.m."]]
+    punctuated = [["Date:", "Time:"], ["February 10, 2026", "8:30 a.m."]]
+    unrelated = [["Series", "Value"], ["cu", "1"]]
+
+    assert bls_release_schedule._select_schedule_table([unrelated, plain]) == (plain, 1, 2)
+    assert bls_release_schedule._select_schedule_table([punctuated]) == (punctuated, 0, 1)
+    assert bls_release_schedule._select_schedule_table([unrelated, []]) is None
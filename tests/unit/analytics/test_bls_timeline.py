@@ -1,13 +1,15 @@
 """Tests for BLS change timeline export."""
 
 import json
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 import boto3
 from moto import mock_aws
 
 from src.analytics.bls_timeline import (
+    _parse_iso_datetime,
     build_bls_change_timeline,
+    build_release_timeline,
     export_bls_change_timeline,
     load_bls_change_events_from_s3,
 )
@@ -26,6 +28,8 @@ def test_load_bls_change_events_from_s3_filters_to_changes_only():
             "source_modified": "2026-02-01T08:30:00",
         }),
         "not json",
+        "",
+        "[1, 2]",
         json.dumps({
             "timestamp": "2026-02-03T04:00:00+00:00",
             "file": "pr.data.0.Current",
@@ -145,3 +149,77 @@ def test_export_bls_change_timeline_writes_json(tmp_path):
     assert payload["generated_at"] == "2026-02-04T00:00:00Z"
     assert len(payload["events"]) == 2
     assert {e["series"] for e in payload["events"]} == {"pr", "cu"}
+
+
+def test_build_bls_change_timeline_orders_newest_first_then_series_and_file():
+    now = datetime(2026, 2, 4, 0, 0, tzinfo=timezone.utc)
+
+    def event(series, filename, observed_at):
+        return {"series": series, "file": filename, "action": "updated", "observed_at": observed_at}
+
+    payload = build_bls_change_timeline(
+        [
+            event("pr", "b", "2026-02-01T00:00:00+00:00"),
+            event("pr", "a", "2026-02-01T00:00:00+00:00"),
+            event("cu", "z", "2026-02-01T00:00:00+00:00"),
+            event("ce", "x", "2026-02-03T00:00:00+00:00"),
+        ],
+        now=now,
+    )
+
+    assert [(e["series"], e["file"]) for e in payload["events"]] == [
+        ("ce", "x"),
+        ("cu", "z"),
+        ("pr", "a"),
+        ("pr", "b"),
+    ]
+
+
+def test_build_bls_change_timeline_orders_sub_second_times_chronologically():
+    now = datetime(2026, 2, 4, 0, 0, tzinfo=timezone.utc)
+    payload = build_bls_change_timeline(
+        [
+            {"series": "cu", "file": "whole", "action": "updated", "observed_at": "2026-02-01T00:00:00Z"},
+            {"series": "cu", "file": "half", "action": "updated", "observed_at": "2026-02-01T00:00:00.500000Z"},
+        ],
+        now=now,
+    )
+
+    # "...00.500000Z" sorts before "...00Z" as a string; order must follow time.
+    assert [e["event_time"] for e in payload["events"]] == [
+        "2026-02-01T00:00:00.500000Z",
+        "2026-02-01T00:00:00Z",
+    ]
+
+
+def test_build_release_timeline_matches_closest_actual_update():
+    actual = [
+        {"series": "cu", "action": "updated", "event_time": "2026-02-10T13:40:00Z", "bytes": 10},
+        {"series": "cu", "action": "added", "event_time": "2026-02-10T13:40:00Z", "bytes": 5},
+        {"series": "cu", "action": "updated", "event_time": "2026-02-11T09:00:00Z", "bytes": 1},
+        {"series": "cu", "action": "deleted", "event_time": "2026-02-10T13:31:00Z"},
+    ]
+    scheduled = [
+        {"series": "cu", "scheduled_time": "2026-03-12T12:30:00Z"},
+        {"series": "cu", "scheduled_time": "2026-02-10T13:30:00Z"},
+    ]
+
+    releases = build_release_timeline(scheduled=scheduled, actual_events=actual)
+
+    assert [r["scheduled_time"] for r in releases] == ["2026-02-10T13:30:00Z", "2026-03-12T12:30:00Z"]
+    assert releases[0]["actual_time"] == "2026-02-10T13:40:00Z"
+    assert releases[0]["delay_minutes"] == 10.0
+    assert (releases[0]["actual_files_changed"], releases[0]["actual_bytes_changed"]) == (2, 15)
+    assert releases[1]["actual_time"] is None
+
+
+def test_parse_iso_datetime_normalizes_to_utc():
+    est = timezone(timedelta(hours=-5))
+    utc_dt = datetime(2026, 2, 10, 13, 30, tzinfo=timezone.utc)
+
+    assert _parse_iso_datetime(" 2026-02-10T13:30:00Z ", default_tz=est) == utc_dt
+    assert _parse_iso_datetime("2026-02-10T13:30:00Z", default_tz=est).tzinfo is timezone.utc
+    assert _parse_iso_datetime("2026-02-10T08:30:00-05:00", default_tz=timezone.utc) == utc_dt
+    assert _parse_iso_datetime("2026-02-10T08:30:00", default_tz=est) == utc_dt
+    assert _parse_iso_datetime("not a date", default_tz=est) is None
+    assert _parse_iso_datetime(None, default_tz=est) is None
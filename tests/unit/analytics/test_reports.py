@@ -1,12 +1,32 @@
 """Tests for analytics/reports.py (pandas implementation)."""
 
+import io
+import json
+
+import boto3
 import pandas as pd
+import pytest
+from moto import mock_aws
 
+from src.analytics import reports
 from src.analytics.reports import (
+    _annualize_bls_monthly_series,
+    _index_bls_by_series,
+    _infer_numeric_measure_column,
+    _json_records,
+    _is_datausa_measure_candidate,
+    _national_rows,
+    _pr_index_series,
+    build_pipeline_status,
+    load_bls_from_s3,
+    load_datausa_jsonrecords_from_s3,
+    load_population_from_s3,
     report_population_stats,
     report_best_year_by_series,
     report_series_population_join,
     build_timeseries_payload,
+    export_site_payload,
+    run_all_reports,
 )
 
 
@@ -33,6 +53,19 @@ def test_report_1_population_stats_mean_and_stddev():
     assert result["stddev"] > 0
 
 
+def test_report_1_population_stats_skips_missing_population_like_pandas():
+    pop_df = pd.DataFrame({
+        "Year": pd.array([2013, 2014, 2015, 2019], dtype="Int64"),
+        "Population": pd.array([100, None, 104, 999], dtype="Int64"),
+    })
+
+    result = report_population_stats(pop_df)
+    expected = pd.Series([100.0, 104.0])
+
+    assert result["mean"] == expected.mean()
+    assert result["stddev"] == expected.std(ddof=1)
+
+
 def test_report_2_best_year_by_series():
     bls_df = pd.DataFrame(
         [
@@ -107,3 +140,357 @@ def test_build_timeseries_payload_shape():
     assert payload["points"][0]["year"] == 2017
     assert payload["points"][1]["bls_value"] == 1.9
 
+
+@pytest.fixture(params=["pyarrow", "pandas"])
+def tsv_reader(request, monkeypatch):
+    if request.param == "pandas":
+        monkeypatch.setattr(reports, "pa_csv", None)
+    elif reports.pa_csv is None:
+        pytest.skip("pyarrow not installed")
+    return request.param
+
+
+@mock_aws
+def test_load_bls_from_s3_trims_padding_and_casts_numbers(tsv_reader):
+    s3 = boto3.client("s3", region_name="us-east-1")
+    s3.create_bucket(Bucket="bls")
+    s3.put_object(
+        Bucket="bls",
+        Key="pr.data.0.Current",
+        Body=(
+            "series_id        \tyear\tperiod\t       value\tfootnote_codes\n"
+            "PRS30006011      \t2024\tM01\t         1.5\t\n"
+            "PRS30006011      \t2024\tM13\t         2.0\tP\n"
+        ).encode("utf-8"),
+    )
+
+    df = load_bls_from_s3(bucket="bls", key="pr.data.0.Current")
+
+    assert list(df.columns) == ["series_id", "year", "period", "value", "footnote_codes"]
+    assert isinstance(df["series_id"].dtype, pd.CategoricalDtype)
+    assert df["series_id"].tolist() == ["PRS30006011", "PRS30006011"]
+    assert df["period"].tolist() == ["M01", "M13"]
+    assert str(df["year"].dtype) == "Int64"
+    assert df["year"].tolist() == [2024, 2024]
+    assert df["value"].tolist() == [1.5, 2.0]
+    assert df["footnote_codes"].tolist()[1] == "P"
+
+
+@mock_aws
+def test_load_bls_from_s3_pads_rows_missing_trailing_fields(tsv_reader):
+    s3 = boto3.client("s3", region_name="us-east-1")
+    s3.create_bucket(Bucket="bls")
+    s3.put_object(
+        Bucket="bls",
+        Key="pr.data.0.Current",
+        Body=b"series_id\tyear\tperiod\tvalue\tfootnote_codes\nPRS30006011\t1995\tQ01\t1.0\nPRS30006011\t1995\tQ02\t2.0\tP\n",
+    )
+
+    df = load_bls_from_s3(bucket="bls", key="pr.data.0.Current")
+
+    assert df["value"].tolist() == [1.0, 2.0]
+    assert df["footnote_codes"].isna().tolist() == [True, False]
+
+
+def test_arrow_bls_reader_streams_the_body_in_blocks():
+    if reports.pa_csv is None:
+        pytest.skip("pyarrow not installed")
+    reads = []
+
+    class Body(io.BytesIO):
+        def read(self, size=-1):
+            reads.append(size)
+            return super().read(size)
+
+    data = b"series_id\tyear\tperiod\tvalue\tfootnote_codes\n" + b"PRS30006011\t2024\tQ01\t1.5\t\n" * 100_000
+    df = reports._read_bls_tsv_arrow(Body(data))
+
+    assert len(df) == 100_000
+    assert all(0 < size < len(data) for size in reads)
+
+
+def test_series_helpers_match_on_raw_and_indexed_frames():
+    bls_df = pd.DataFrame({
+        "series_id": ["PRS85006093 ", "PRS85006093", "LNS14000000", "LNS14000000", "LNS14000000"],
+        "year": [2020, 2021, 2021, 2021, 2021],
+        "period": ["Q05", "Q05 ", "M01", "M02", "M03"],
+        "value": ["101.5", "103.0", "6.0", "5.0", "4.0"],
+    })
+    indexed = _index_bls_by_series(bls_df)
+    assert _index_bls_by_series(indexed) is indexed
+
+    for frame in (bls_df, indexed):
+        pr = _pr_index_series(frame, series_id="PRS85006093", period="Q05")
+        assert pr.reset_index().to_dict("records") == [{"year": 2020, "value": 101.5}, {"year": 2021, "value": 103.0}]
+        ln = _annualize_bls_monthly_series(frame, series_id="LNS14000000")
+        assert ln.to_dict("records") == [{"year": 2021, "value": 5.0}]
+        assert _pr_index_series(frame, series_id="MISSING", period="Q05").empty
+        assert _annualize_bls_monthly_series(frame, series_id="MISSING").empty
+
+
+def test_reports_accept_categorical_labels():
+    bls_df = pd.DataFrame(
+        [
+            {"series_id": "  PRS30006032  ", "year": 2018, "period": "Q01", "value": 1.9},
+            {"series_id": "PRS30006032", "year": 2018, "period": "Q02", "value": 2.1},
+            {"series_id": "PRS30006099", "year": 2017, "period": "Q01", "value": 9.9},
+        ]
+    )
+    pop_df = pd.DataFrame([{"Year": 2018, "Nation": "United States", "Population": 322903030}])
+    categorical = bls_df.astype({"series_id": "category", "period": "category"})
+
+    assert report_best_year_by_series(categorical) == report_best_year_by_series(bls_df)
+    assert report_series_population_join(categorical, pop_df) == report_series_population_join(bls_df, pop_df)
+    assert report_best_year_by_series(categorical) == [
+        {"series_id": "PRS30006032", "year": 2018, "value": 4.0},
+        {"series_id": "PRS30006099", "year": 2017, "value": 9.9},
+    ]
+
+
+def test_annualize_maps_categorical_periods_to_months():
+    bls_df = pd.DataFrame({
+        "series_id": ["LNS14000000"] * 5,
+        "year": [2021] * 5,
+        "period": ["M01", "M02", "Mxx", None, "M12"],
+        "value": [1.0, 2.0, 100.0, 100.0, 3.0],
+    }).astype({"series_id": "category", "period": "category"})
+
+    out = _annualize_bls_monthly_series(bls_df, series_id="LNS14000000")
+
+    # Unparseable and missing periods are dropped, not mapped to a month.
+    assert out.to_dict("records") == [{"year": 2021, "value": 2.0}]
+
+
+@mock_aws
+def test_load_datausa_jsonrecords_projects_columns():
+    s3 = boto3.client("s3", region_name="us-east-1")
+    s3.create_bucket(Bucket="datausa")
+    s3.put_object(
+        Bucket="datausa",
+        Key="commute_time.json",
+        Body=(
+            b'{"data": [{"Year": 2019, "Nation ID": "01000US", "Slug Nation": "united-states",'
+            b' "Geography ID": 7, " Mean Commute ": 27.6}]}'
+        ),
+    )
+
+    full = load_datausa_jsonrecords_from_s3(bucket="datausa", key="commute_time.json")
+    projected = load_datausa_jsonrecords_from_s3(
+        bucket="datausa",
+        key="commute_time.json",
+        usecols=_is_datausa_measure_candidate,
+    )
+
+    assert list(full.columns) == ["Year", "Nation ID", "Slug Nation", "Geography ID", "Mean Commute"]
+    assert list(projected.columns) == ["Year", "Nation ID", "Mean Commute"]
+    assert projected.to_dict("records") == [{"Year": 2019, "Nation ID": "01000US", "Mean Commute": 27.6}]
+
+
+@mock_aws
+def test_load_population_from_s3_limits_rows_to_year_range():
+    s3 = boto3.client("s3", region_name="us-east-1")
+    s3.create_bucket(Bucket="datausa")
+    rows = [{"Year": str(y), "Nation": " United States ", "Population": 300 + y - 2010} for y in range(2010, 2021)]
+    s3.put_object(Bucket="datausa", Key="population.json", Body=json.dumps({"data": rows}).encode("utf-8"))
+
+    full = load_population_from_s3(bucket="datausa", key="population.json")
+    scoped = load_population_from_s3(bucket="datausa", key="population.json", year_range=(2013, 2018))
+
+    assert len(full) == 11
+    assert scoped["Year"].tolist() == [2013, 2014, 2015, 2016, 2017, 2018]
+    assert scoped["Nation"].unique().tolist() == ["United States"]
+    assert report_population_stats(scoped) == report_population_stats(full)
+
+
+def test_infer_numeric_measure_column_probes_then_scans():
+    df = pd.DataFrame({
+        "Nation": ["United States"] * 20,
+        "All Missing": [None] * 20,
+        "Late Number": ["n/a"] * 19 + ["27.6"],
+        "Minutes": [27.6] * 20,
+    })
+
+    # A value past the probe window still counts, as with a full coerce.
+    assert _infer_numeric_measure_column(df, exclude={"Nation"}) == "Late Number"
+    assert _infer_numeric_measure_column(df, exclude={"Late Number"}) == "Minutes"
+    assert _infer_numeric_measure_column(df[["Nation", "All Missing"]], exclude=set()) is None
+
+
+def test_national_rows_strips_labels_and_prefers_nation_id():
+    df = pd.DataFrame({
+        "Nation ID": [" 01000US ", "04000US06", None, "01000US"],
+        "Nation": ["United States", "United States", "United States", "United States"],
+        "Year": [2019, 2019, 2020, 2021],
+    })
+
+    assert _national_rows(df)["Year"].tolist() == [2019, 2021]
+    assert _national_rows(df.drop(columns=["Nation ID"]))["Year"].tolist() == [2019, 2019, 2020, 2021]
+    assert _national_rows(df[["Year"]]).equals(df[["Year"]])
+
+
+@mock_aws
+def test_build_pipeline_status_joins_each_series_sync_state():
+    s3 = boto3.client("s3", region_name="us-east-1")
+    s3.create_bucket(Bucket="fomc-bls-raw")
+    s3.create_bucket(Bucket="fomc-datausa-raw")
+    for series_id, files in {
+        "cu": {
+            "cu.data.0.Current": {"bytes": 10, "source_modified": "2026-02-10T13:30:00Z"},
+            "cu.data.1.AllItems": {"bytes": 5, "source_modified": "2026-01-15T13:30:00Z"},
+            "cu.footnote": {"bytes": 1, "source_modified": ""},
+            "cu.legacy": "not a dict",
+        },
+        "pr": {"pr.data.0.Current": {"bytes": 20, "source_modified": "2026-02-01T08:30:00Z"}},
+    }.items():
+        s3.put_object(
+            Bucket="fomc-bls-raw",
+            Key=f"_sync_state/{series_id}/latest_state.json",
+            Body=json.dumps({"files": files}).encode("utf-8"),
+        )
+
+    status = build_pipeline_status({
+        "bls": {
+            "pr": {"updated": ["pr.data.0.Current"]},
+            "cu": {"unchanged": ["cu.data.0.Current"], "deleted": ["cu.old"]},
+            "ce": {"added": ["ce.new"]},  # no sync state stored
+            "bad": "not a result",
+        },
+    })
+
+    assert [s["id"] for s in status["series"]] == ["ce", "cu", "pr"]
+    ce, cu, pr = status["series"]
+    assert ce["files"] == [{"name": "ce.new", "action": "added", "source_modified": None, "bytes": None}]
+    assert cu["files"][0] == {
+        "name": "cu.data.0.Current",
+        "action": "unchanged",
+        "source_modified": "2026-02-10T13:30:00Z",
+        "bytes": 10,
+    }
+    assert cu["files_deleted"] == 1
+    assert cu["latest_source_modified"] == "2026-02-10T13:30:00Z"
+    assert ce["latest_source_modified"] is None
+    assert pr["latest_source_modified"] == "2026-02-01T08:30:00Z"
+    assert status["summary"]["total_files_checked"] == 4
+
+
+@pytest.mark.parametrize("sync_results", [{}, None, "error", {"bls": {}, "datausa": {"datasets": {}}}])
+def test_build_pipeline_status_skips_aws_setup_when_nothing_synced(sync_results, monkeypatch):
+    monkeypatch.delenv("FOMC_BUCKET_PREFIX")
+    monkeypatch.setattr(reports, "get_client", lambda service: pytest.fail("unexpected S3 client"))
+
+    status = build_pipeline_status(sync_results, duration_seconds=1.26)
+
+    assert status["series"] == []
+    assert status["duration_seconds"] == 1.3
+    assert status["summary"]["total_files_checked"] == 0
+    assert status["datausa"]["action"] == "unknown"
+    assert status["datausa"]["record_count"] == 0
+
+
+@mock_aws
+def test_build_pipeline_status_ignores_sync_state_that_is_not_an_object():
+    s3 = boto3.client("s3", region_name="us-east-1")
+    s3.create_bucket(Bucket="fomc-bls-raw")
+    s3.create_bucket(Bucket="fomc-datausa-raw")
+    s3.put_object(Bucket="fomc-bls-raw", Key="_sync_state/pr/latest_state.json", Body=b'["not", "a", "state"]')
+    s3.put_object(Bucket="fomc-datausa-raw", Key="_sync_state/datausa/population/latest_state.jsonl", Body=b"42")
+
+    status = build_pipeline_status({
+        "bls": {"pr": {"unchanged": ["pr.data.0.Current"]}},
+        "datausa": {"datasets": {"population": {"action": "unchanged", "record_count": 11}}},
+    })
+
+    assert status["series"][0]["files"] == [
+        {"name": "pr.data.0.Current", "action": "unchanged", "source_modified": None, "bytes": None}
+    ]
+    assert status["datausa"]["action"] == "unchanged"
+    assert status["datausa"]["record_count"] == 11
+
+
+@mock_aws
+def test_build_pipeline_status_fills_empty_datausa_fields_from_sync_state():
+    s3 = boto3.client("s3", region_name="us-east-1")
+    s3.create_bucket(Bucket="fomc-datausa-raw")
+    s3.put_object(
+        Bucket="fomc-datausa-raw",
+        Key="_sync_state/datausa/population/latest_state.jsonl",
+        Body=json.dumps({
+            "api_url": "https://example.test/data.jsonrecords",
+            "content_hash": "stored",
+            "record_count": 9,
+            "year_range": [2013, 2021],
+        }).encode("utf-8"),
+    )
+
+    status = build_pipeline_status({
+        "datausa": {"datasets": {"population": {"action": "updated", "content_hash": "", "record_count": 11}}},
+    })
+
+    assert status["datausa"] == {
+        "endpoint": "https://example.test/data.jsonrecords",
+        "action": "updated",
+        "content_hash": "stored",
+        "record_count": 11,
+        "years": "2013–2021",
+    }
+
+
+@mock_aws
+def test_build_pipeline_status_summarizes_first_dataset_without_population():
+    s3 = boto3.client("s3", region_name="us-east-1")
+    s3.create_bucket(Bucket="fomc-datausa-raw")
+    s3.put_object(
+        Bucket="fomc-datausa-raw",
+        Key="_sync_state/datausa/commute_time/latest_state.jsonl",
+        Body=json.dumps({"record_count": 5}).encode("utf-8"),
+    )
+
+    status = build_pipeline_status({
+        "datausa": {"datasets": {"broken": "error", "commute_time": {"action": "unchanged"}, "citizenship": {}}},
+    })
+
+    assert status["datausa"]["action"] == "unchanged"
+    assert status["datausa"]["record_count"] == 5
+
+
+def test_json_records_maps_missing_values_to_none_per_column():
+    df = pd.DataFrame({
+        "series_id": pd.Series(["A", None], dtype="category"),
+        "year": pd.array([2019, 2020], dtype="Int64"),
+        "value": [1.26, float("nan")],
+        "Population": pd.array([None, 5], dtype="Int64"),
+    })
+
+    records = _json_records(df, ["series_id", "year", "value", "Population"], round1=("value",))
+
+    assert records == [
+        {"series_id": "A", "year": 2019, "value": 1.3, "Population": None},
+        {"series_id": None, "year": 2020, "value": None, "Population": 5},
+    ]
+    assert all(type(r["year"]) is int for r in records)
+
+
+def test_export_site_payload_replaces_file_without_leaving_temp(tmp_path):
+    out = tmp_path / "site" / "chart.json"
+
+    export_site_payload({"points": [1]}, out)
+    path = export_site_payload({"title": "Café", "points": []}, out)
+
+    assert path == out.resolve()
+    assert out.read_text(encoding="utf-8") == '{\n  "title": "Café",\n  "points": []\n}\n'
+    assert [p.name for p in out.parent.iterdir()] == ["chart.json"]
+
+
+@mock_aws
+def test_run_all_reports_reuses_a_preloaded_bls_frame(sample_population_data, sample_bls_csv):
+    s3 = boto3.client("s3", region_name="us-east-1")
+    s3.create_bucket(Bucket="bls")
+    s3.create_bucket(Bucket="datausa")
+    s3.put_object(Bucket="bls", Key="pr/pr.data.0.Current", Body=sample_bls_csv.encode("utf-8"))
+    s3.put_object(Bucket="datausa", Key="population.json", Body=json.dumps(sample_population_data).encode("utf-8"))
+
+    loaded = run_all_reports("bls", "pr/pr.data.0.Current", "datausa", "population.json")
+    bls_df = load_bls_from_s3(bucket="bls", key="pr/pr.data.0.Current")
+    s3.delete_object(Bucket="bls", Key="pr/pr.data.0.Current")
+
+    assert run_all_reports(pop_bucket="datausa", pop_key="population.json", bls_df=bls_df) == loaded
@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+import json
 from pathlib import Path
 
 import boto3
 from moto import mock_aws
 
-from src.analytics.reports import build_participation_vs_noncitizen_share, build_unemployment_vs_commute_time
+from src.analytics.reports import (
+    build_participation_vs_noncitizen_share,
+    build_unemployment_vs_commute_time,
+    load_bls_from_s3,
+)
 
 
 FIXTURES = Path(__file__).resolve().parents[2] / "fixtures"
@@ -71,3 +76,43 @@ def test_build_participation_vs_noncitizen_share_from_raw_s3_fixtures():
 
     # 2019: 22.5M / (304.5M + 22.5M) ≈ 6.88%
     assert abs(float(first["noncitizen_share"]) - 6.88) < 0.2
+
+
+@mock_aws
+def test_curated_builders_reuse_a_preloaded_ln_frame():
+    s3 = boto3.client("s3", region_name="us-east-1")
+    s3.create_bucket(Bucket="bls")
+    s3.create_bucket(Bucket="datausa")
+
+    s3.put_object(Bucket="bls", Key="ln/ln.data.0.Current", Body=(FIXTURES / "sample_ln.tsv").read_bytes())
+    ln_df = load_bls_from_s3(bucket="bls", key="ln/ln.data.0.Current")
+    s3.delete_object(Bucket="bls", Key="ln/ln.data.0.Current")
+
+    for key, fixture in [("commute_time.json", "sample_commute_time.json"), ("citizenship.json", "sample_citizenship.json")]:
+        s3.put_object(Bucket="datausa", Key=key, Body=(FIXTURES / fixture).read_bytes())
+
+    unemployment = build_unemployment_vs_commute_time(bls_bucket="bls", datausa_bucket="datausa", ln_df=ln_df)
+    participation = build_participation_vs_noncitizen_share(bls_bucket="bls", datausa_bucket="datausa", ln_df=ln_df)
+
+    assert len(unemployment["points"]) == 5
+    assert len(participation["points"]) == 5
+
+
+@mock_aws
+def test_participation_share_counts_each_noncitizen_label_once():
+    s3 = boto3.client("s3", region_name="us-east-1")
+    s3.create_bucket(Bucket="bls")
+    s3.create_bucket(Bucket="datausa")
+    s3.put_object(Bucket="bls", Key="ln/ln.data.0.Current", Body=(FIXTURES / "sample_ln.tsv").read_bytes())
+
+    def row(status, population):
+        return {"Year": 2019, "Nation": "United States", "Citizenship Status": status, "Population": population}
+
+    rows = [row("U.S. citizen", 70), row("Not a U.S. citizen", 20), row("Non-citizen", 5), row(None, 5)]
+    s3.put_object(Bucket="datausa", Key="citizenship.json", Body=json.dumps({"data": rows}).encode("utf-8"))
+
+    payload = build_participation_vs_noncitizen_share(bls_bucket="bls", datausa_bucket="datausa")
+
+    # Missing statuses count toward the total but not the non-citizen share.
+    assert payload["points"][0]["year"] == 2019
+    assert payload["points"][0]["noncitizen_share"] == 25.0
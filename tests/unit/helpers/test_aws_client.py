@@ -122,6 +122,28 @@ class TestGetClient:
         assert isinstance(kwargs["config"], Config)
         assert kwargs["config"].s3.get("addressing_style") == "virtual"
 
+    @patch("src.helpers.aws_client.boto3.client")
+    def test_get_client_reuses_cached_client_per_environment(self, mock_client):
+        mock_client.side_effect = lambda *args, **kwargs: object()
+        with patch.dict(os.environ, {"AWS_DEFAULT_REGION": "us-east-1"}, clear=True):
+            first = get_client("s3")
+            second = get_client("s3")
+        with patch.dict(os.environ, {"AWS_DEFAULT_REGION": "us-west-2"}, clear=True):
+            other_region = get_client("s3")
+
+        assert first is second
+        assert other_region is not first
+        assert mock_client.call_count == 2
+
+    @patch("src.helpers.aws_client.boto3.client")
+    def test_get_client_configures_pool_and_adaptive_retries(self, mock_client):
+        with patch.dict(os.environ, {"AWS_DEFAULT_REGION": "us-east-1"}, clear=True):
+            get_client("cloudwatch")
+
+        config = mock_client.call_args.kwargs["config"]
+        assert config.max_pool_connections == 32
+        assert config.retries == {"mode": "adaptive", "max_attempts": 5}
+
 
 class TestGetResource:
     @patch("src.helpers.aws_client.boto3.resource")
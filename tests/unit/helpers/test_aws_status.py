@@ -1,10 +1,12 @@
 """Tests for aws_status.py."""
 
 import json
+from datetime import datetime, timedelta, timezone
 
 import boto3
 from moto import mock_aws
 
+from src.helpers import aws_status
 from src.helpers.aws_status import (
     check_s3_status,
     check_sqs_status,
@@ -33,6 +35,32 @@ def test_check_s3_status_with_buckets():
     assert result["test-bucket"]["object_count"] == 2
 
 
+@mock_aws
+def test_check_s3_status_prefers_cloudwatch_object_count(monkeypatch):
+    """Uses the S3 NumberOfObjects storage metric when it has been published."""
+    s3 = boto3.client("s3", region_name="us-east-1")
+    s3.create_bucket(Bucket="test-bucket")
+    s3.put_object(Bucket="test-bucket", Key="file1.txt", Body=b"hello")
+
+    class StubCloudWatch:
+        def get_metric_statistics(self, **kwargs):
+            now = datetime.now(timezone.utc)
+            return {"Datapoints": [
+                {"Timestamp": now - timedelta(days=2), "Average": 40.0},
+                {"Timestamp": now - timedelta(days=1), "Average": 42.0},
+            ]}
+
+    real_get_client = aws_status.get_client
+    monkeypatch.setattr(
+        aws_status,
+        "get_client",
+        lambda service: StubCloudWatch() if service == "cloudwatch" else real_get_client(service),
+    )
+
+    result = check_s3_status()
+    assert result["test-bucket"]["object_count"] == 42
+
+
 @mock_aws
 def test_check_sqs_status_with_queues():
     """Lists queues and message counts."""
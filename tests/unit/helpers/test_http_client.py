@@ -0,0 +1,115 @@
+"""Tests for http_client.py."""
+
+import io
+import urllib.error
+from unittest.mock import patch
+
+import boto3
+import pytest
+import urllib3
+from moto import mock_aws
+
+from src.helpers import http_client
+
+
+class StubResponse:
+    def __init__(self, status: int, data: bytes = b"", headers: dict | None = None):
+        self.status = status
+        self.data = data
+        self.reason = "Stub"
+        self.headers = urllib3.HTTPHeaderDict(headers or {})
+
+
+class StubPool:
+    def __init__(self, responses: list):
+        self._responses = list(responses)
+        self.calls: list[tuple[str, str]] = []
+
+    def request(self, method, url, **_kwargs):
+        self.calls.append((method, url))
+        item = self._responses.pop(0)
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+
+def _use_pool(pool: StubPool):
+    return patch.object(http_client, "_pool_manager", return_value=pool)
+
+
+def test_fetch_json_reuses_pool_and_parses_body():
+    pool = StubPool([StubResponse(200, b'{"ok": true}')])
+    with _use_pool(pool):
+        assert http_client.fetch_json("https://example.test/a") == {"ok": True}
+    assert pool.calls == [("GET", "https://example.test/a")]
+
+
+def test_fetch_bytes_raises_http_error_without_retrying_client_errors():
+    pool = StubPool([StubResponse(404), StubResponse(200, b"never")])
+    with _use_pool(pool), pytest.raises(urllib.error.HTTPError) as exc_info:
+        http_client.fetch_bytes("https://example.test/missing", retries=3, backoff_seconds=0)
+    assert exc_info.value.code == 404
+    assert len(pool.calls) == 1
+
+
+def test_fetch_bytes_retries_server_errors_and_maps_connection_errors():
+    pool = StubPool([
+        StubResponse(503, headers={"Retry-After": "0"}),
+        urllib3.exceptions.NewConnectionError(None, "refused"),
+        StubResponse(200, b"payload"),
+    ])
+    with _use_pool(pool), patch.object(http_client, "_sleep_seconds"):
+        assert http_client.fetch_bytes("https://example.test/flaky", retries=3) == b"payload"
+    assert len(pool.calls) == 3
+
+
+class StubStreamResponse(StubResponse):
+    def __init__(self, data: bytes):
+        super().__init__(200)
+        self._buf = io.BytesIO(data)
+        self.released = False
+
+    def read(self, amt=None):
+        return self._buf.read(amt)
+
+    def release_conn(self):
+        self.released = True
+
+
+@mock_aws
+def test_stream_to_s3_uploads_body_without_buffering():
+    s3 = boto3.client("s3", region_name="us-east-1")
+    s3.create_bucket(Bucket="raw")
+    payload = b"series_id\tyear\n" * 1000
+    resp = StubStreamResponse(payload)
+    with _use_pool(StubPool([resp])):
+        size = http_client.stream_to_s3(
+            "https://example.test/big",
+            s3,
+            "raw",
+            "big.txt",
+            extra_args={"Metadata": {"origin": "bls"}},
+        )
+    assert size == len(payload)
+    assert resp.released
+    obj = s3.get_object(Bucket="raw", Key="big.txt")
+    assert obj["Body"].read() == payload
+    assert obj["Metadata"] == {"origin": "bls"}
+
+
+def test_fetch_bytes_conditional_sends_validators_and_handles_not_modified():
+    class RecordingPool(StubPool):
+        def request(self, method, url, **kwargs):
+            self.headers = kwargs.get("headers")
+            return super().request(method, url, **kwargs)
+
+    pool = RecordingPool([StubResponse(304, headers={"ETag": '"v2"'})])
+    with _use_pool(pool):
+        body, etag, last_modified = http_client.fetch_bytes_conditional(
+            "https://example.test/page",
+            etag='"v1"',
+            last_modified="Tue, 10 Feb 2026 13:30:00 GMT",
+        )
+    assert (body, etag, last_modified) == (None, '"v2"', "Tue, 10 Feb 2026 13:30:00 GMT")
+    assert pool.headers["If-None-Match"] == '"v1"'
+    assert pool.headers["If-Modified-Since"] == "Tue, 10 Feb 2026 13:30:00 GMT"
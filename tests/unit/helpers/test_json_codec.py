@@ -0,0 +1,75 @@
+"""Tests for json_codec.py."""
+
+import io
+from datetime import datetime
+
+import pytest
+
+from src.helpers import json_codec
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def codec(request, monkeypatch):
+    if request.param == "stdlib":
+        monkeypatch.setattr(json_codec, "orjson", None)
+    elif json_codec.orjson is None:
+        pytest.skip("orjson not installed")
+    return json_codec
+
+
+def test_round_trip_bytes_and_str(codec):
+    payload = {"name": "José", "values": [1, 2.5, None], "ok": True}
+    encoded = codec.dumps(payload)
+    assert isinstance(encoded, bytes)
+    assert codec.loads(encoded) == payload
+    assert codec.loads(encoded.decode("utf-8")) == payload
+
+
+def test_dumps_matches_stdlib_default_str_for_datetimes(codec):
+    encoded = codec.dumps({"at": datetime(2026, 2, 4, 12, 0)}, indent=True)
+    assert encoded == b'{\n  "at": "2026-02-04 12:00:00"\n}'
+
+
+def test_loads_raises_json_decode_error(codec):
+    with pytest.raises(json_codec.JSONDecodeError):
+        codec.loads(b"not json")
+
+
+def test_loads_rejects_invalid_utf8_as_decode_error(codec):
+    with pytest.raises(json_codec.JSONDecodeError):
+        codec.loads(b'{"a": "\xff"}')
+
+
+def test_dumps_stringifies_non_str_keys_like_stdlib(codec):
+    assert codec.dumps({2020: 1, 1.5: 2, True: 3, None: 4}) == b'{"2020":1,"1.5":2,"true":3,"null":4}'
+
+
+@pytest.mark.parametrize("indent", [False, True])
+def test_dump_writes_the_same_bytes_as_dumps(codec, indent):
+    payload = {"name": "José", "at": datetime(2026, 2, 4, 12, 0), "rows": [{"year": 2020, "value": None}]}
+    fp = io.BytesIO()
+
+    codec.dump(payload, fp, indent=indent)
+
+    assert not fp.closed
+    assert fp.getvalue() == codec.dumps(payload, indent=indent)
+
+
+def test_dumps_matches_orjson_for_nan_and_numpy_values(codec):
+    np = pytest.importorskip("numpy")
+    payload = {
+        "n": float("nan"),
+        "inf": float("-inf"),
+        "i": np.int64(3),
+        "f": np.float32(1.5),
+        "b": np.bool_(True),
+        "nan64": np.float64("nan"),
+        "arr": np.array([1.0, np.nan]),
+        "rows": [(np.int32(1), 2.5)],
+    }
+
+    expected = b'{"n":null,"inf":null,"i":3,"f":1.5,"b":true,"nan64":null,"arr":[1.0,null],"rows":[[1,2.5]]}'
+    assert codec.dumps(payload) == expected
+    fp = io.BytesIO()
+    codec.dump(payload, fp)
+    assert fp.getvalue() == expected
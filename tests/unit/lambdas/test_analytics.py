@@ -91,7 +91,8 @@ class TestHandler:
             result = handler(event, None)
 
         body = json.loads(result["body"])
-        assert len(body["results"]) == 2
+        # Both records share one report run, so it appears once.
+        assert len(body["results"]) == 1
 
     @mock_aws
     def test_handler_direct_invocation(self, sample_population_data, sample_bls_csv):
@@ -125,6 +126,66 @@ class TestHandler:
         # Should still return (with errors)
         assert result["statusCode"] == 207
 
+    @mock_aws
+    def test_handler_reports_partial_batch_failures(self, sample_population_data, sample_bls_csv):
+        """Only the malformed record is handed back to SQS for redelivery."""
+        _setup_s3_data(sample_population_data, sample_bls_csv)
+
+        event = {
+            "Records": [
+                {"messageId": "ok-1", "body": json.dumps({"Records": []})},
+                {"messageId": "bad-1", "body": "not json"},
+                {"messageId": "ok-2", "body": json.dumps({"Records": []})},
+            ]
+        }
+
+        with (
+            patch.dict(os.environ, {
+                "BLS_BUCKET": "fomc-bls-raw",
+                "DATAUSA_BUCKET": "fomc-datausa-raw",
+            }),
+            patch(
+                "src.lambdas.analytics_processor.handler.run_reports",
+                wraps=run_reports,
+            ) as run,
+        ):
+            result = handler(event, None)
+
+        assert result["batchItemFailures"] == [{"itemIdentifier": "bad-1"}]
+        assert len(json.loads(result["body"])["results"]) == 1
+        run.assert_called_once()
+
+    def test_handler_fails_every_message_when_reports_fail(self):
+        """A failed report run is attempted once and hands back the whole batch."""
+        event = {
+            "Records": [
+                {"messageId": "m-1", "body": json.dumps({"Records": []})},
+                {"messageId": "bad-1", "body": "not json"},
+                {"body": json.dumps({"Records": []})},
+                {"messageId": "m-2", "body": json.dumps({"Records": []})},
+            ]
+        }
+
+        with patch(
+            "src.lambdas.analytics_processor.handler.run_reports",
+            side_effect=RuntimeError("S3 unavailable"),
+        ) as run:
+            result = handler(event, None)
+
+        run.assert_called_once()
+        assert result["statusCode"] == 207
+        # The record without a messageId gets an empty identifier, so Lambda
+        # treats the whole batch as failed instead of dropping it.
+        assert result["batchItemFailures"] == [
+            {"itemIdentifier": "bad-1"},
+            {"itemIdentifier": "m-1"},
+            {"itemIdentifier": ""},
+            {"itemIdentifier": "m-2"},
+        ]
+        body = json.loads(result["body"])
+        assert body["results"] == []
+        assert body["errors"][-1] == "S3 unavailable"
+
     @mock_aws
     def test_handler_s3_read_error(self):
         """Handles missing S3 objects gracefully."""
@@ -147,6 +208,15 @@ class TestHandler:
 
         assert result["statusCode"] == 207
 
+    def test_handler_warmer_event_is_noop(self):
+        """Scheduled warmer pings return without reading S3."""
+        with patch("src.lambdas.analytics_processor.handler.run_reports") as run:
+            result = handler({"warmer": True}, None)
+
+        assert result["statusCode"] == 200
+        assert json.loads(result["body"]) == {"warmer": True}
+        run.assert_not_called()
+
 
 class TestReportPopulationStats:
     def test_report_1_population_stats(self, sample_population_data):
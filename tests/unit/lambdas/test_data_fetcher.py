@@ -141,3 +141,36 @@ class TestLambdaHandler:
         assert "bls" in body
         assert "datausa" in body
         assert "errors" in body
+
+    def test_lambda_handler_warmer_event_is_noop(self):
+        """Scheduled warmer pings return without syncing anything."""
+        with (
+            patch("src.lambdas.data_fetcher.handler.sync_bls") as sync_bls,
+            patch("src.lambdas.data_fetcher.handler.sync_datausa") as sync_datausa,
+        ):
+            from src.lambdas.data_fetcher.handler import handler
+            result = handler({"warmer": True}, None)
+
+        assert result["statusCode"] == 200
+        assert json.loads(result["body"]) == {"warmer": True}
+        sync_bls.assert_not_called()
+        sync_datausa.assert_not_called()
+
+
+def test_apply_baked_config_fills_only_unset_env(monkeypatch):
+    """Settings baked into the asset at synth time back-fill missing env vars."""
+    import sys
+    import types
+
+    from src.config import apply_baked_config, get_bls_series_list
+
+    baked = types.ModuleType("src.lambdas._baked_config")
+    baked.BAKED_ENV = {"BLS_SERIES": "cu,ce", "DATAUSA_BASE_URL": "https://baked.example"}
+    monkeypatch.setitem(sys.modules, "src.lambdas._baked_config", baked)
+    monkeypatch.delenv("BLS_SERIES")
+    monkeypatch.setenv("DATAUSA_BASE_URL", "https://explicit.example")
+
+    apply_baked_config()
+
+    assert get_bls_series_list() == ["cu", "ce"]
+    assert os.environ["DATAUSA_BASE_URL"] == "https://explicit.example"
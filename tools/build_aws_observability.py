@@ -11,11 +11,17 @@ Usage:
   source .env.local        # optional AWS local override
   # or: source .env.localstack
   python tools/build_aws_observability.py --days 30 --forecast-days 30 --out site/data/aws_observability.json
+
+An existing output file is reused section by section while fresh (metrics for
+--metrics-ttl-hours, Cost Explorer for --cost-ttl-hours); pass --force to
+refetch everything. The daily S3 storage series are cached separately in
+`s3_storage.json` beside the output and refetched once per UTC day.
 """
 
 from __future__ import annotations
 
 import argparse
+from datetime import timedelta
 from pathlib import Path
 
 from src.analytics.aws_observability import export_aws_observability
@@ -26,12 +32,18 @@ def main() -> None:
     parser.add_argument("--days", type=int, default=30, help="Trailing window (days)")
     parser.add_argument("--forecast-days", type=int, default=30, help="Cost forecast horizon (days)")
     parser.add_argument("--out", default="site/data/aws_observability.json", help="Output JSON path")
+    parser.add_argument("--metrics-ttl-hours", type=float, default=1.0, help="Reuse CloudWatch data this fresh")
+    parser.add_argument("--cost-ttl-hours", type=float, default=6.0, help="Reuse Cost Explorer data this fresh")
+    parser.add_argument("--force", action="store_true", help="Ignore the existing output and refetch everything")
     args = parser.parse_args()
 
     path = export_aws_observability(
         out_path=Path(args.out),
         window_days=int(args.days),
         forecast_days=max(0, int(args.forecast_days)),
+        metrics_ttl=timedelta(hours=args.metrics_ttl_hours),
+        cost_ttl=timedelta(hours=args.cost_ttl_hours),
+        force=args.force,
     )
     print(str(path))
 